@@ -27,12 +27,9 @@ from src.commands.handlers.keyboard_commands import (
     UndoCommand,
 )
 from src.commands.handlers.mouse_commands import (
-    ClickCommand,
+    ClickFamilyCommand,
     ClickNumberCommand,
-    DoubleClickCommand,
-    MiddleClickCommand,
     MouseMoveCommand,
-    RightClickCommand,
     ScrollCommand,
 )
 from src.core.config import Config
@@ -98,10 +95,7 @@ def main():
     # 7. Register mouse commands
     print("\n🖱️  Registering mouse commands...")
     mouse_commands = [
-        ClickCommand(),
-        RightClickCommand(),
-        DoubleClickCommand(),
-        MiddleClickCommand(),
+        ClickFamilyCommand(),
         ScrollCommand(),
         MouseMoveCommand(),
         ClickNumberCommand(parser),
@@ -1,6 +1,7 @@
 """Voice Activity Detection for the dictation tool."""
 
 import time
+from typing import Optional
 
 import numpy as np
 
@@ -30,7 +31,7 @@ class VoiceActivityDetector:
         self.sample_rate = sample_rate
         self.chunk_size = chunk_size
         self.energy_threshold = energy_threshold
-        self.last_speech_time = time.time()
+        self.last_speech_time = time.monotonic()
         self.speech_detected = False
 
     def is_speech(self, audio_data: bytes) -> bool:
@@ -64,11 +65,47 @@ class VoiceActivityDetector:
         is_speech_detected = bool(normalized_rms > self.energy_threshold)
 
         if is_speech_detected:
-            self.last_speech_time = time.time()
+            self.last_speech_time = time.monotonic()
             self.speech_detected = True
 
         return is_speech_detected
 
+    def contains_speech(
+        self, audio_data: bytes, energy_threshold: Optional[float] = None
+    ) -> bool:
+        """
+        Check whether any chunk of a recording exceeds the energy threshold.
+
+        Applies the same per-chunk RMS test as is_speech() to a whole
+        recording in one vectorized pass, without touching detector state.
+
+        Args:
+            audio_data: Raw audio bytes (16-bit PCM)
+            energy_threshold: Threshold to use instead of the detector's own
+                (0.0-1.0)
+
+        Returns:
+            True if at least one chunk is above the threshold
+        """
+        if not audio_data:
+            return False
+
+        audio_array = np.frombuffer(audio_data, dtype=np.int16)
+
+        if len(audio_array) == 0:
+            return False
+
+        # Per-chunk mean square; the last chunk may be shorter than chunk_size
+        starts = np.arange(0, len(audio_array), self.chunk_size)
+        sums = np.add.reduceat(audio_array.astype(np.float64) ** 2, starts)
+        counts = np.diff(np.append(starts, len(audio_array)))
+
+        # Compare squared energies to skip the per-chunk sqrt
+        if energy_threshold is None:
+            energy_threshold = self.energy_threshold
+        threshold = (energy_threshold * AUDIO_MAX_AMPLITUDE) ** 2
+        return bool(np.any(sums / counts > threshold))
+
     def get_silence_duration(self) -> float:
         """
         Get duration of silence in seconds since last speech.
@@ -76,9 +113,9 @@ class VoiceActivityDetector:
         Returns:
             Silence duration in seconds
         """
-        return time.time() - self.last_speech_time
+        return time.monotonic() - self.last_speech_time
 
     def reset(self) -> None:
         """Reset the detector state."""
-        self.last_speech_time = time.time()
+        self.last_speech_time = time.monotonic()
         self.speech_detected = False
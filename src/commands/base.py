@@ -3,7 +3,8 @@
 import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Optional
 
 from pynput import keyboard, mouse
 
@@ -18,6 +19,11 @@ PRIORITY_NORMAL = 100     # Basic single-word commands
 PRIORITY_LOW = 50         # Fallback/general commands
 PRIORITY_DEFAULT = 0      # Default/catch-all commands
 
+# Punctuation removed by Command.strip_punctuation, as a str.translate table.
+# Hyphens and apostrophes are kept as they may be part of commands.
+PUNCTUATION_TO_REMOVE = '.!?,;:"(){}[]<>/@#$%^&*+=~`|\\'
+_PUNCTUATION_TABLE = str.maketrans("", "", PUNCTUATION_TO_REMOVE)
+
 
 @dataclass
 class CommandContext:
@@ -181,6 +187,85 @@ class Command(ABC):
         """
         return True
 
+    @property
+    def first_words(self) -> Optional[FrozenSet[str]]:
+        """
+        First words of the (punctuation-stripped) text this command can match.
+
+        CommandRegistry uses this to index commands by the first word of the
+        input, so only commands that could possibly match are asked. Override
+        this in commands whose matches() only accepts a known set of leading
+        words (exact phrases or "word ..." prefixes).
+
+        Returns:
+            Frozenset of possible first words, or None if the command may
+            match text starting with any word (default)
+        """
+        return None
+
+    @property
+    def first_word_prefixes(self) -> Optional[FrozenSet[str]]:
+        """
+        Prefixes the first word of the (punctuation-stripped) text must start with.
+
+        Like first_words, but for commands whose matches() checks
+        text.startswith("word") and so also accepts longer first words
+        ("scroll" also matches "scrolling up"). A command declaring both is a
+        candidate when either applies.
+
+        Returns:
+            Frozenset of first-word prefixes, or None if not used (default)
+        """
+        return None
+
+    @property
+    def trigger_phrases(self) -> Optional[FrozenSet[str]]:
+        """
+        Phrases at least one of which the (punctuation-stripped) text must contain.
+
+        For commands that look for a phrase anywhere in the text ("close
+        window", "page up"). CommandRegistry scans each utterance for all
+        declared phrases at once and skips these commands when none occur,
+        which is the common case for dictated text. Only declare phrases that
+        are necessary for matches() to return True.
+
+        Returns:
+            Frozenset of phrases, or None if not used (default)
+        """
+        return None
+
+    @property
+    def exact_phrases(self) -> Optional[FrozenSet[str]]:
+        """
+        Complete (punctuation-stripped) texts this command can match.
+
+        For commands whose matches() is an equality or set-membership test
+        ("grid", "hide"). CommandRegistry looks the whole utterance up in a
+        dict of all declared phrases and only asks these commands when it is
+        one of theirs. Only declare this if matches() never accepts any other
+        text.
+
+        Returns:
+            Frozenset of phrases, or None if not used (default)
+        """
+        return None
+
+    def display_name(self, text: str) -> Optional[str]:
+        """
+        Name to show the user for executing this command on text.
+
+        Override this when one command handles several user-visible actions
+        (e.g. left and right click). CommandRegistry passes it along in the
+        COMMAND_EXECUTED event.
+
+        Args:
+            text: The matched text
+
+        Returns:
+            Display name, or None to derive it from the class name (default)
+        """
+        return None
+
     def validate(self, context: CommandContext, text: str) -> bool:
         """
         Validate that command can be executed with given context.
@@ -198,12 +283,20 @@ class Command(ABC):
         return True
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def strip_punctuation(text: str) -> str:
         """
         Strip punctuation and symbols from text for command matching.
 
         Removes common punctuation marks that may appear due to speech
-        recognition errors or natural speech patterns.
+        recognition errors or natural speech patterns. This is the single
+        normalization for command matching: apply it to trigger phrases when
+        a command is built and to input text when matching, so both sides
+        compare equal without further lowercasing or stripping.
+
+        Results are memoized: during one dispatch every candidate's matches()
+        and the winner's execute() normalize the same utterance, so only the
+        first call does the work.
 
         Args:
             text: Text to clean
@@ -217,12 +310,26 @@ class Command(ABC):
             >>> Command.strip_punctuation("click?")
             "click"
         """
-        # Remove common punctuation marks
-        # Keep hyphens and apostrophes as they may be part of commands
-        punctuation_to_remove = '.!?,;:"""''(){}[]<>/@#$%^&*+=~`|\\'
-        for char in punctuation_to_remove:
-            text = text.replace(char, '')
-        return text.lower().strip()
+        # Single C-level pass over the text instead of one replace() per mark
+        return text.translate(_PUNCTUATION_TABLE).lower().strip()
+
+    @staticmethod
+    def first_word(text: str) -> str:
+        """
+        Get the first whitespace-separated word of text.
+
+        Args:
+            text: Text to split (normally already passed through strip_punctuation)
+
+        Returns:
+            First word, or an empty string if text has no words
+
+        Example:
+            >>> Command.first_word("delete word")
+            "delete"
+        """
+        words = text.split(maxsplit=1)
+        return words[0] if words else ""
 
 
 class CommandExecutionError(Exception):
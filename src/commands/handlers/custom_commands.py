@@ -1,10 +1,12 @@
 """Custom user-defined commands from config.yaml."""
 
+import ctypes
 import logging
 import os
 import subprocess
 import time
-from typing import Any, Optional
+from contextlib import ExitStack
+from typing import Any, FrozenSet, Optional
 
 try:
     import pyperclip
@@ -13,6 +15,69 @@ except ImportError:
 
 from src.commands.base import Command, CommandContext, PRIORITY_HIGH
 
+# Win32 clipboard constants
+CF_UNICODETEXT = 13
+GMEM_MOVEABLE = 0x0002
+
+# Module-owned kernel32/user32 handles (Windows only). Their prototypes are
+# declared once here; ctypes.windll's shared function objects are left alone
+_WinDLL = getattr(ctypes, "WinDLL", None)
+if _WinDLL is not None:
+    _kernel32 = _WinDLL("kernel32", use_last_error=True)
+    _kernel32.GlobalAlloc.argtypes = [ctypes.c_uint, ctypes.c_size_t]
+    _kernel32.GlobalAlloc.restype = ctypes.c_void_p
+    _kernel32.GlobalLock.argtypes = [ctypes.c_void_p]
+    _kernel32.GlobalLock.restype = ctypes.c_void_p
+    _kernel32.GlobalUnlock.argtypes = [ctypes.c_void_p]
+    _kernel32.GlobalFree.argtypes = [ctypes.c_void_p]
+    _kernel32.GlobalFree.restype = ctypes.c_void_p
+
+    _user32 = _WinDLL("user32", use_last_error=True)
+    _user32.OpenClipboard.argtypes = [ctypes.c_void_p]
+    _user32.SetClipboardData.argtypes = [ctypes.c_uint, ctypes.c_void_p]
+    _user32.SetClipboardData.restype = ctypes.c_void_p
+else:
+    _kernel32 = _user32 = None
+
+
+def _set_windows_clipboard(text: str) -> bool:
+    """
+    Put text on the Windows clipboard via the Win32 API.
+
+    Args:
+        text: Text to copy
+
+    Returns:
+        True if the clipboard was set, False if the Win32 API is unavailable
+        or the clipboard could not be opened
+    """
+    if _user32 is None:
+        return False
+
+    data = ctypes.create_unicode_buffer(text)
+    size = ctypes.sizeof(data)
+
+    if not _user32.OpenClipboard(None):
+        return False
+    try:
+        _user32.EmptyClipboard()
+        handle = _kernel32.GlobalAlloc(GMEM_MOVEABLE, size)
+        if not handle:
+            return False
+        locked = _kernel32.GlobalLock(handle)
+        if not locked:
+            _kernel32.GlobalFree(handle)
+            return False
+        ctypes.memmove(locked, data, size)
+        _kernel32.GlobalUnlock(handle)
+        # On success the clipboard owns the memory; only free it on failure
+        if not _user32.SetClipboardData(CF_UNICODETEXT, handle):
+            _kernel32.GlobalFree(handle)
+            return False
+        return True
+    finally:
+        _user32.CloseClipboard()
+
 
 class CustomCommand(Command):
     """
@@ -32,13 +97,31 @@ class CustomCommand(Command):
         Args:
             trigger: Trigger phrase (e.g., "admin user")
             action_type: Type of action (type_text, execute_file, key_combination)
-            action_data: Action parameters (text, path, keys, etc.)
+            action_data: Action parameters (text, path, keys, etc.).
+                For execute_file, set ``lazy_path: true`` to re-expand the
+                path and re-check its existence on every execution.
         """
         self.logger = logging.getLogger(f"CustomCommand:{trigger}")
-        self.trigger = trigger.lower().strip()
+        self.trigger = self.strip_punctuation(trigger)
         self.action_type = action_type
         self.action_data = action_data
 
+        # Resolve execute_file paths once; install paths don't change at runtime
+        self._resolved_path: Optional[str] = None
+        self._path_exists = False
+        if action_type == "execute_file" and not action_data.get("lazy_path", False):
+            self._resolved_path, self._path_exists = self._resolve_path()
+
+    def _resolve_path(self) -> tuple[str, bool]:
+        """
+        Expand environment variables in the execute_file path and check it exists.
+
+        Returns:
+            Tuple of (expanded_path, exists)
+        """
+        path = os.path.expandvars(self.action_data.get("path", ""))
+        return path, bool(path) and os.path.exists(path)
+
     def matches(self, text: str) -> bool:
         """Check if text matches this custom command."""
         text_clean = self.strip_punctuation(text)
@@ -81,22 +164,28 @@ class CustomCommand(Command):
             self.logger.warning("No text specified for copy_to_clipboard action")
             return None
 
-        # Copy to clipboard using PowerShell (cross-platform alternative)
+        # Fastest available backend first; PowerShell costs a process spawn
         try:
-            if os.name == 'nt':  # Windows
-                # Use PowerShell to set clipboard
-                subprocess.run(
-                    ['powershell', '-Command', f'Set-Clipboard -Value "{text}"'],
-                    check=True,
-                    capture_output=True
-                )
+            if os.name == 'nt' and _set_windows_clipboard(text):
                 self.logger.info(f"Copied to clipboard: {text}")
             elif pyperclip:
                 # Use pyperclip for cross-platform support
                 pyperclip.copy(text)
                 self.logger.info(f"Copied to clipboard: {text}")
+            elif os.name == 'nt':
+                # Last resort: PowerShell; only stderr is kept for diagnostics
+                subprocess.run(
+                    ['powershell', '-NoProfile', '-NoLogo', '-Command', f'Set-Clipboard -Value "{text}"'],
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                )
+                self.logger.info(f"Copied to clipboard: {text}")
             else:
                 self.logger.error("Clipboard not supported on this platform")
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode(errors="replace").strip() if e.stderr else ""
+            self.logger.error(f"Error copying to clipboard: {e} {stderr}".rstrip())
         except Exception as e:
             self.logger.error(f"Error copying to clipboard: {e}")
 
@@ -109,23 +198,31 @@ class CustomCommand(Command):
             self.logger.warning("No path specified for execute_file action")
             return None
 
-        # Expand environment variables
-        path = os.path.expandvars(path)
+        # Use the path resolved at construction unless lazy resolution was requested
+        if self._resolved_path is None:
+            path, path_exists = self._resolve_path()
+        else:
+            path, path_exists = self._resolved_path, self._path_exists
 
-        # Check if file exists
-        if not os.path.exists(path):
+        if not path_exists:
             self.logger.error(f"File not found: {path}")
             return None
 
         # Execute the file
         try:
-            # Run without waiting (non-blocking)
-            subprocess.Popen(
-                path,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
+            if os.name == 'nt':
+                # ShellExecute: no cmd.exe, and also opens documents and shortcuts
+                os.startfile(path)
+            else:
+                # Fire and forget: no shell parsing, output discarded (undrained
+                # pipes would block chatty programs), own session so it outlives us
+                subprocess.Popen(
+                    [path],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
             self.logger.info(f"Executed: {path}")
         except Exception as e:
             self.logger.error(f"Error executing file: {e}")
@@ -139,18 +236,22 @@ class CustomCommand(Command):
             self.logger.warning("No keys specified for key_combination action")
             return None
 
-        # Press all keys in the combination
-        try:
-            # Press all keys down
-            for key in keys:
-                context.keyboard_controller.press(key)
-
-            # Small delay
-            time.sleep(0.05)
+        # Optional hold time for apps that miss instantaneous combinations
+        hold_ms = self.action_data.get("hold_ms", 0)
+        controller = context.keyboard_controller
 
-            # Release all keys in reverse order
-            for key in reversed(keys):
-                context.keyboard_controller.release(key)
+        try:
+            # Hold every modifier; ExitStack releases them in reverse order
+            with ExitStack() as held:
+                for key in keys[:-1]:
+                    held.enter_context(controller.pressed(key))
+
+                if hold_ms > 0:
+                    controller.press(keys[-1])
+                    time.sleep(hold_ms / 1000)
+                    controller.release(keys[-1])
+                else:
+                    controller.tap(keys[-1])
 
         except Exception as e:
             self.logger.error(f"Error executing key combination: {e}")
@@ -192,6 +293,15 @@ class CustomCommand(Command):
         """Get example usage."""
         return [self.trigger]
 
+    @property
+    def first_words(self) -> FrozenSet[str]:
+        """Custom commands only match their exact trigger phrase."""
+        return frozenset({self.first_word(self.trigger)})
+
+    @property
+    def exact_phrases(self) -> FrozenSet[str]:
+        return frozenset({self.trigger})
+
 
 def load_custom_commands(config: Any) -> list[CustomCommand]:
     """
@@ -209,18 +319,16 @@ def load_custom_commands(config: Any) -> list[CustomCommand]:
     try:
         # Check if custom commands are enabled
         enabled = config.get("custom_commands", "enabled", default=False)
-        print(f"[DEBUG] Custom commands enabled: {enabled}")
+        logger.debug("Custom commands enabled: %s", enabled)
         if not enabled:
             logger.info("Custom commands disabled in config")
-            print("[DEBUG] Custom commands disabled in config")
             return commands
 
         # Get command list
         custom_cmds = config.get("custom_commands", "commands", default=[])
-        print(f"[DEBUG] Found {len(custom_cmds) if custom_cmds else 0} custom command definitions")
+        logger.debug("Found %d custom command definitions", len(custom_cmds) if custom_cmds else 0)
         if not custom_cmds:
             logger.info("No custom commands defined in config")
-            print("[DEBUG] No custom commands defined in config")
             return commands
 
         # Create command instances
@@ -230,26 +338,23 @@ def load_custom_commands(config: Any) -> list[CustomCommand]:
                 action = cmd_config.get("action", {})
                 action_type = action.get("type")
 
-                print(f"[DEBUG] Command {i+1}: trigger='{trigger}', type='{action_type}'")
+                logger.debug("Command %d: trigger=%r, type=%r", i + 1, trigger, action_type)
 
                 if not trigger or not action_type:
                     logger.warning(f"Invalid custom command config: {cmd_config}")
-                    print(f"[DEBUG] Invalid command config (missing trigger or type)")
                     continue
 
                 # Create command
                 cmd = CustomCommand(trigger, action_type, action)
                 commands.append(cmd)
-                logger.info(f"Loaded custom command: '{trigger}' -> {action_type}")
-                print(f"[DEBUG] ✓ Successfully loaded: '{trigger}' -> {action_type}")
 
             except Exception as e:
                 logger.error(f"Error loading custom command: {e}")
-                print(f"[DEBUG] ✗ Error loading command: {e}")
                 continue
 
-        logger.info(f"Loaded {len(commands)} custom commands")
-        print(f"[DEBUG] Total custom commands loaded: {len(commands)}")
+        logger.info(
+            "Loaded %d custom commands: %s", len(commands), [cmd.trigger for cmd in commands]
+        )
 
     except Exception as e:
         logger.error(f"Error loading custom commands from config: {e}")
@@ -1,12 +1,81 @@
 """Keyboard command implementations."""
 
-from typing import Optional
+import sys
+from types import MappingProxyType
+from typing import FrozenSet, Mapping, Optional
 
 from pynput import keyboard
 
 from src.commands.base import Command, CommandContext, PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_MEDIUM, PRIORITY_NORMAL
 
 
+# Spoken prefix for the "type <text>" / "type <symbol>" commands
+_TYPE_PREFIX = "type "
+
+# Spoken symbol names (including aliases) mapped to the character to type.
+# Built once per process; keys are interned so lookups against interned
+# trigger strings can short-circuit on identity.
+_SYMBOLS: Mapping[str, str] = MappingProxyType({
+    sys.intern(name): symbol
+    for name, symbol in {
+        "slash": "/",
+        "backslash": "\\",
+        "open": "(",
+        "open paren": "(",
+        "close": ")",
+        "close paren": ")",
+        "curly open": "{",
+        "open curly": "{",
+        "curly close": "}",
+        "close curly": "}",
+        "equal": "=",
+        "equals": "=",
+        "quotation": '"',
+        "quote": '"',
+        "tick": "'",
+        "apostrophe": "'",
+        "dollar": "$",
+        "and": "&",
+        "ampersand": "&",
+        "array open": "[",
+        "open bracket": "[",
+        "array close": "]",
+        "close bracket": "]",
+        "question": "?",
+        "exclamation": "!",
+        "percent": "%",
+        "star": "*",
+        "asterisk": "*",
+        "plus": "+",
+        "minus": "-",
+        "dash": "-",
+        "dot": ".",
+        "period": ".",
+        "colon": ":",
+        "semicolon": ";",
+        "comma": ",",
+        "hashtag": "#",
+        "hash": "#",
+        "pound": "#",
+        "greater": ">",
+        "greater than": ">",
+        "smaller": "<",
+        "less than": "<",
+        "bar": "|",
+        "pipe": "|",
+        "elevate": "^",
+        "caret": "^",
+        "round": "~",
+        "tilde": "~",
+    }.items()
+})
+
+# Symbols may be said bare or after the "type" prefix
+_SYMBOL_FIRST_WORDS = frozenset(
+    {Command.first_word(name) for name in _SYMBOLS} | {Command.first_word(_TYPE_PREFIX)}
+)
+
+
 class KeyPressCommand(Command):
     """
     Generic key press command.
@@ -30,7 +99,8 @@ class KeyPressCommand(Command):
             description: Description for help text
             priority: Command priority (default PRIORITY_NORMAL)
         """
-        self._trigger_words = [w.lower() for w in trigger_words]
+        self._trigger_words = [self.strip_punctuation(w) for w in trigger_words]
+        self._first_words = frozenset(self.first_word(w) for w in self._trigger_words)
         self._key = key
         self._description = description
         self._priority = priority
@@ -58,6 +128,14 @@ class KeyPressCommand(Command):
     def examples(self) -> list[str]:
         return self._trigger_words
 
+    @property
+    def first_words(self) -> FrozenSet[str]:
+        return self._first_words
+
+    @property
+    def exact_phrases(self) -> FrozenSet[str]:
+        return frozenset(self._trigger_words)
+
 
 class EnterCommand(KeyPressCommand):
     """Press Enter key."""
@@ -129,10 +207,8 @@ class DeleteWordCommand(Command):
     def execute(self, context: CommandContext, text: str) -> Optional[str]:
         """Delete previous word using Ctrl+Backspace."""
         # Press Ctrl+Backspace to delete previous word
-        context.keyboard_controller.press(keyboard.Key.ctrl)
-        context.keyboard_controller.press(keyboard.Key.backspace)
-        context.keyboard_controller.release(keyboard.Key.backspace)
-        context.keyboard_controller.release(keyboard.Key.ctrl)
+        with context.keyboard_controller.pressed(keyboard.Key.ctrl):
+            context.keyboard_controller.tap(keyboard.Key.backspace)
         return None
 
     @property
@@ -147,6 +223,14 @@ class DeleteWordCommand(Command):
     def examples(self) -> list[str]:
         return ["delete word"]
 
+    @property
+    def first_words(self) -> FrozenSet[str]:
+        return frozenset({"delete"})
+
+    @property
+    def exact_phrases(self) -> FrozenSet[str]:
+        return frozenset({"delete word"})
+
 
 class DeleteLineCommand(Command):
     """Delete the current line."""
@@ -158,18 +242,14 @@ class DeleteLineCommand(Command):
     def execute(self, context: CommandContext, text: str) -> Optional[str]:
         """Delete current line using Home, Shift+End, Delete."""
         # Move to start of line
-        context.keyboard_controller.press(keyboard.Key.home)
-        context.keyboard_controller.release(keyboard.Key.home)
+        context.keyboard_controller.tap(keyboard.Key.home)
 
         # Select to end of line
-        context.keyboard_controller.press(keyboard.Key.shift)
-        context.keyboard_controller.press(keyboard.Key.end)
-        context.keyboard_controller.release(keyboard.Key.end)
-        context.keyboard_controller.release(keyboard.Key.shift)
+        with context.keyboard_controller.pressed(keyboard.Key.shift):
+            context.keyboard_controller.tap(keyboard.Key.end)
 
         # Delete selection
-        context.keyboard_controller.press(keyboard.Key.delete)
-        context.keyboard_controller.release(keyboard.Key.delete)
+        context.keyboard_controller.tap(keyboard.Key.delete)
 
         return None
 
@@ -185,6 +265,14 @@ class DeleteLineCommand(Command):
     def examples(self) -> list[str]:
         return ["delete line"]
 
+    @property
+    def first_words(self) -> FrozenSet[str]:
+        return frozenset({"delete"})
+
+    @property
+    def exact_phrases(self) -> FrozenSet[str]:
+        return frozenset({"delete line"})
+
 
 class ClipboardCommand(Command):
     """
@@ -229,6 +317,14 @@ class ClipboardCommand(Command):
     def examples(self) -> list[str]:
         return ["copy", "cut", "paste"]
 
+    @property
+    def first_words(self) -> FrozenSet[str]:
+        return frozenset(self._operations)
+
+    @property
+    def exact_phrases(self) -> FrozenSet[str]:
+        return frozenset(self._operations)
+
 
 class KeyboardShortcutCommand(Command):
     """
@@ -255,7 +351,8 @@ class KeyboardShortcutCommand(Command):
             priority: Command priority (default 200)
             modifier: Modifier key to use (default Ctrl)
         """
-        self._trigger_words = [w.lower() for w in trigger_words]
+        self._trigger_words = [self.strip_punctuation(w) for w in trigger_words]
+        self._first_words = frozenset(self.first_word(w) for w in self._trigger_words)
         self._key = key
         self._description = description
         self._priority = priority
@@ -286,6 +383,14 @@ class KeyboardShortcutCommand(Command):
     def examples(self) -> list[str]:
         return self._trigger_words
 
+    @property
+    def first_words(self) -> FrozenSet[str]:
+        return self._first_words
+
+    @property
+    def exact_phrases(self) -> FrozenSet[str]:
+        return frozenset(self._trigger_words)
+
 
 class SelectAllCommand(KeyboardShortcutCommand):
     """Select all text (Ctrl+A)."""
@@ -345,24 +450,14 @@ class TypeTextCommand(Command):
     """
 
     def matches(self, text: str) -> bool:
-        # Strip punctuation for matching
-        text_clean = self.strip_punctuation(text)
         # Match "type something" with space
-        if text_clean.startswith("type "):
-            return True
-        return False
+        return self.strip_punctuation(text).startswith(_TYPE_PREFIX)
 
     def execute(self, context: CommandContext, text: str) -> Optional[str]:
         """Strip 'type' prefix and return text to be typed."""
-        # Strip punctuation from the text
-        text_clean = self.strip_punctuation(text)
-
-        if text_clean.startswith("type "):
-            # Remove "type " prefix
-            result = text_clean[5:].strip()
-            return result if result else None
-
-        return text_clean if text_clean else None
+        # matches() guarantees the prefix, so a single slice is enough
+        result = self.strip_punctuation(text)[len(_TYPE_PREFIX):].strip()
+        return result if result else None
 
     @property
     def priority(self) -> int:
@@ -376,6 +471,10 @@ class TypeTextCommand(Command):
     def examples(self) -> list[str]:
         return ["type hello world", "type investigate why"]
 
+    @property
+    def first_words(self) -> FrozenSet[str]:
+        return frozenset({self.first_word(_TYPE_PREFIX)})
+
 
 class TypeSymbolCommand(Command):
     """
@@ -384,84 +483,17 @@ class TypeSymbolCommand(Command):
     Handles symbols that might be difficult to speak naturally.
     """
 
-    def __init__(self):
-        """Initialize symbol mappings."""
-        self._symbols = {
-            "slash": "/",
-            "backslash": "\\",
-            "open": "(",
-            "open paren": "(",
-            "close": ")",
-            "close paren": ")",
-            "curly open": "{",
-            "open curly": "{",
-            "curly close": "}",
-            "close curly": "}",
-            "equal": "=",
-            "equals": "=",
-            "quotation": '"',
-            "quote": '"',
-            "tick": "'",
-            "apostrophe": "'",
-            "dollar": "$",
-            "and": "&",
-            "ampersand": "&",
-            "array open": "[",
-            "open bracket": "[",
-            "array close": "]",
-            "close bracket": "]",
-            "question": "?",
-            "exclamation": "!",
-            "percent": "%",
-            "star": "*",
-            "asterisk": "*",
-            "plus": "+",
-            "minus": "-",
-            "dash": "-",
-            "dot": ".",
-            "period": ".",
-            "colon": ":",
-            "semicolon": ";",
-            "comma": ",",
-            "hashtag": "#",
-            "hash": "#",
-            "pound": "#",
-            "greater": ">",
-            "greater than": ">",
-            "smaller": "<",
-            "less than": "<",
-            "bar": "|",
-            "pipe": "|",
-            "elevate": "^",
-            "caret": "^",
-            "round": "~",
-            "tilde": "~",
-        }
+    def _symbol_name(self, text: str) -> str:
+        """Normalize text to a symbol name, dropping an optional "type" prefix."""
+        return self.strip_punctuation(text).removeprefix(_TYPE_PREFIX).strip()
 
     def matches(self, text: str) -> bool:
-        text_clean = self.strip_punctuation(text)
-
-        # Check if it's exactly a symbol name
-        if text_clean in self._symbols:
-            return True
-
-        # Check if it's exactly "type <symbol_name>"
-        if text_clean.startswith("type "):
-            symbol_part = text_clean[5:].strip()
-            # Only match if the part after "type " is exactly a valid symbol
-            if symbol_part in self._symbols:
-                return True
-
-        return False
+        # Matches "<symbol_name>" or exactly "type <symbol_name>"
+        return self._symbol_name(text) in _SYMBOLS
 
     def execute(self, context: CommandContext, text: str) -> Optional[str]:
         """Type the symbol."""
-        text_clean = self.strip_punctuation(text)
-        # Strip "type" prefix if present
-        if text_clean.startswith("type "):
-            text_clean = text_clean[5:].strip()
-        symbol = self._symbols[text_clean]
-        return symbol  # Return symbol to be typed
+        return _SYMBOLS[self._symbol_name(text)]  # Return symbol to be typed
 
     @property
     def priority(self) -> int:
@@ -474,3 +506,20 @@ class TypeSymbolCommand(Command):
     @property
     def examples(self) -> list[str]:
         return ["slash", "open paren", "close paren", "equals", "quote", "comma"]
+
+    @property
+    def first_words(self) -> FrozenSet[str]:
+        return _SYMBOL_FIRST_WORDS
+
+
+# Shared instances of the stateless key press / shortcut commands, built once
+# per process and reused by every registry that registers them.
+ENTER_COMMAND = EnterCommand()
+TAB_COMMAND = TabCommand()
+ESCAPE_COMMAND = EscapeCommand()
+SPACE_COMMAND = SpaceCommand()
+BACKSPACE_COMMAND = BackspaceCommand()
+SELECT_ALL_COMMAND = SelectAllCommand()
+UNDO_COMMAND = UndoCommand()
+REDO_COMMAND = RedoCommand()
+SAVE_COMMAND = SaveCommand()
@@ -1,7 +1,12 @@
 """Mouse command implementations."""
 
+import logging
+import re
+import sys
+import threading
 import time
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import FrozenSet, Mapping, Optional, Tuple
 
 from pynput import mouse
 
@@ -13,123 +18,82 @@ from src.commands.base import (
     PRIORITY_NORMAL,
 )
 from src.commands.parser import CommandParser
-from src.core.events import Event, EventType
 
+# Exact phrases of the fixed-button click commands, interned once per process
+CLICK_PHRASE = sys.intern("click")
+RIGHT_CLICK_PHRASE = sys.intern("right click")
+DOUBLE_CLICK_PHRASE = sys.intern("double click")
+MIDDLE_CLICK_PHRASES = frozenset({sys.intern("middle click"), sys.intern("wheel click")})
 
-def publish_command_event(context: CommandContext, command_name: str, event_data: Dict[str, Any]) -> None:
-    """
-    Publish command executed event (DRY helper).
+# Button, click count and feedback label for every fixed click phrase
+CLICK_MAP: Mapping[str, Tuple[mouse.Button, int, str]] = MappingProxyType({
+    CLICK_PHRASE: (mouse.Button.left, 1, "Click"),
+    RIGHT_CLICK_PHRASE: (mouse.Button.right, 1, "Right Click"),
+    DOUBLE_CLICK_PHRASE: (mouse.Button.left, 2, "Double Click"),
+    **{
+        phrase: (mouse.Button.middle, 1, "Middle Click")
+        for phrase in sorted(MIDDLE_CLICK_PHRASES)
+    },
+})
+_CLICK_FIRST_WORDS = frozenset(Command.first_word(phrase) for phrase in CLICK_MAP)
 
-    Args:
-        context: Command execution context
-        command_name: Name of the command
-        event_data: Additional event data
-    """
-    if context.event_bus:
-        context.event_bus.publish(
-            Event(EventType.COMMAND_EXECUTED, {**event_data, "command": command_name})
-        )
+# (direction, dx, dy) unit steps for scrolling, in the order directions are
+# looked for in the utterance
+SCROLL_STEPS = (("up", 0, -1), ("down", 0, 1), ("left", -1, 0), ("right", 1, 0))
 
+# Directions accepted by the scroll and mouse move commands
+SCROLL_DIRECTIONS = tuple(direction for direction, _, _ in SCROLL_STEPS)
+MOVE_DIRECTIONS = ("up", "down")  # left/right are window commands
 
-class ClickCommand(Command):
-    """Left click at current mouse position."""
+# Repeated scroll/move commands double their step, up to 2**4 = 16x
+MAX_SCALE_SHIFT = 4
 
-    def matches(self, text: str) -> bool:
-        return self.strip_punctuation(text) == "click"
+# Separators between the two cell numbers of a drag ("5 to 9", "five two nine", "5-9")
+DRAG_SEPARATOR_PATTERN = re.compile(r" to | two |-")
 
-    def execute(self, context: CommandContext, text: str) -> Optional[str]:
-        """Execute left click."""
-        context.mouse_controller.click(mouse.Button.left, 1)
-        publish_command_event(context, "ClickCommand", {"button": "left", "text": text})
-        return None
+# Command words that keep MoveToNumberCommand from treating text as a bare number
+MOVE_TO_NUMBER_EXCLUDED_PREFIXES = ("click", "refine", "type", "switch", "scroll", "move", "page")
 
-    @property
-    def priority(self) -> int:
-        return PRIORITY_NORMAL
-
-    @property
-    def description(self) -> str:
-        return "Left click at current mouse position"
-
-    @property
-    def examples(self) -> list[str]:
-        return ["click"]
 
+class ClickFamilyCommand(Command):
+    """
+    Left, right, double or middle click at current mouse position.
 
-class RightClickCommand(Command):
-    """Right click at current mouse position."""
+    Handles every phrase in CLICK_MAP with a single lookup instead of one
+    command per button.
+    """
 
     def matches(self, text: str) -> bool:
-        return self.strip_punctuation(text) == "right click"
+        return self.strip_punctuation(text) in CLICK_MAP
 
     def execute(self, context: CommandContext, text: str) -> Optional[str]:
-        """Execute right click."""
-        context.mouse_controller.click(mouse.Button.right, 1)
-        publish_command_event(context, "RightClickCommand", {"button": "right", "text": text})
+        """Execute the click for the spoken phrase."""
+        button, count, _ = CLICK_MAP[self.strip_punctuation(text)]
+        context.mouse_controller.click(button, count)
         return None
 
-    @property
-    def priority(self) -> int:
-        return PRIORITY_MEDIUM  # Higher than generic click
-
-    @property
-    def description(self) -> str:
-        return "Right click at current mouse position"
-
-    @property
-    def examples(self) -> list[str]:
-        return ["right click"]
-
-
-class DoubleClickCommand(Command):
-    """Double click at current mouse position."""
-
-    def matches(self, text: str) -> bool:
-        return self.strip_punctuation(text) == "double click"
-
-    def execute(self, context: CommandContext, text: str) -> Optional[str]:
-        """Execute double click."""
-        context.mouse_controller.click(mouse.Button.left, 2)
-        publish_command_event(context, "DoubleClickCommand", {"button": "left", "count": 2, "text": text})
-        return None
+    def display_name(self, text: str) -> Optional[str]:
+        return CLICK_MAP[self.strip_punctuation(text)][2]
 
     @property
     def priority(self) -> int:
-        return PRIORITY_MEDIUM  # Higher than generic click
+        return PRIORITY_MEDIUM
 
     @property
     def description(self) -> str:
-        return "Double click at current mouse position"
+        return "Left, right, double or middle click at current mouse position"
 
     @property
     def examples(self) -> list[str]:
-        return ["double click"]
-
-
-class MiddleClickCommand(Command):
-    """Middle click at current mouse position."""
-
-    def matches(self, text: str) -> bool:
-        text_clean = self.strip_punctuation(text)
-        return text_clean in ["middle click", "wheel click"]
-
-    def execute(self, context: CommandContext, text: str) -> Optional[str]:
-        """Execute middle click."""
-        context.mouse_controller.click(mouse.Button.middle, 1)
-        publish_command_event(context, "MiddleClickCommand", {"button": "middle", "text": text})
-        return None
-
-    @property
-    def priority(self) -> int:
-        return 200
+        return list(CLICK_MAP)
 
     @property
-    def description(self) -> str:
-        return "Middle click at current mouse position"
+    def first_words(self) -> FrozenSet[str]:
+        return _CLICK_FIRST_WORDS
 
     @property
-    def examples(self) -> list[str]:
-        return ["middle click", "wheel click"]
+    def exact_phrases(self) -> FrozenSet[str]:
+        return frozenset(CLICK_MAP)
 
 
 class ScrollCommand(Command):
@@ -148,7 +112,7 @@ class ScrollCommand(Command):
     def matches(self, text: str) -> bool:
         text_clean = self.strip_punctuation(text)
         return text_clean.startswith("scroll") and any(
-            direction in text_clean for direction in ["up", "down", "left", "right"]
+            direction in text_clean for direction in SCROLL_DIRECTIONS
         )
 
     def execute(self, context: CommandContext, text: str) -> Optional[str]:
@@ -156,18 +120,9 @@ class ScrollCommand(Command):
         text_clean = self.strip_punctuation(text)
 
         # Determine direction
-        if "up" in text_clean:
-            direction = "up"
-            dx, dy = 0, -self._base_scroll
-        elif "down" in text_clean:
-            direction = "down"
-            dx, dy = 0, self._base_scroll
-        elif "left" in text_clean:
-            direction = "left"
-            dx, dy = -self._base_scroll, 0
-        elif "right" in text_clean:
-            direction = "right"
-            dx, dy = self._base_scroll, 0
+        for direction, dx, dy in SCROLL_STEPS:
+            if direction in text_clean:
+                break
         else:
             return None
 
@@ -179,17 +134,12 @@ class ScrollCommand(Command):
             self._last_direction = direction
 
         # Exponential scaling: 3, 6, 12, 24, capped at 48
-        multiplier = min(2 ** self._repeat_count, 16)
-        final_dx = dx * multiplier
-        final_dy = dy * multiplier
+        multiplier = 1 << min(self._repeat_count, MAX_SCALE_SHIFT)
+        final_dx = dx * self._base_scroll * multiplier
+        final_dy = dy * self._base_scroll * multiplier
 
         # Perform scroll
         context.mouse_controller.scroll(final_dx, final_dy)
-        publish_command_event(
-            context,
-            "ScrollCommand",
-            {"direction": direction, "multiplier": multiplier, "text": text}
-        )
         return None
 
     @property
@@ -204,6 +154,10 @@ class ScrollCommand(Command):
     def examples(self) -> list[str]:
         return ["scroll up", "scroll down", "scroll left", "scroll right"]
 
+    @property
+    def first_word_prefixes(self) -> FrozenSet[str]:
+        return frozenset({"scroll"})
+
 
 class MouseMoveCommand(Command):
     """
@@ -224,7 +178,7 @@ class MouseMoveCommand(Command):
         text_clean = self.strip_punctuation(text)
         # Only match "move up" and "move down" (left/right are window commands)
         return text_clean.startswith("move") and any(
-            direction in text_clean for direction in ["up", "down"]
+            direction in text_clean for direction in MOVE_DIRECTIONS
         )
 
     def execute(self, context: CommandContext, text: str) -> Optional[str]:
@@ -247,7 +201,7 @@ class MouseMoveCommand(Command):
             self._last_direction = direction
 
         # Exponential scaling: base * 2^count, capped at 800px
-        step_size = min(self._base_step * (2 ** self._repeat_count), 800)
+        step_size = self._base_step << min(self._repeat_count, MAX_SCALE_SHIFT)
 
         # Get current position
         current_x, current_y = context.mouse_controller.position
@@ -260,17 +214,6 @@ class MouseMoveCommand(Command):
 
         # Move mouse
         context.mouse_controller.position = (current_x, new_y)
-        publish_command_event(
-            context,
-            "MouseMoveCommand",
-            {
-                "direction": direction,
-                "step_size": step_size,
-                "multiplier": 2 ** self._repeat_count,
-                "new_position": (current_x, new_y),
-                "text": text
-            }
-        )
         return None
 
     @property
@@ -285,6 +228,10 @@ class MouseMoveCommand(Command):
     def examples(self) -> list[str]:
         return ["move up", "move down"]
 
+    @property
+    def first_word_prefixes(self) -> FrozenSet[str]:
+        return frozenset({"move"})
+
 
 class ClickNumberCommand(Command):
     """
@@ -323,11 +270,6 @@ class ClickNumberCommand(Command):
         position = context.overlay_manager.get_element_position(number)
         if not position:
             # No element with this number
-            publish_command_event(
-                context,
-                "ClickNumberCommand",
-                {"number": number, "text": text, "error": "element_not_found"}
-            )
             return None
 
         # Click at the element position
@@ -335,11 +277,6 @@ class ClickNumberCommand(Command):
         context.mouse_controller.position = (x, y)
         context.mouse_controller.click(mouse.Button.left, 1)
 
-        publish_command_event(
-            context,
-            "ClickNumberCommand",
-            {"number": number, "x": x, "y": y, "text": text}
-        )
         return None
 
     @property
@@ -354,6 +291,10 @@ class ClickNumberCommand(Command):
     def examples(self) -> list[str]:
         return ["click 5", "click number 12", "click two"]
 
+    @property
+    def first_word_prefixes(self) -> FrozenSet[str]:
+        return frozenset({"click"})
+
 
 class MoveToNumberCommand(Command):
     """
@@ -377,12 +318,8 @@ class MoveToNumberCommand(Command):
 
         # Match if text is just a number (or word representation)
         # But NOT if it starts with a command word like "click", "refine", etc.
-        command_prefixes = ["click", "refine", "type", "switch", "scroll", "move", "page"]
-
-        # Check if text starts with any command prefix
-        for prefix in command_prefixes:
-            if text_clean.startswith(prefix):
-                return False
+        if text_clean.startswith(MOVE_TO_NUMBER_EXCLUDED_PREFIXES):
+            return False
 
         # Check if text contains a number
         return self.parser.contains_numbers(text_clean)
@@ -414,11 +351,6 @@ class MoveToNumberCommand(Command):
         x, y = position
         context.mouse_controller.position = (x, y)
 
-        publish_command_event(
-            context,
-            "MoveToNumberCommand",
-            {"number": number, "x": x, "y": y, "text": text}
-        )
         return None
 
     @property
@@ -451,6 +383,7 @@ class DragBetweenNumbersCommand(Command):
             parser: Command parser for extracting numbers
         """
         self.parser = parser
+        self.logger = logging.getLogger("DragBetweenNumbersCommand")
 
     def matches(self, text: str) -> bool:
         # Don't strip punctuation yet - we need to check for hyphens
@@ -458,9 +391,9 @@ class DragBetweenNumbersCommand(Command):
 
         # Match pattern: "NUMBER to NUMBER", "NUMBER two NUMBER", or "NUMBER-NUMBER"
         # Example: "5 to 9", "twenty to thirty", "5-9", "20-47"
-        has_separator = " to " in text_clean or " two " in text_clean or "-" in text_clean
-
-        if not has_separator:
+        # One scan for all separators; most utterances are rejected here
+        # before the number parser runs
+        if DRAG_SEPARATOR_PATTERN.search(text_clean) is None:
             return False
 
         # Extract numbers and verify we have exactly 2
@@ -469,8 +402,8 @@ class DragBetweenNumbersCommand(Command):
 
     def execute(self, context: CommandContext, text: str) -> Optional[str]:
         """Click and drag from first number to second number."""
-        # Extract numbers from command
-        numbers = self.parser.extract_numbers(text)
+        # Same normalization as matches() so the parser reuses its result
+        numbers = self.parser.extract_numbers(text.lower().strip())
         if len(numbers) != 2:
             return None
 
@@ -494,37 +427,50 @@ class DragBetweenNumbersCommand(Command):
         if not end_pos:
             return None
 
-        # Perform drag operation
-        start_x, start_y = start_pos
-        end_x, end_y = end_pos
-
         # Move to start position
-        context.mouse_controller.position = (start_x, start_y)
+        context.mouse_controller.position = start_pos
+
+        # The press/move/release delays take ~400ms; run them on a background
+        # thread so the dispatcher can accept the next utterance right away
+        thread = threading.Thread(
+            target=self._finish_drag,
+            args=(context, end_pos),
+            daemon=True,
+        )
+        thread.start()
+        return None
 
-        # Delay to ensure cursor is in position
-        time.sleep(0.1)
+    def _finish_drag(self, context: CommandContext, end_pos: Tuple[int, int]) -> None:
+        """
+        Complete a drag started by execute() once the cursor is at the start cell.
 
-        # Press and hold left button
-        context.mouse_controller.press(mouse.Button.left)
+        Args:
+            context: Command execution context
+            end_pos: Screen position of the end cell
+        """
+        # Runs on its own thread, so errors are logged here or nobody sees them
+        try:
+            # Delay to ensure cursor is in position
+            time.sleep(0.1)
 
-        # Delay for system to register press
-        time.sleep(0.15)
+            # Press and hold left button
+            context.mouse_controller.press(mouse.Button.left)
 
-        # Move to end position (while holding)
-        context.mouse_controller.position = (end_x, end_y)
+            try:
+                # Delay for system to register press
+                time.sleep(0.15)
 
-        # Delay before release to ensure drag is registered
-        time.sleep(0.15)
+                # Move to end position (while holding)
+                context.mouse_controller.position = end_pos
 
-        # Release button
-        context.mouse_controller.release(mouse.Button.left)
+                # Delay before release to ensure drag is registered
+                time.sleep(0.15)
+            finally:
+                # Release button, even if the move failed, so it isn't left held
+                context.mouse_controller.release(mouse.Button.left)
 
-        publish_command_event(
-            context,
-            "DragBetweenNumbersCommand",
-            {"start": start_num, "end": end_num, "text": text}
-        )
-        return None
+        except Exception as e:
+            self.logger.error("Drag to %s failed: %s", end_pos, e)
 
     @property
     def priority(self) -> int:
@@ -587,14 +533,7 @@ class RefineGridCommand(Command):
             return None
 
         # Refine the grid
-        success = grid_overlay.refine_grid(number)
-
-        if success:
-            publish_command_event(
-                context,
-                "RefineGridCommand",
-                {"cell_number": number, "text": text}
-            )
+        grid_overlay.refine_grid(number)
 
         return None
 
@@ -609,3 +548,7 @@ class RefineGridCommand(Command):
     @property
     def examples(self) -> list[str]:
         return ["refine 5", "refine grid 45", "refine twelve"]
+
+    @property
+    def first_word_prefixes(self) -> FrozenSet[str]:
+        return frozenset({"refine"})
@@ -1,12 +1,49 @@
 """Navigation command implementations."""
 
-from typing import Optional
+import re
+import sys
+from types import MappingProxyType
+from typing import FrozenSet, Mapping, Optional
 
 from pynput import keyboard
 
 from src.commands.base import Command, CommandContext
 from src.core.events import Event, EventType
 
+# Arrow key per spoken direction, built once per process with interned keys
+_ARROW_KEYS: Mapping[str, keyboard.Key] = MappingProxyType({
+    sys.intern("left"): keyboard.Key.left,
+    sys.intern("right"): keyboard.Key.right,
+    sys.intern("up"): keyboard.Key.up,
+    sys.intern("down"): keyboard.Key.down,
+})
+
+# Phrases matched anywhere in the utterance, compiled once into a single scan
+PAGE_PATTERN = re.compile(r"page (?:up|down)")
+GO_TO_PATTERN = re.compile(r"go to (?:start|top|beginning|end|bottom)")
+LINE_PHRASES = frozenset({"line start", "line end"})
+HOME_END_PHRASES = frozenset({"go to "}) | LINE_PHRASES
+
+
+def _chord(kb: keyboard.Controller, modifier: keyboard.Key, key: keyboard.Key) -> None:
+    """
+    Tap key while holding modifier.
+
+    Explicit press/release instead of kb.pressed(), so no context manager is
+    built per keystroke. The modifier is released even if the tap fails.
+
+    Args:
+        kb: Keyboard controller
+        modifier: Modifier key to hold
+        key: Key to tap
+    """
+    kb.press(modifier)
+    try:
+        kb.press(key)
+        kb.release(key)
+    finally:
+        kb.release(modifier)
+
 
 class ArrowKeyCommand(Command):
     """
@@ -18,21 +55,13 @@ class ArrowKeyCommand(Command):
     def matches(self, text: str) -> bool:
         text_clean = self.strip_punctuation(text)
         # Only match single word arrow keys
-        return text_clean in ["left", "right", "up", "down"]
+        return text_clean in _ARROW_KEYS
 
     def execute(self, context: CommandContext, text: str) -> Optional[str]:
         """Press arrow key."""
         text_clean = self.strip_punctuation(text)
 
-        # Map text to keyboard key
-        key_map = {
-            "left": keyboard.Key.left,
-            "right": keyboard.Key.right,
-            "up": keyboard.Key.up,
-            "down": keyboard.Key.down,
-        }
-
-        key = key_map[text_clean]
+        key = _ARROW_KEYS[text_clean]
         context.keyboard_controller.press(key)
         context.keyboard_controller.release(key)
 
@@ -59,6 +88,14 @@ class ArrowKeyCommand(Command):
     def examples(self) -> list[str]:
         return ["left", "right", "up", "down"]
 
+    @property
+    def first_words(self) -> FrozenSet[str]:
+        return frozenset(_ARROW_KEYS)
+
+    @property
+    def exact_phrases(self) -> FrozenSet[str]:
+        return frozenset(_ARROW_KEYS)
+
 
 class PageNavigationCommand(Command):
     """
@@ -69,7 +106,7 @@ class PageNavigationCommand(Command):
 
     def matches(self, text: str) -> bool:
         text_clean = self.strip_punctuation(text)
-        return "page up" in text_clean or "page down" in text_clean
+        return PAGE_PATTERN.search(text_clean) is not None
 
     def execute(self, context: CommandContext, text: str) -> Optional[str]:
         """Execute page navigation."""
@@ -108,6 +145,10 @@ class PageNavigationCommand(Command):
     def examples(self) -> list[str]:
         return ["page up", "page down"]
 
+    @property
+    def trigger_phrases(self) -> FrozenSet[str]:
+        return frozenset({"page up", "page down"})
+
 
 class HomeEndCommand(Command):
     """
@@ -122,15 +163,7 @@ class HomeEndCommand(Command):
 
     def matches(self, text: str) -> bool:
         text_clean = self.strip_punctuation(text)
-        return (
-            "go to start" in text_clean
-            or "go to top" in text_clean
-            or "go to beginning" in text_clean
-            or "go to end" in text_clean
-            or "go to bottom" in text_clean
-            or text_clean == "line start"
-            or text_clean == "line end"
-        )
+        return text_clean in LINE_PHRASES or GO_TO_PATTERN.search(text_clean) is not None
 
     def execute(self, context: CommandContext, text: str) -> Optional[str]:
         """Execute home/end navigation."""
@@ -149,15 +182,11 @@ class HomeEndCommand(Command):
             action = "line_end"
         elif "start" in text_clean or "top" in text_clean or "beginning" in text_clean:
             # Ctrl+Home for document start
-            with context.keyboard_controller.pressed(keyboard.Key.ctrl):
-                context.keyboard_controller.press(keyboard.Key.home)
-                context.keyboard_controller.release(keyboard.Key.home)
+            _chord(context.keyboard_controller, keyboard.Key.ctrl, keyboard.Key.home)
             action = "document_start"
         elif "end" in text_clean or "bottom" in text_clean:
             # Ctrl+End for document end
-            with context.keyboard_controller.pressed(keyboard.Key.ctrl):
-                context.keyboard_controller.press(keyboard.Key.end)
-                context.keyboard_controller.release(keyboard.Key.end)
+            _chord(context.keyboard_controller, keyboard.Key.ctrl, keyboard.Key.end)
             action = "document_end"
         else:
             return None
@@ -191,3 +220,7 @@ class HomeEndCommand(Command):
             "line start",
             "line end",
         ]
+
+    @property
+    def trigger_phrases(self) -> FrozenSet[str]:
+        return HOME_END_PHRASES
@@ -1,6 +1,6 @@
 """Overlay command implementations."""
 
-from typing import Optional
+from typing import FrozenSet, Optional
 
 from src.commands.base import Command, CommandContext
 from src.overlays.base import OverlayType
@@ -43,6 +43,14 @@ class ShowGridCommand(Command):
     def examples(self) -> list[str]:
         return ["grid"]
 
+    @property
+    def first_words(self) -> FrozenSet[str]:
+        return frozenset({"grid"})
+
+    @property
+    def exact_phrases(self) -> FrozenSet[str]:
+        return frozenset({"grid"})
+
 
 class ShowElementsCommand(Command):
     """
@@ -81,6 +89,14 @@ class ShowElementsCommand(Command):
     def examples(self) -> list[str]:
         return ["numbers"]
 
+    @property
+    def first_words(self) -> FrozenSet[str]:
+        return frozenset({"numbers"})
+
+    @property
+    def exact_phrases(self) -> FrozenSet[str]:
+        return frozenset({"numbers"})
+
 
 class ShowWindowsCommand(Command):
     """
@@ -119,6 +135,14 @@ class ShowWindowsCommand(Command):
     def examples(self) -> list[str]:
         return ["windows"]
 
+    @property
+    def first_words(self) -> FrozenSet[str]:
+        return frozenset({"windows"})
+
+    @property
+    def exact_phrases(self) -> FrozenSet[str]:
+        return frozenset({"windows"})
+
 
 class HideOverlayCommand(Command):
     """
@@ -160,6 +184,14 @@ class HideOverlayCommand(Command):
     def examples(self) -> list[str]:
         return ["hide", "close"]
 
+    @property
+    def first_words(self) -> FrozenSet[str]:
+        return frozenset({"hide", "height", "close"})
+
+    @property
+    def exact_phrases(self) -> FrozenSet[str]:
+        return frozenset({"hide", "height", "close"})
+
 
 class ShowHelpCommand(Command):
     """
@@ -197,3 +229,11 @@ class ShowHelpCommand(Command):
     @property
     def examples(self) -> list[str]:
         return ["commands", "help"]
+
+    @property
+    def first_words(self) -> FrozenSet[str]:
+        return frozenset({"commands", "help"})
+
+    @property
+    def exact_phrases(self) -> FrozenSet[str]:
+        return frozenset({"commands", "help"})
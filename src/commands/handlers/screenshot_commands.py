@@ -1,74 +1,176 @@
 """Screenshot command implementations."""
 
+import atexit
+import heapq
 import logging
 import os
+import queue
 import re
-from datetime import datetime
+import threading
+import time
+from contextlib import suppress
 from pathlib import Path
-from typing import Optional
+from typing import Any, FrozenSet, Match, Optional, Tuple
 
 import pyautogui
+from PIL import Image
+
+try:
+    import mss
+except ImportError:
+    mss = None
 
 from src.commands.base import Command, CommandContext, PRIORITY_MEDIUM
 
+# Where screenshots are saved and looked up (home resolved once, at import)
+SCREENSHOTS_DIR = Path.home() / "Pictures" / "Screenshots"
+
+# Screenshot filenames: prefix + local timestamp + "_" + microseconds + suffix.
+# The timestamp sorts lexicographically, so name order is chronological order.
+SCREENSHOT_PREFIX = "screenshot_"
+SCREENSHOT_SUFFIX = ".png"
+
+# Screenshots are written under this extra suffix and renamed into place once
+# complete, so a listed screenshot_*.png is never partly written
+PARTIAL_SUFFIX = ".part"
+
+SCREENSHOT_PHRASES = frozenset({
+    "screenshot",
+    "take screenshot",
+    "screen shot",
+    "green shot",  # Common transcription error
+    "take green shot",
+    "greenshot",
+})
+
+# Reference screenshot request: "reference screenshot 2" or "screenshot" picks
+# one screenshot (idx), "reference screenshot last 3" picks several (multi)
+REFERENCE_SCREENSHOT_PATTERN = re.compile(
+    r"^(?:reference|paste|latest)?\s*(?:screenshot|screen\s*shot|green\s*shot|greenshot)"
+    r"\s*(?:path|file)?\s*(?:last\s+(?P<multi>\d+)|(?P<idx>\d+))?$",
+    re.IGNORECASE
+)
+
 
 class ScreenshotCommand(Command):
     """
     Take a screenshot and save it to the Screenshots folder.
 
-    Creates a timestamped screenshot in the user's Pictures/Screenshots directory.
+    Creates a timestamped screenshot in the user's Pictures/Screenshots directory,
+    named screenshot_YYYYMMDD_HHMMSS_<microseconds>.png. ReferenceScreenshotCommand
+    relies on these names sorting chronologically.
     """
 
     def __init__(self):
         """Initialize screenshot command."""
         self.logger = logging.getLogger("ScreenshotCommand")
 
-        # Determine screenshots directory
-        user_home = Path.home()
-        self.screenshots_dir = user_home / "Pictures" / "Screenshots"
+        # Determine screenshots directory; it is created on first use
+        self.screenshots_dir = SCREENSHOTS_DIR
+        self._dir_ready = False
+
+        # Filenames are joined onto this prefix instead of building a Path per shot
+        self._dir_str = str(self.screenshots_dir) + os.sep
+
+        # PNG encoding and disk I/O run on a background thread so the command
+        # returns as soon as the screen has been captured
+        self._save_queue: queue.Queue = queue.Queue()
+        self._save_thread: Optional[threading.Thread] = None
 
-        # Create directory if it doesn't exist
-        self.screenshots_dir.mkdir(parents=True, exist_ok=True)
-        self.logger.debug(f"Screenshots directory: {self.screenshots_dir}")
+        # Screen grabber (mss), created on first use and reused so OS capture
+        # resources are allocated once rather than per screenshot
+        self._grabber: Any = None
+        self._grab_lock = threading.Lock()
 
     def matches(self, text: str) -> bool:
         """Check if text matches screenshot command."""
-        text_clean = self.strip_punctuation(text)
-        return text_clean in [
-            "screenshot",
-            "take screenshot",
-            "screen shot",
-            "green shot",  # Common transcription error
-            "take green shot",
-            "greenshot"
-        ]
+        return self.strip_punctuation(text) in SCREENSHOT_PHRASES
 
     def execute(self, context: CommandContext, text: str) -> Optional[str]:
         """Take and save a screenshot."""
         try:
-            # Generate timestamp-based filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"screenshot_{timestamp}.png"
-            filepath = self.screenshots_dir / filename
+            # Create directory if it doesn't exist
+            if not self._dir_ready:
+                self.screenshots_dir.mkdir(parents=True, exist_ok=True)
+                self.logger.debug(f"Screenshots directory: {self.screenshots_dir}")
+                self._dir_ready = True
+
+            # Generate timestamp-based filename; the microsecond suffix keeps
+            # shots taken within the same second from overwriting each other
+            seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+            timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(seconds))
+            filename = f"{SCREENSHOT_PREFIX}{timestamp}_{nanos // 1000:06d}{SCREENSHOT_SUFFIX}"
+            filepath = self._dir_str + filename
 
             # Take screenshot
             self.logger.info(f"Taking screenshot: {filepath}")
-            screenshot = pyautogui.screenshot()
-
-            # Save screenshot
-            screenshot.save(str(filepath))
-            self.logger.info(f"Screenshot saved: {filepath}")
+            screenshot = self._grab()
 
-            # Optional: Show notification (if desired)
-            print(f"Screenshot saved: {filename}")
+            # Hand off to the save thread
+            if self._save_thread is None:
+                self._start_save_thread()
+            self._save_queue.put((screenshot, filepath))
 
             return None  # No text to type
 
         except Exception as e:
             self.logger.error(f"Failed to take screenshot: {e}")
-            print(f"Error taking screenshot: {e}")
             return None
 
+    def _grab(self) -> Any:
+        """
+        Capture the primary monitor.
+
+        Uses a reused mss grabber when mss is installed, falling back to
+        pyautogui otherwise or if the grab fails.
+
+        Returns:
+            Captured PIL image
+        """
+        if mss is not None:
+            try:
+                with self._grab_lock:
+                    if self._grabber is None:
+                        self._grabber = mss.mss()
+                    shot = self._grabber.grab(self._grabber.monitors[1])
+                return Image.frombytes("RGB", shot.size, shot.bgra, "raw", "BGRX")
+            except Exception as e:
+                self.logger.warning(f"mss capture failed, using pyautogui: {e}")
+        return pyautogui.screenshot()
+
+    def close(self) -> None:
+        """
+        Wait until every queued screenshot has been written.
+
+        Registered with atexit when the save thread starts, so screenshots
+        taken just before the app exits are not lost with the daemon thread.
+        """
+        if self._save_thread is not None:
+            self._save_queue.join()
+
+    def _start_save_thread(self) -> None:
+        """Start the background thread that encodes and writes screenshots."""
+        self._save_thread = threading.Thread(target=self._save_loop, daemon=True)
+        self._save_thread.start()
+        atexit.register(self.close)
+
+    def _save_loop(self) -> None:
+        """Save queued screenshots. Runs on the save thread."""
+        while True:
+            screenshot, filepath = self._save_queue.get()
+            partial_path = filepath + PARTIAL_SUFFIX
+            try:
+                # Fast zlib level: much quicker to encode, files only slightly larger
+                screenshot.save(partial_path, format="PNG", compress_level=1)
+                os.replace(partial_path, filepath)
+                self.logger.info(f"Screenshot saved: {filepath}")
+            except Exception as e:
+                self.logger.error(f"Failed to save screenshot: {e}")
+                with suppress(OSError):
+                    os.remove(partial_path)
+            finally:
+                self._save_queue.task_done()
+
     @property
     def priority(self) -> int:
         return PRIORITY_MEDIUM
@@ -81,6 +183,14 @@ class ScreenshotCommand(Command):
     def examples(self) -> list[str]:
         return ["screenshot", "take screenshot", "green shot"]
 
+    @property
+    def first_words(self) -> FrozenSet[str]:
+        return frozenset({"screenshot", "take", "screen", "green", "greenshot"})
+
+    @property
+    def exact_phrases(self) -> FrozenSet[str]:
+        return SCREENSHOT_PHRASES
+
 
 class ReferenceScreenshotCommand(Command):
     """
@@ -88,6 +198,8 @@ class ReferenceScreenshotCommand(Command):
 
     Searches the Screenshots folder for screenshots and types the absolute path
     of the Nth most recent screenshot (1 = latest, 2 = second latest, etc.).
+    Recency is read from the timestamped names written by ScreenshotCommand,
+    so no file is stat()ed.
     """
 
     def __init__(self):
@@ -95,60 +207,34 @@ class ReferenceScreenshotCommand(Command):
         self.logger = logging.getLogger("ReferenceScreenshotCommand")
 
         # Determine screenshots directory
-        user_home = Path.home()
-        self.screenshots_dir = user_home / "Pictures" / "Screenshots"
-
-        # Regex patterns to match command
-        # Pattern 1: Single screenshot - "reference screenshot 2" or "screenshot"
-        self.single_pattern = re.compile(
-            r"^(?:reference|paste|latest)?\s*(?:screenshot|screen\s*shot|green\s*shot|greenshot)\s*(?:path|file)?\s*(\d+)?$",
-            re.IGNORECASE
-        )
-
-        # Pattern 2: Multiple screenshots - "reference screenshot last 3"
-        self.multi_pattern = re.compile(
-            r"^(?:reference|paste|latest)?\s*(?:screenshot|screen\s*shot|green\s*shot|greenshot)\s*(?:path|file)?\s*last\s+(\d+)$",
-            re.IGNORECASE
-        )
+        self.screenshots_dir = SCREENSHOTS_DIR
 
-    def matches(self, text: str) -> bool:
-        """Check if text matches reference screenshot command."""
-        text_clean = self.strip_punctuation(text)
-        return bool(self.single_pattern.match(text_clean) or self.multi_pattern.match(text_clean))
+        # Last _match() input and result: matches() and execute() see the same
+        # utterance back to back
+        self._last_match: Optional[Tuple[str, Optional[Match[str]]]] = None
 
-    def _is_multi_request(self, text: str) -> tuple[bool, int]:
+    def _match(self, text: str) -> Optional[Match[str]]:
         """
-        Check if this is a "last N" request for multiple screenshots.
+        Match text against REFERENCE_SCREENSHOT_PATTERN.
 
         Args:
             text: Command text
 
         Returns:
-            Tuple of (is_multi, count) where is_multi indicates if it's a
-            "last N" request and count is the number requested
+            Match with "multi" and "idx" groups, or None if text does not match
         """
-        text_clean = self.strip_punctuation(text)
-        match = self.multi_pattern.match(text_clean)
-        if match and match.group(1):
-            return (True, int(match.group(1)))
-        return (False, 1)
-
-    def _extract_number(self, text: str) -> int:
-        """
-        Extract screenshot index from text (for single screenshot requests).
-
-        Args:
-            text: Command text (e.g., "reference screenshot 2")
+        last = self._last_match
+        if last is not None and last[0] == text:
+            return last[1]
 
-        Returns:
-            Screenshot index (1 for latest, 2 for second latest, etc.)
-            Defaults to 1 if no number specified.
-        """
         text_clean = self.strip_punctuation(text)
-        match = self.single_pattern.match(text_clean)
-        if match and match.group(1):
-            return int(match.group(1))
-        return 1  # Default to latest
+        match = REFERENCE_SCREENSHOT_PATTERN.match(text_clean)
+        self._last_match = (text, match)
+        return match
+
+    def matches(self, text: str) -> bool:
+        """Check if text matches reference screenshot command."""
+        return self._match(text) is not None
 
     def execute(self, context: CommandContext, text: str) -> Optional[str]:
         """Find screenshot(s) and return path(s) to be typed."""
@@ -156,34 +242,41 @@ class ReferenceScreenshotCommand(Command):
             # Check if screenshots directory exists
             if not self.screenshots_dir.exists():
                 self.logger.warning(f"Screenshots directory does not exist: {self.screenshots_dir}")
-                print("No screenshots directory found")
                 return None
 
-            # Find all screenshot files
-            screenshot_files = list(self.screenshots_dir.glob("screenshot_*.png"))
+            # Find all screenshot files (names only); the directory is rooted
+            # at the home directory, so joined paths are already absolute
+            directory = os.fspath(self.screenshots_dir)
+            names = [
+                name for name in os.listdir(directory)
+                if name.startswith(SCREENSHOT_PREFIX) and name.endswith(SCREENSHOT_SUFFIX)
+            ]
 
-            if not screenshot_files:
+            if not names:
                 self.logger.warning("No screenshots found in directory")
-                print("No screenshots found")
                 return None
 
-            # Sort by modification time (most recent first)
-            screenshot_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+            # "last N" screenshots, or the Nth most recent one (default latest)
+            match = self._match(text)
+            multi = match.group("multi") if match else None
+            number = match.group("idx") if match else None
+            index = int(multi or number or 1)
 
-            # Check if this is a multi-screenshot request
-            is_multi, count = self._is_multi_request(text)
+            # Only the most recent files that can be returned are ordered
+            # (by timestamped name, most recent first) and turned into paths
+            screenshot_files = [
+                os.path.join(directory, name) for name in heapq.nlargest(max(index, 1), names)
+            ]
 
-            if is_multi:
+            if multi:
                 # Return multiple screenshot paths
-                return self._get_multiple_screenshots(screenshot_files, count)
+                return self._get_multiple_screenshots(screenshot_files, index)
             else:
                 # Return single screenshot path
-                index = self._extract_number(text)
                 return self._get_single_screenshot(screenshot_files, index)
 
         except Exception as e:
             self.logger.error(f"Failed to find screenshot: {e}")
-            print(f"Error finding screenshot: {e}")
             return None
 
     def _get_single_screenshot(self, screenshot_files: list, index: int) -> Optional[str]:
@@ -191,7 +284,7 @@ class ReferenceScreenshotCommand(Command):
         Get a single screenshot path.
 
         Args:
-            screenshot_files: Sorted list of screenshot files
+            screenshot_files: Absolute screenshot paths, most recent first
             index: Screenshot index (1-based)
 
         Returns:
@@ -200,17 +293,12 @@ class ReferenceScreenshotCommand(Command):
         # Check if index is valid
         if index < 1 or index > len(screenshot_files):
             self.logger.warning(f"Invalid screenshot index: {index} (available: 1-{len(screenshot_files)})")
-            print(f"Screenshot #{index} not found (only {len(screenshot_files)} available)")
             return None
 
         # Get the Nth screenshot (index is 1-based, list is 0-based)
-        selected_screenshot = screenshot_files[index - 1]
-
-        # Get absolute path
-        screenshot_path = str(selected_screenshot.absolute())
+        screenshot_path = screenshot_files[index - 1]
 
         self.logger.info(f"Found screenshot #{index}: {screenshot_path}")
-        print(f"Pasting path: {selected_screenshot.name}")
 
         return screenshot_path
 
@@ -219,7 +307,7 @@ class ReferenceScreenshotCommand(Command):
         Get multiple screenshot paths.
 
         Args:
-            screenshot_files: Sorted list of screenshot files
+            screenshot_files: Absolute screenshot paths, most recent first
             count: Number of screenshots to get
 
         Returns:
@@ -230,19 +318,11 @@ class ReferenceScreenshotCommand(Command):
 
         if actual_count < count:
             self.logger.warning(f"Requested {count} screenshots but only {actual_count} available")
-            print(f"Only {actual_count} screenshots available (requested {count})")
-
-        # Get the last N screenshots
-        selected_screenshots = screenshot_files[:actual_count]
-
-        # Get absolute paths
-        screenshot_paths = [str(f.absolute()) for f in selected_screenshots]
 
-        # Join with newlines
-        result = "\n".join(screenshot_paths)
+        # Get the last N screenshots, joined with newlines
+        result = "\n".join(screenshot_files[:actual_count])
 
         self.logger.info(f"Found last {actual_count} screenshots")
-        print(f"Pasting paths of last {actual_count} screenshots")
 
         return result
 
@@ -257,3 +337,7 @@ class ReferenceScreenshotCommand(Command):
     @property
     def examples(self) -> list[str]:
         return ["reference screenshot", "reference screenshot 2", "screenshot last 3", "green shot last 5"]
+
+    @property
+    def trigger_phrases(self) -> FrozenSet[str]:
+        return frozenset({"shot"})  # in every spelling the patterns accept
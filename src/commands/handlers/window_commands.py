@@ -1,12 +1,130 @@
 """Window management command implementations."""
 
+import ctypes
+import platform
+import re
 import time
-from typing import Optional
+from contextlib import ExitStack
+from functools import lru_cache
+from typing import Any, Callable, FrozenSet, Optional, Tuple
 
 from pynput import keyboard
 
 from src.commands.base import Command, CommandContext
-from src.core.events import Event, EventType
+
+MOVE_WINDOW_PHRASES = frozenset({
+    "move window left", "move left", "snap left",
+    "move window right", "move right", "snap right",
+})
+MOVE_WINDOW_PATTERN = re.compile(r"(?:move (?:window )?|snap )(?:left|right)")
+
+_windll = getattr(ctypes, "windll", None)
+_user32 = _windll.user32 if _windll is not None else None
+
+# SendInput (Windows): a whole key chord is handed to the OS in one call
+INPUT_KEYBOARD = 1
+KEYEVENTF_EXTENDEDKEY = 0x0001
+KEYEVENTF_KEYUP = 0x0002
+# Arrow and Windows keys are extended keys
+_EXTENDED_VKS = frozenset({0x25, 0x26, 0x27, 0x28, 0x5B, 0x5C})
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.c_uint16),
+        ("wScan", ctypes.c_uint16),
+        ("dwFlags", ctypes.c_uint32),
+        ("time", ctypes.c_uint32),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    # Only here so the union has the size of the Win32 INPUT union
+    _fields_ = [
+        ("dx", ctypes.c_int32),
+        ("dy", ctypes.c_int32),
+        ("mouseData", ctypes.c_uint32),
+        ("dwFlags", ctypes.c_uint32),
+        ("time", ctypes.c_uint32),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT)]
+
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_uint32), ("u", _INPUTUNION)]
+
+
+@lru_cache(maxsize=None)
+def _chord_inputs(vks: Tuple[int, ...]) -> Any:
+    """
+    Build (once per chord) the INPUT array pressing vks in order, then
+    releasing them in reverse order.
+    """
+    events = [(vk, 0) for vk in vks] + [(vk, KEYEVENTF_KEYUP) for vk in reversed(vks)]
+    inputs = (_INPUT * len(events))()
+    for item, (vk, flags) in zip(inputs, events):
+        item.type = INPUT_KEYBOARD
+        item.u.ki.wVk = vk
+        item.u.ki.dwFlags = flags | (KEYEVENTF_EXTENDEDKEY if vk in _EXTENDED_VKS else 0)
+    return inputs
+
+
+def _send_chord(controller: Any, modifiers: Tuple[keyboard.Key, ...], key: Any) -> None:
+    """
+    Press key while holding modifiers, then release everything.
+
+    On Windows, when driving the real pynput controller, the whole chord is
+    sent with a single SendInput call. Otherwise (other platforms, injected
+    controllers such as test doubles) it is played through the controller.
+
+    Args:
+        controller: Keyboard controller from the command context
+        modifiers: Modifier keys, pressed in order
+        key: Key to tap while the modifiers are held
+    """
+    if _user32 is not None and type(controller) is keyboard.Controller:
+        inputs = _chord_inputs(tuple(k.value.vk for k in (*modifiers, key)))
+        _user32.SendInput(len(inputs), inputs, ctypes.sizeof(_INPUT))
+        return
+
+    with ExitStack() as stack:
+        for modifier in modifiers:
+            stack.enter_context(controller.pressed(modifier))
+        controller.press(key)
+        controller.release(key)
+
+
+# Windows Snap Assist overlay: polled so Escape goes out as soon as it shows
+SNAP_ASSIST_WINDOW_CLASS = "XamlExplorerHostIslandWindow"
+SNAP_ASSIST_POLL_INTERVAL = 0.002
+SNAP_ASSIST_SHOW_TIMEOUT = 0.12
+SNAP_ASSIST_CLOSE_TIMEOUT = 0.03
+
+
+def _snap_assist_visible() -> bool:
+    """Return True if the Snap Assist overlay window is showing."""
+    hwnd = _user32.FindWindowW(SNAP_ASSIST_WINDOW_CLASS, None)
+    return bool(hwnd) and bool(_user32.IsWindowVisible(hwnd))
+
+
+def _wait_until(condition: Callable[[], bool], timeout: float) -> bool:
+    """
+    Poll condition until it holds or timeout seconds pass.
+
+    Returns:
+        True if condition held before the timeout
+    """
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() >= deadline:
+            return False
+        time.sleep(SNAP_ASSIST_POLL_INTERVAL)
+    return True
 
 
 class MoveWindowCommand(Command):
@@ -19,46 +137,32 @@ class MoveWindowCommand(Command):
 
     def matches(self, text: str) -> bool:
         text_clean = self.strip_punctuation(text)
-        return (
-            "move window left" in text_clean
-            or "move left" in text_clean
-            or "snap left" in text_clean
-            or "move window right" in text_clean
-            or "move right" in text_clean
-            or "snap right" in text_clean
-        )
+        return MOVE_WINDOW_PATTERN.search(text_clean) is not None
 
     def execute(self, context: CommandContext, text: str) -> Optional[str]:
         """Snap window to left or right half."""
         text_clean = self.strip_punctuation(text)
 
         # Determine direction
-        if "left" in text_clean:
-            direction = "left"
-            key = keyboard.Key.left
-        else:  # right
-            direction = "right"
-            key = keyboard.Key.right
+        key = keyboard.Key.left if "left" in text_clean else keyboard.Key.right
 
         # Press Win+Direction
-        with context.keyboard_controller.pressed(keyboard.Key.cmd):
-            context.keyboard_controller.press(key)
-            context.keyboard_controller.release(key)
+        _send_chord(context.keyboard_controller, (keyboard.Key.cmd,), key)
 
         # Dismiss Windows Snap Assist overlay (press Escape to dismiss without selecting)
-        time.sleep(0.1)
-        context.keyboard_controller.press(keyboard.Key.esc)
-        context.keyboard_controller.release(keyboard.Key.esc)
-        time.sleep(0.05)
-
-        # Publish event
-        if context.event_bus:
-            context.event_bus.publish(
-                Event(
-                    EventType.COMMAND_EXECUTED,
-                    {"command": "MoveWindowCommand", "direction": direction, "text": text}
-                )
-            )
+        if _user32 is not None:
+            _wait_until(_snap_assist_visible, SNAP_ASSIST_SHOW_TIMEOUT)
+            context.keyboard_controller.press(keyboard.Key.esc)
+            context.keyboard_controller.release(keyboard.Key.esc)
+            _wait_until(lambda: not _snap_assist_visible(), SNAP_ASSIST_CLOSE_TIMEOUT)
+        else:
+            time.sleep(0.1)
+            context.keyboard_controller.press(keyboard.Key.esc)
+            context.keyboard_controller.release(keyboard.Key.esc)
+            time.sleep(0.05)
+
+        # Note: CommandRegistry automatically publishes COMMAND_EXECUTED event
+        # after execute() completes, so we don't need to publish it here
 
         return None
 
@@ -74,6 +178,10 @@ class MoveWindowCommand(Command):
     def examples(self) -> list[str]:
         return ["move left", "move right", "move window left", "move window right", "snap left", "snap right"]
 
+    @property
+    def trigger_phrases(self) -> FrozenSet[str]:
+        return MOVE_WINDOW_PHRASES
+
 
 class MinimizeCommand(Command):
     """
@@ -82,31 +190,21 @@ class MinimizeCommand(Command):
     Uses Win+Down on Windows, Cmd+M on other platforms.
     """
 
+    def __init__(self):
+        """Initialize minimize command, choosing the key for this platform once."""
+        # Windows: Win+Down, Others: Cmd+M
+        self._minimize_key = keyboard.Key.down if platform.system() == "Windows" else "m"
+
     def matches(self, text: str) -> bool:
         text_clean = self.strip_punctuation(text)
         return "minimize" in text_clean or "minimise" in text_clean
 
     def execute(self, context: CommandContext, text: str) -> Optional[str]:
         """Minimize window."""
-        # Windows: Win+Down, Others: Cmd+M
-        import platform
-        if platform.system() == "Windows":
-            with context.keyboard_controller.pressed(keyboard.Key.cmd):
-                context.keyboard_controller.press(keyboard.Key.down)
-                context.keyboard_controller.release(keyboard.Key.down)
-        else:
-            with context.keyboard_controller.pressed(keyboard.Key.cmd):
-                context.keyboard_controller.press("m")
-                context.keyboard_controller.release("m")
-
-        # Publish event
-        if context.event_bus:
-            context.event_bus.publish(
-                Event(
-                    EventType.COMMAND_EXECUTED,
-                    {"command": "MinimizeCommand", "text": text}
-                )
-            )
+        _send_chord(context.keyboard_controller, (keyboard.Key.cmd,), self._minimize_key)
+
+        # Note: CommandRegistry automatically publishes COMMAND_EXECUTED event
+        # after execute() completes, so we don't need to publish it here
 
         return None
 
@@ -122,6 +220,10 @@ class MinimizeCommand(Command):
     def examples(self) -> list[str]:
         return ["minimize", "minimise"]
 
+    @property
+    def trigger_phrases(self) -> FrozenSet[str]:
+        return frozenset({"minimize", "minimise"})
+
 
 class MaximizeCommand(Command):
     """
@@ -137,18 +239,10 @@ class MaximizeCommand(Command):
     def execute(self, context: CommandContext, text: str) -> Optional[str]:
         """Maximize window."""
         # Windows: Win+Up
-        with context.keyboard_controller.pressed(keyboard.Key.cmd):
-            context.keyboard_controller.press(keyboard.Key.up)
-            context.keyboard_controller.release(keyboard.Key.up)
-
-        # Publish event
-        if context.event_bus:
-            context.event_bus.publish(
-                Event(
-                    EventType.COMMAND_EXECUTED,
-                    {"command": "MaximizeCommand", "text": text}
-                )
-            )
+        _send_chord(context.keyboard_controller, (keyboard.Key.cmd,), keyboard.Key.up)
+
+        # Note: CommandRegistry automatically publishes COMMAND_EXECUTED event
+        # after execute() completes, so we don't need to publish it here
 
         return None
 
@@ -164,6 +258,10 @@ class MaximizeCommand(Command):
     def examples(self) -> list[str]:
         return ["maximize", "maximise"]
 
+    @property
+    def trigger_phrases(self) -> FrozenSet[str]:
+        return frozenset({"maximize", "maximise"})
+
 
 class CloseWindowCommand(Command):
     """
@@ -179,18 +277,10 @@ class CloseWindowCommand(Command):
     def execute(self, context: CommandContext, text: str) -> Optional[str]:
         """Close window."""
         # Alt+F4 to close window
-        with context.keyboard_controller.pressed(keyboard.Key.alt):
-            context.keyboard_controller.press(keyboard.Key.f4)
-            context.keyboard_controller.release(keyboard.Key.f4)
-
-        # Publish event
-        if context.event_bus:
-            context.event_bus.publish(
-                Event(
-                    EventType.COMMAND_EXECUTED,
-                    {"command": "CloseWindowCommand", "text": text}
-                )
-            )
+        _send_chord(context.keyboard_controller, (keyboard.Key.alt,), keyboard.Key.f4)
+
+        # Note: CommandRegistry automatically publishes COMMAND_EXECUTED event
+        # after execute() completes, so we don't need to publish it here
 
         return None
 
@@ -206,6 +296,10 @@ class CloseWindowCommand(Command):
     def examples(self) -> list[str]:
         return ["close", "close window"]
 
+    @property
+    def trigger_phrases(self) -> FrozenSet[str]:
+        return frozenset({"close"})
+
 
 class SwitchWindowCommand(Command):
     """
@@ -228,26 +322,17 @@ class SwitchWindowCommand(Command):
         # Check for previous/back
         if "previous" in text_clean or "back" in text_clean:
             # Alt+Shift+Tab for previous window
-            with context.keyboard_controller.pressed(keyboard.Key.alt):
-                with context.keyboard_controller.pressed(keyboard.Key.shift):
-                    context.keyboard_controller.press(keyboard.Key.tab)
-                    context.keyboard_controller.release(keyboard.Key.tab)
-            direction = "previous"
+            _send_chord(
+                context.keyboard_controller,
+                (keyboard.Key.alt, keyboard.Key.shift),
+                keyboard.Key.tab,
+            )
         else:
             # Alt+Tab for next window
-            with context.keyboard_controller.pressed(keyboard.Key.alt):
-                context.keyboard_controller.press(keyboard.Key.tab)
-                context.keyboard_controller.release(keyboard.Key.tab)
-            direction = "next"
-
-        # Publish event
-        if context.event_bus:
-            context.event_bus.publish(
-                Event(
-                    EventType.COMMAND_EXECUTED,
-                    {"command": "SwitchWindowCommand", "direction": direction, "text": text}
-                )
-            )
+            _send_chord(context.keyboard_controller, (keyboard.Key.alt,), keyboard.Key.tab)
+
+        # Note: CommandRegistry automatically publishes COMMAND_EXECUTED event
+        # after execute() completes, so we don't need to publish it here
 
         return None
 
@@ -263,6 +348,10 @@ class SwitchWindowCommand(Command):
     def examples(self) -> list[str]:
         return ["switch", "switch window", "switch window previous"]
 
+    @property
+    def trigger_phrases(self) -> FrozenSet[str]:
+        return frozenset({"switch"})
+
 
 class CenterWindowCommand(Command):
     """
@@ -285,14 +374,8 @@ class CenterWindowCommand(Command):
         # For now, this is a placeholder that could be enhanced later
         # with pywinauto or similar
 
-        # Publish event
-        if context.event_bus:
-            context.event_bus.publish(
-                Event(
-                    EventType.COMMAND_EXECUTED,
-                    {"command": "CenterWindowCommand", "text": text}
-                )
-            )
+        # Note: CommandRegistry automatically publishes COMMAND_EXECUTED event
+        # after execute() completes, so we don't need to publish it here
 
         return None
 
@@ -307,3 +390,7 @@ class CenterWindowCommand(Command):
     @property
     def examples(self) -> list[str]:
         return ["center window", "centre window"]
+
+    @property
+    def trigger_phrases(self) -> FrozenSet[str]:
+        return frozenset({"center window", "centre window"})
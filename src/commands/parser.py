@@ -3,15 +3,44 @@
 import os
 import re
 from difflib import SequenceMatcher
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple, Union
 
-import yaml
+try:
+    import rapidfuzz
+    import rapidfuzz.fuzz
+    import rapidfuzz.process
+except ImportError:
+    rapidfuzz = None
+
+from src.core.config import load_yaml_cached
 
 
 # Constants for parser configuration
 DEFAULT_IGNORED_WORDS = ["thank", "you", "thanks", "please"]
 DEFAULT_FUZZY_THRESHOLD = 0.8
 NUMBER_MAPPINGS_FILENAME = "number_mappings.yaml"
+DIGITS_PATTERN = re.compile(r"\d+")
+# normalize_text(): punctuation to drop (hyphens and apostrophes are kept)
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s\-']")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+# filter_ignored_words(): punctuation a word may carry and still be ignored
+IGNORED_WORD_PUNCTUATION = ".,!?;:"
+# Most string pairs whose fuzzy ratio is remembered
+FUZZY_RATIO_CACHE_SIZE = 4096
+
+
+def _lower(text: str) -> str:
+    """Lowercase text, skipping the copy for already-lowercase ASCII (typical ASR output)."""
+    return text if text.isascii() and text.islower() else text.lower()
+
+
+@lru_cache(maxsize=FUZZY_RATIO_CACHE_SIZE)
+def _fuzzy_ratio(text1: str, text2: str) -> float:
+    """Similarity ratio of two strings (memoized: utterances repeat against the same phrases)."""
+    if rapidfuzz is not None:
+        return rapidfuzz.fuzz.ratio(text1, text2) / 100.0
+    return SequenceMatcher(None, text1, text2).ratio()
 
 
 class CommandParser:
@@ -56,13 +85,119 @@ class CommandParser:
             ignored_words: Optional custom list of words to filter
                           (uses DEFAULT_IGNORED_WORDS if not provided)
         """
-        self.number_mappings = number_mappings or self._load_number_mappings()
+        # Loaded from number_mappings.yaml on first use (see number_mappings)
+        self._number_mappings: Optional[Dict[str, int]] = number_mappings or None
+        # Mappings the number word pattern was compiled from, and the pattern
+        self._number_pattern: Optional[Tuple[Dict[str, int], Pattern[str]]] = None
         self.ignored_words = set(ignored_words or DEFAULT_IGNORED_WORDS)
+        self._ignored_pattern = self._compile_ignored_pattern(self.ignored_words)
+
+        # Last extract_numbers() input and result: a command's matches() and
+        # execute() usually parse the same utterance back to back
+        self._last_extraction: Optional[Tuple[str, Tuple[int, ...]]] = None
+
+    @property
+    def number_mappings(self) -> Dict[str, int]:
+        """
+        Number word mappings (including homophones) to integers.
+
+        Loaded from number_mappings.yaml on first access unless given to the
+        constructor, so parsers that never handle numbers skip the file.
+        Assign a new dictionary rather than editing it in place: number
+        extraction uses a pattern compiled from the current one.
+        """
+        if self._number_mappings is None:
+            self._number_mappings = self._load_number_mappings()
+        return self._number_mappings
+
+    @number_mappings.setter
+    def number_mappings(self, value: Dict[str, int]) -> None:
+        self._number_mappings = value
+        # The remembered extraction was computed with the old mappings
+        self._last_extraction = None
+
+    def _number_word_pattern(self) -> Pattern[str]:
+        """Return the number word pattern for the current mappings, compiling it if needed."""
+        mappings = self.number_mappings
+        cached = self._number_pattern
+        if cached is None or cached[0] is not mappings:
+            cached = self._number_pattern = (mappings, self._compile_number_pattern(mappings))
+        return cached[1]
+
+    @staticmethod
+    def _compile_number_pattern(mappings: Dict[str, int]) -> Pattern[str]:
+        """
+        Compile a pattern matching whole whitespace-delimited number words.
+
+        Group 1 and 2 capture a tens word (20, 30, ..., 90) followed by a
+        units word (1-9); group 3 captures any other single number word.
+
+        Args:
+            mappings: Number word mappings
+
+        Returns:
+            Compiled pattern
+        """
+        # Only words a lowercased single token can equal
+        words = [
+            word
+            for word, num in mappings.items()
+            if num is not None and word and word == word.lower() and "".join(word.split()) == word
+        ]
+
+        def alternation(group: List[str]) -> str:
+            # Longest first so a shorter word can't shadow one it prefixes
+            ordered = sorted(group, key=len, reverse=True)
+            return "|".join(re.escape(word) for word in ordered) or "(?!)"
+
+        tens = [word for word in words if 20 <= mappings[word] <= 90 and mappings[word] % 10 == 0]
+        units = [word for word in words if 1 <= mappings[word] <= 9]
+        return re.compile(
+            rf"(?<!\S)(?:({alternation(tens)})\s+({alternation(units)})"
+            rf"|({alternation(words)}))(?!\S)"
+        )
+
+    @staticmethod
+    def _compile_ignored_pattern(ignored_words: Iterable[str]) -> Pattern[str]:
+        """
+        Compile a pattern matching whole whitespace-delimited ignored words.
+
+        A word may carry the punctuation filter_ignored_words() strips.
+
+        Args:
+            ignored_words: Words to match (case-insensitively)
+
+        Returns:
+            Compiled pattern
+        """
+        # Only words a stripped, lowercased single token can equal; longest
+        # first so a shorter word can't shadow one it prefixes
+        words = sorted(
+            (
+                word
+                for word in ignored_words
+                if word == word.lower().strip(IGNORED_WORD_PUNCTUATION)
+                and "".join(word.split()) == word
+            ),
+            key=len,
+            reverse=True,
+        )
+        if not words:
+            return re.compile(r"(?!)")
+        alternation = "|".join(re.escape(word) for word in words)
+        return re.compile(
+            rf"(?<!\S)[{IGNORED_WORD_PUNCTUATION}]*(?:{alternation})"
+            rf"[{IGNORED_WORD_PUNCTUATION}]*(?!\S)",
+            re.IGNORECASE,
+        )
 
     def _load_number_mappings(self) -> Dict[str, int]:
         """
         Load number word mappings from number_mappings.yaml.
 
+        Parsed through a JSON sidecar cache, so only the first start after the
+        file changes pays for YAML parsing.
+
         Returns:
             Dictionary mapping number words (including homophones) to integers
         """
@@ -70,9 +205,8 @@ class CommandParser:
             # Get project root (3 levels up from src/commands/parser.py)
             project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
             mappings_file = os.path.join(project_root, NUMBER_MAPPINGS_FILENAME)
-            with open(mappings_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                return data.get("number_words", {})
+            data = load_yaml_cached(mappings_file)
+            return data.get("number_words", {})
         except FileNotFoundError:
             # Fallback to basic mappings
             return {
@@ -127,36 +261,28 @@ class CommandParser:
             >>> parser.extract_numbers("sixty nine")
             [69]
         """
-        numbers = []
+        last = self._last_extraction
+        if last is not None and last[0] == text:
+            return list(last[1])
 
+        numbers = self._extract_numbers(text)
+        self._last_extraction = (text, tuple(numbers))
+        return numbers
+
+    def _extract_numbers(self, text: str) -> List[int]:
+        """Extract numbers from text without consulting the last-result cache."""
         # First try to find digit numbers
-        digit_numbers = re.findall(r"\d+", text)
+        digit_numbers = DIGITS_PATTERN.findall(text)
         if digit_numbers:
             return [int(n) for n in digit_numbers]
 
-        # If no digits, try word numbers (including homophones)
-        words = text.lower().split()
-        i = 0
-        while i < len(words):
-            word = words[i]
-            if word in self.number_mappings:
-                num = self.number_mappings[word]
-
-                # Check for compound numbers (e.g., "sixty nine" -> 69)
-                # If current number is a tens (20, 30, ..., 90) and next word is a units (1-9)
-                if num >= 20 and num <= 90 and num % 10 == 0:
-                    if i + 1 < len(words) and words[i + 1] in self.number_mappings:
-                        next_num = self.number_mappings[words[i + 1]]
-                        if 1 <= next_num <= 9:
-                            # Combine tens + units
-                            numbers.append(num + next_num)
-                            i += 2  # Skip both words
-                            continue
-
-                numbers.append(num)
-            i += 1
-
-        return numbers
+        # If no digits, try word numbers (including homophones): one regex pass
+        # finds compound numbers (e.g., "sixty nine" -> 69) and single words
+        mappings = self.number_mappings
+        return [
+            mappings[tens] + mappings[units] if tens else mappings[word]
+            for tens, units, word in self._number_word_pattern().findall(_lower(text))
+        ]
 
     def contains_numbers(self, text: str) -> bool:
         """
@@ -180,13 +306,8 @@ class CommandParser:
         if any(c.isdigit() for c in text):
             return True
 
-        # Check for number words
-        words = text.lower().split()
-        for word in words:
-            if word in self.number_mappings:
-                return True
-
-        return False
+        # Check for number words (the keys view tests membership in C)
+        return not self.number_mappings.keys().isdisjoint(_lower(text).split())
 
     def is_lone_number(self, text: str) -> bool:
         """
@@ -212,11 +333,12 @@ class CommandParser:
         if text.isdigit():
             return True
 
-        # Check if it's a single number word
-        if text.lower() in self.number_mappings:
-            return True
+        # Several words (the usual case) can't be a single number word
+        if " " in text:
+            return False
 
-        return False
+        # Check if it's a single number word
+        return _lower(text) in self.number_mappings
 
     def parse_number(self, text: str) -> Optional[int]:
         """
@@ -245,10 +367,7 @@ class CommandParser:
             return int(text)
 
         # Try parsing as number word
-        if text.lower() in self.number_mappings:
-            return self.number_mappings[text.lower()]
-
-        return None
+        return self.number_mappings.get(_lower(text))
 
     def filter_ignored_words(self, text: str) -> str:
         """
@@ -266,16 +385,8 @@ class CommandParser:
             >>> parser.filter_ignored_words("thank you for clicking")
             "for clicking"
         """
-        words = text.split()
-        filtered_words = []
-
-        for word in words:
-            # Strip punctuation from word for comparison
-            word_clean = word.strip(".,!?;:").lower()
-            if word_clean not in self.ignored_words:
-                filtered_words.append(word)
-
-        return " ".join(filtered_words).strip()
+        text = self._ignored_pattern.sub("", text)
+        return WHITESPACE_PATTERN.sub(" ", text).strip()
 
     def normalize_text(self, text: str) -> str:
         """
@@ -297,13 +408,13 @@ class CommandParser:
             "click 5"
         """
         # Convert to lowercase
-        text = text.lower()
+        text = _lower(text)
 
         # Remove punctuation (but keep hyphens and apostrophes)
-        text = re.sub(r"[^\w\s\-']", "", text)
+        text = PUNCTUATION_PATTERN.sub("", text)
 
         # Collapse multiple spaces
-        text = re.sub(r"\s+", " ", text)
+        text = WHITESPACE_PATTERN.sub(" ", text)
 
         return text.strip()
 
@@ -317,8 +428,9 @@ class CommandParser:
         """
         Calculate fuzzy similarity between two strings.
 
-        Uses SequenceMatcher to compute similarity ratio. Useful for handling
-        slight variations in voice commands.
+        Uses RapidFuzz's native ratio when installed, falling back to
+        difflib's SequenceMatcher. Useful for handling slight variations in
+        voice commands.
 
         Args:
             text1: First text string
@@ -339,7 +451,7 @@ class CommandParser:
             text1 = self.normalize_text(text1)
             text2 = self.normalize_text(text2)
 
-        return SequenceMatcher(None, text1, text2).ratio()
+        return _fuzzy_ratio(text1, text2)
 
     def is_fuzzy_match(
         self,
@@ -366,16 +478,77 @@ class CommandParser:
             >>> parser.is_fuzzy_match("click", "scroll", threshold=0.7)
             False
         """
-        score = self.fuzzy_match(text1, text2, threshold, normalize)
+        if normalize:
+            text1 = self.normalize_text(text1)
+            text2 = self.normalize_text(text2)
+
+        if text1 == text2:
+            return True
+
+        # Both ratios are 2 * matches / total length, and matches can't exceed
+        # the shorter string, so lengths alone can rule a pair out
+        total = len(text1) + len(text2)
+        if 2 * min(len(text1), len(text2)) < threshold * total:
+            return False
+
+        score = self.fuzzy_match(text1, text2, threshold, normalize=False)
         return score >= threshold
 
-    def extract_pattern(self, text: str, pattern: str) -> Optional[re.Match]:
+    def best_fuzzy_match(
+        self,
+        text: str,
+        candidates: Iterable[str],
+        threshold: float = DEFAULT_FUZZY_THRESHOLD,
+        normalize: bool = True,
+    ) -> Optional[Tuple[str, float]]:
+        """
+        Find the candidate that best fuzzy matches text.
+
+        Scores all candidates in one native call when RapidFuzz is installed.
+
+        Args:
+            text: Text to match
+            candidates: Strings to match against
+            threshold: Minimum similarity threshold (0.0 to 1.0)
+            normalize: Whether to normalize text before matching
+
+        Returns:
+            Tuple of (candidate, score) for the best match scoring at least
+            threshold, or None if no candidate does
+
+        Example:
+            >>> parser.best_fuzzy_match("clik 5", ["click 5", "scroll down"])
+            ("click 5", 0.92...)
+        """
+        if rapidfuzz is not None:
+            result = rapidfuzz.process.extractOne(
+                text,
+                candidates,
+                scorer=rapidfuzz.fuzz.ratio,
+                processor=self.normalize_text if normalize else None,
+                score_cutoff=threshold * 100,
+            )
+            if result is None:
+                return None
+            return result[0], result[1] / 100.0
+
+        best = None
+        for candidate in candidates:
+            score = self.fuzzy_match(text, candidate, threshold, normalize)
+            if score >= threshold and (best is None or score > best[1]):
+                best = (candidate, score)
+        return best
+
+    def extract_pattern(
+        self, text: str, pattern: Union[str, Pattern[str]]
+    ) -> Optional[re.Match]:
         """
         Extract pattern from text using regex.
 
         Args:
             text: Text to search
-            pattern: Regex pattern to match
+            pattern: Regex pattern to match (case-insensitive), or a compiled
+                pattern, which is used as-is with its own flags
 
         Returns:
             Match object if pattern found, None otherwise
@@ -385,7 +558,9 @@ class CommandParser:
             >>> match.group(1)
             '5'
         """
-        return re.search(pattern, text, re.IGNORECASE)
+        if isinstance(pattern, str):
+            return re.search(pattern, text, re.IGNORECASE)
+        return pattern.search(text)
 
     def split_command_and_args(self, text: str) -> tuple[str, str]:
         """
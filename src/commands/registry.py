@@ -1,10 +1,12 @@
 """Command registry for managing and executing voice commands."""
 
+import bisect
 import logging
-from typing import List, Optional, Tuple
+import re
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
 
 from src.commands.base import Command, CommandContext, CommandExecutionError
-from src.core.events import Event, EventBus, EventType
+from src.core.events import EventBus, EventType
 
 
 class CommandRegistry:
@@ -40,9 +42,20 @@ class CommandRegistry:
             event_bus: Optional event bus for publishing command events
         """
         self.commands: List[Command] = []
+        # Negated priorities parallel to self.commands, ascending, for bisect
+        self._sort_keys: List[int] = []
         self.event_bus = event_bus
         self.logger = logging.getLogger("CommandRegistry")
 
+        # Index of candidate commands by first word and by whether any trigger
+        # phrase occurs in the text (rebuilt lazily after changes)
+        self._candidates_by_word: Optional[Dict[Tuple[str, bool], List[Command]]] = None
+        self._wildcard_commands: Dict[bool, List[Command]] = {}
+        self._first_word_prefixes: Tuple[str, ...] = ()
+        self._candidates_by_prefixes: Dict[Tuple[Tuple[str, ...], bool], List[Command]] = {}
+        self._trigger_pattern: Optional[Pattern[str]] = None
+        self._candidates_by_text: Dict[str, List[Command]] = {}
+
     def register(self, command: Command) -> None:
         """
         Register a command with the registry.
@@ -52,14 +65,37 @@ class CommandRegistry:
         Args:
             command: Command instance to register
         """
-        self.commands.append(command)
-        # Keep commands sorted by priority (highest first)
-        self.commands.sort(key=lambda c: c.priority, reverse=True)
+        # Insert after equal priorities, keeping commands sorted (highest first)
+        index = bisect.bisect_right(self._sort_keys, -command.priority)
+        self._sort_keys.insert(index, -command.priority)
+        self.commands.insert(index, command)
+        self._candidates_by_word = None
         self.logger.debug(
-            f"Registered command: {command.__class__.__name__} "
-            f"(priority: {command.priority})"
+            "Registered command: %s (priority: %s)",
+            command.__class__.__name__,
+            command.priority,
         )
 
+    def register_many(self, commands: Iterable[Command]) -> None:
+        """
+        Register several commands at once.
+
+        Equivalent to calling register() for each command, but the command
+        list is sorted and the lookup index invalidated only once.
+
+        Args:
+            commands: Command instances to register
+        """
+        added = list(commands)
+        if not added:
+            return
+        self.commands.extend(added)
+        # Stable sort keeps registration order among equal priorities
+        self.commands.sort(key=lambda c: c.priority, reverse=True)
+        self._sort_keys = [-c.priority for c in self.commands]
+        self._candidates_by_word = None
+        self.logger.debug("Registered %d commands", len(added))
+
     def unregister(self, command: Command) -> bool:
         """
         Unregister a command from the registry.
@@ -71,8 +107,11 @@ class CommandRegistry:
             True if command was found and removed, False otherwise
         """
         if command in self.commands:
-            self.commands.remove(command)
-            self.logger.debug(f"Unregistered command: {command.__class__.__name__}")
+            index = self.commands.index(command)
+            del self.commands[index]
+            del self._sort_keys[index]
+            self._candidates_by_word = None
+            self.logger.debug("Unregistered command: %s", command.__class__.__name__)
             return True
         return False
 
@@ -80,7 +119,9 @@ class CommandRegistry:
         """Clear all registered commands."""
         count = len(self.commands)
         self.commands.clear()
-        self.logger.debug(f"Cleared {count} commands from registry")
+        self._sort_keys.clear()
+        self._candidates_by_word = None
+        self.logger.debug("Cleared %d commands from registry", count)
 
     def get_commands(self, enabled_only: bool = True) -> List[Command]:
         """
@@ -96,11 +137,152 @@ class CommandRegistry:
             return [cmd for cmd in self.commands if cmd.enabled]
         return self.commands.copy()
 
+    @staticmethod
+    def _accepts_first_word(command: Command, word: str) -> bool:
+        """
+        Check whether a command could match text starting with word.
+
+        Args:
+            command: Command to check
+            word: First word of the punctuation-stripped text
+
+        Returns:
+            True if the command declares neither first_words nor
+            first_word_prefixes, or if word satisfies one of them
+        """
+        first_words = command.first_words
+        prefixes = command.first_word_prefixes
+        if first_words is None and prefixes is None:
+            return True
+        return (first_words is not None and word in first_words) or (
+            prefixes is not None and word.startswith(tuple(prefixes))
+        )
+
+    def _collect_candidates(
+        self,
+        word: str,
+        phrase_found: bool,
+        text: Optional[str] = None
+    ) -> List[Command]:
+        """
+        List the commands that could match text, in priority order.
+
+        Args:
+            word: First word of the punctuation-stripped text
+            phrase_found: Whether the text contains any declared trigger phrase
+            text: The whole punctuation-stripped text if it is a declared exact
+                phrase, otherwise None
+
+        Returns:
+            Commands accepting word whose trigger phrases (if any) may be
+            present and whose exact phrases (if any) include text
+        """
+        return [
+            cmd for cmd in self.commands
+            if self._accepts_first_word(cmd, word)
+            and (phrase_found or cmd.trigger_phrases is None)
+            and (cmd.exact_phrases is None or text in cmd.exact_phrases)
+        ]
+
+    def _build_index(self) -> Dict[Tuple[str, bool], List[Command]]:
+        """
+        Index registered commands by the first words and phrases they can match.
+
+        Each (word, phrase_found) key maps to the commands declaring word in
+        first_words (or a prefix of it in first_word_prefixes) plus every
+        command declaring neither, dropping commands with trigger_phrases when
+        phrase_found is False. All trigger phrases are compiled into a single
+        pattern so each utterance is scanned for them once. Commands with
+        exact_phrases are left out of these lists; each declared exact phrase
+        gets its own complete candidate list instead.
+
+        Returns:
+            Dictionary mapping (first word, phrase found) to candidate commands
+        """
+        words = set()
+        prefixes = set()
+        phrases = set()
+        exact = set()
+        for command in self.commands:
+            if command.first_words is not None:
+                words.update(command.first_words)
+            if command.first_word_prefixes is not None:
+                prefixes.update(command.first_word_prefixes)
+            if command.trigger_phrases is not None:
+                phrases.update(command.trigger_phrases)
+            if command.exact_phrases is not None:
+                exact.update(command.exact_phrases)
+        self._first_word_prefixes = tuple(sorted(prefixes))
+        self._trigger_pattern = (
+            re.compile("|".join(re.escape(phrase) for phrase in sorted(phrases)))
+            if phrases else None
+        )
+        self._candidates_by_prefixes = {}
+
+        # "" is never a first word or prefix, so it selects the unindexed commands
+        self._wildcard_commands = {
+            found: self._collect_candidates("", found) for found in (False, True)
+        }
+        self._candidates_by_word = {
+            (word, found): self._collect_candidates(word, found)
+            for word in words
+            for found in (False, True)
+        }
+        pattern = self._trigger_pattern
+        self._candidates_by_text = {
+            text: self._collect_candidates(
+                Command.first_word(text),
+                pattern is not None and pattern.search(text) is not None,
+                text,
+            )
+            for text in exact
+        }
+        return self._candidates_by_word
+
+    def _get_candidates(self, text: str) -> List[Command]:
+        """
+        Get the commands that could match text, in priority order.
+
+        Args:
+            text: Text to match against commands
+
+        Returns:
+            Candidate commands (sorted by priority)
+        """
+        index = self._candidates_by_word
+        if index is None:
+            index = self._build_index()
+        text_clean = Command.strip_punctuation(text)
+        candidates = self._candidates_by_text.get(text_clean)
+        if candidates is not None:
+            return candidates
+
+        word = Command.first_word(text_clean)
+        pattern = self._trigger_pattern
+        found = pattern is not None and pattern.search(text_clean) is not None
+
+        candidates = index.get((word, found))
+        if candidates is not None:
+            return candidates
+
+        # Not an indexed word: candidates only depend on which prefixes it has
+        matched = tuple(p for p in self._first_word_prefixes if word.startswith(p))
+        if not matched:
+            return self._wildcard_commands[found]
+        candidates = self._candidates_by_prefixes.get((matched, found))
+        if candidates is None:
+            candidates = self._collect_candidates(word, found)
+            self._candidates_by_prefixes[(matched, found)] = candidates
+        return candidates
+
     def find_matching_command(self, text: str, enabled_only: bool = True) -> Optional[Command]:
         """
         Find the first command that matches the given text.
 
-        Commands are checked in priority order (highest first).
+        Commands are checked in priority order (highest first). Commands that
+        declare first_words or first_word_prefixes are only checked when the
+        text starts with one of them, and commands that declare
+        trigger_phrases only when the text contains one of them.
 
         Args:
             text: Text to match against commands
@@ -109,22 +291,24 @@ class CommandRegistry:
         Returns:
             First matching command, or None if no match
         """
-        commands = self.get_commands(enabled_only=enabled_only)
-
-        for command in commands:
+        for command in self._get_candidates(text):
+            if enabled_only and not command.enabled:
+                continue
             try:
                 if command.matches(text):
-                    self.logger.debug(
-                        f"Command matched: {command.__class__.__name__} "
-                        f"(priority: {command.priority})"
-                    )
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(
+                            "Command matched: %s (priority: %s)",
+                            command.__class__.__name__,
+                            command.priority,
+                        )
                     return command
             except Exception as e:
                 self.logger.error(
-                    f"Error in {command.__class__.__name__}.matches(): {e}"
+                    "Error in %s.matches(): %s", command.__class__.__name__, e
                 )
 
-        self.logger.debug(f"No command matched text: '{text}'")
+        self.logger.debug("No command matched text: '%s'", text)
         return None
 
     def process(
@@ -160,112 +344,103 @@ class CommandRegistry:
         command = self.find_matching_command(text, enabled_only=enabled_only)
         if not command:
             return None, False
+        command_class = command.__class__.__name__
 
         # Publish COMMAND_DETECTED event
         if self.event_bus:
-            self.event_bus.publish(
-                Event(
-                    EventType.COMMAND_DETECTED,
-                    {
-                        "command_class": command.__class__.__name__,
-                        "text": text,
-                        "priority": command.priority,
-                    }
-                )
+            self.event_bus.publish_lazy(
+                EventType.COMMAND_DETECTED,
+                lambda: {
+                    "command_class": command_class,
+                    "text": text,
+                    "priority": command.priority,
+                },
             )
 
         # Validate command
         try:
             if not command.validate(context, text):
                 self.logger.warning(
-                    f"Command validation failed: {command.__class__.__name__}"
+                    "Command validation failed: %s", command_class
                 )
                 if self.event_bus:
-                    self.event_bus.publish(
-                        Event(
-                            EventType.COMMAND_FAILED,
-                            {
-                                "command_class": command.__class__.__name__,
-                                "text": text,
-                                "reason": "validation_failed",
-                            }
-                        )
+                    self.event_bus.publish_lazy(
+                        EventType.COMMAND_FAILED,
+                        lambda: {
+                            "command_class": command_class,
+                            "text": text,
+                            "reason": "validation_failed",
+                        },
                     )
                 return None, False
         except Exception as e:
             self.logger.error(
-                f"Error validating {command.__class__.__name__}: {e}"
+                "Error validating %s: %s", command_class, e
             )
             if self.event_bus:
-                self.event_bus.publish(
-                    Event(
-                        EventType.COMMAND_FAILED,
-                        {
-                            "command_class": command.__class__.__name__,
-                            "text": text,
-                            "reason": "validation_error",
-                            "error": str(e),
-                        }
-                    )
+                self.event_bus.publish_lazy(
+                    EventType.COMMAND_FAILED,
+                    lambda: {
+                        "command_class": command_class,
+                        "text": text,
+                        "reason": "validation_error",
+                        "error": str(e),
+                    },
                 )
             return None, False
 
         # Execute command
         try:
             self.logger.info(
-                f"Executing command: {command.__class__.__name__} "
-                f"with text: '{text}'"
+                "Executing command: %s with text: '%s'",
+                command_class,
+                text,
             )
             result = command.execute(context, text)
 
             # Publish COMMAND_EXECUTED event
             if self.event_bus:
-                self.event_bus.publish(
-                    Event(
-                        EventType.COMMAND_EXECUTED,
-                        {
-                            "command_class": command.__class__.__name__,
-                            "text": text,
-                            "result": result,
-                        }
-                    )
+                self.event_bus.publish_lazy(
+                    EventType.COMMAND_EXECUTED,
+                    lambda: {
+                        "command_class": command_class,
+                        "display_name": command.display_name(text),
+                        "text": text,
+                        "result": result,
+                    },
                 )
 
             return result, True
 
         except CommandExecutionError as e:
-            self.logger.error(f"Command execution failed: {e}")
+            self.logger.error("Command execution failed: %s", e)
             if self.event_bus:
-                self.event_bus.publish(
-                    Event(
-                        EventType.COMMAND_FAILED,
-                        {
-                            "command_class": command.__class__.__name__,
-                            "text": text,
-                            "reason": "execution_error",
-                            "error": str(e),
-                        }
-                    )
+                self.event_bus.publish_lazy(
+                    EventType.COMMAND_FAILED,
+                    lambda: {
+                        "command_class": command_class,
+                        "text": text,
+                        "reason": "execution_error",
+                        "error": str(e),
+                    },
                 )
             raise
 
         except Exception as e:
             self.logger.error(
-                f"Unexpected error executing {command.__class__.__name__}: {e}"
+                "Unexpected error executing %s: %s", command_class, e
             )
             if self.event_bus:
-                self.event_bus.publish(
-                    Event(
-                        EventType.COMMAND_FAILED,
-                        {
-                            "command_class": command.__class__.__name__,
-                            "text": text,
-                            "reason": "unexpected_error",
-                            "error": str(e),
-                        }
-                    )
+                self.event_bus.publish_lazy(
+                    EventType.COMMAND_FAILED,
+                    lambda: {
+                        "command_class": command_class,
+                        "text": text,
+                        "reason": "unexpected_error",
+                        "error": str(e),
+                    },
                 )
-            raise CommandExecutionError(command.__class__.__name__, str(e))
+            raise CommandExecutionError(command_class, str(e))
 
     def get_command_count(self, enabled_only: bool = True) -> int:
         """
@@ -1,11 +1,74 @@
 """Configuration management for the dictation tool."""
 
+import copy
+import json
 import logging
 import os
-from typing import Any, Dict, Optional
+import tempfile
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
+# libyaml's C loader when PyYAML was built with it, same results as SafeLoader
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Suffix of the JSON sidecar written by load_yaml_cached()
+YAML_CACHE_SUFFIX = ".cache.json"
+
+# Most config files ConfigLoader keeps parsed in memory
+CONFIG_CACHE_SIZE = 100
+
+# abs path -> (mtime_ns, size, parsed config), least recently used first
+_config_cache: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+
+
+def load_yaml_cached(path: str) -> Any:
+    """
+    Load a YAML file through a JSON sidecar cache.
+
+    The parsed data is saved next to the file as <path>.cache.json, stamped
+    with the YAML file's mtime and size; later loads read the JSON instead
+    while the stamp still matches. Data that JSON would not round-trip
+    exactly (non-string keys, dates, ...) is never cached.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML data
+
+    Raises:
+        FileNotFoundError: If the YAML file does not exist
+    """
+    stat = os.stat(path)
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    cache_path = path + YAML_CACHE_SUFFIX
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["stamp"] == stamp:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # No usable cache: parse the YAML
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=YAML_LOADER)
+
+    try:
+        if json.loads(json.dumps(data)) == data:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or ".")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"stamp": stamp, "data": data}, f)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+    except (OSError, TypeError, ValueError) as e:
+        logging.debug("Could not write YAML cache %s: %s", cache_path, e)
+    return data
+
 
 class ConfigLoader:
     """
@@ -19,21 +82,37 @@ class ConfigLoader:
         """
         Load configuration from YAML file.
 
+        Parsed files are kept in a process-wide LRU cache keyed by path,
+        mtime and size, so reloading an unchanged file skips parsing. Each
+        caller gets its own deep copy.
+
         Args:
             config_path: Path to the configuration file
 
         Returns:
             Configuration dictionary, or None if loading failed
         """
-        if not os.path.exists(config_path):
+        try:
+            stat = os.stat(config_path)
+        except OSError:
             logging.warning(f"Config file not found at {config_path}")
             return None
 
+        key = os.path.abspath(config_path)
+        cached = _config_cache.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            _config_cache.move_to_end(key)
+            return copy.deepcopy(cached[2])
+
         try:
             with open(config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=YAML_LOADER)
             logging.info(f"Configuration loaded from {config_path}")
-            return config
+            _config_cache[key] = (stat.st_mtime_ns, stat.st_size, config)
+            _config_cache.move_to_end(key)
+            if len(_config_cache) > CONFIG_CACHE_SIZE:
+                _config_cache.popitem(last=False)
+            return copy.deepcopy(config)
         except Exception as e:
             logging.error(f"Error loading config: {e}")
             return None
@@ -56,6 +135,7 @@ class ConfigLoader:
                 "start_beep_duration": 100,
                 "stop_beep_frequency": 600,
                 "stop_beep_duration": 100,
+                "min_rms": 200,
             },
             "model": {
                 "name": "small.en",
@@ -143,6 +223,8 @@ class Config:
             setup_logging: Whether to setup logging (default True)
         """
         self.config_path = config_path
+        # Every key path -> non-None value, built on first get()
+        self._flat: Optional[Dict[Tuple, Any]] = None
         self.config = self._load_config()
         if setup_logging:
             LoggingConfigurator.setup_logging(self.config)
@@ -160,6 +242,50 @@ class Config:
             config = ConfigLoader.get_default_config()
         return config
 
+    @property
+    def config(self) -> Dict:
+        """
+        Configuration dictionary.
+
+        Assign a new dictionary rather than editing nested values in place:
+        get() answers from a lookup table built from the current one.
+        """
+        return self._config
+
+    @config.setter
+    def config(self, value: Dict) -> None:
+        self._config = value
+        self._flat = None
+
+    @staticmethod
+    def _flatten(config: Any) -> Dict[Tuple, Any]:
+        """
+        Map every key path in a nested config to its value.
+
+        Intermediate dictionaries are included, so subtrees can be looked up
+        too. None values are left out, as get() treats them as missing.
+
+        Args:
+            config: Configuration dictionary
+
+        Returns:
+            Dictionary from key tuples to values
+        """
+        flat: Dict[Tuple, Any] = {}
+        if not isinstance(config, dict):
+            return flat
+        pending = [((), config)]
+        while pending:
+            prefix, node = pending.pop()
+            for key, value in node.items():
+                if value is None:
+                    continue
+                path = prefix + (key,)
+                flat[path] = value
+                if isinstance(value, dict):
+                    pending.append((path, value))
+        return flat
+
     def get(self, *keys, default=None) -> Any:
         """
         Get a nested configuration value.
@@ -174,12 +300,9 @@ class Config:
         Example:
             config.get("audio", "sample_rate", default=16000)
         """
-        value = self.config
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-                if value is None:
-                    return default
-            else:
-                return default
-        return value
+        if not keys:
+            return self._config
+        flat = self._flat
+        if flat is None:
+            flat = self._flat = self._flatten(self._config)
+        return flat.get(keys, default)
@@ -1,8 +1,8 @@
 """Event system for decoupled component communication."""
 
 import logging
-from collections import defaultdict
-from typing import Any, Callable, Dict, List, Optional
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
 from enum import Enum, auto
 
 logger = logging.getLogger(__name__)
@@ -18,6 +18,7 @@ class EventType(Enum):
 
     # Transcription events
     TRANSCRIPTION_STARTED = auto()
+    TRANSCRIPTION_PARTIAL = auto()
     TRANSCRIPTION_COMPLETED = auto()
     TRANSCRIPTION_FAILED = auto()
 
@@ -49,6 +50,9 @@ class Event:
         data: Optional dictionary containing event-specific data
     """
 
+    # Not pooled or reused: subscribers may keep references to events
+    __slots__ = ("event_type", "data")
+
     def __init__(self, event_type: EventType, data: Optional[Dict[str, Any]] = None):
         """
         Initialize an event.
@@ -88,7 +92,11 @@ class EventBus:
 
     def __init__(self):
         """Initialize the event bus."""
-        self._subscribers: Dict[EventType, List[Callable[[Event], None]]] = defaultdict(list)
+        # Immutable snapshots, replaced on (un)subscribe, so publish() can
+        # iterate them without copying even if a callback (un)subscribes
+        self._subscribers: Dict[EventType, Tuple[Callable[[Event], None], ...]] = {}
+        # Serializes writers only; publish() reads a snapshot without locking
+        self._subscribers_lock = threading.Lock()
 
     def subscribe(self, event_type: EventType, callback: Callable[[Event], None]) -> None:
         """
@@ -98,8 +106,10 @@ class EventBus:
             event_type: The type of event to subscribe to
             callback: Function to call when event is published (receives Event object)
         """
-        if callback not in self._subscribers[event_type]:
-            self._subscribers[event_type].append(callback)
+        with self._subscribers_lock:
+            callbacks = self._subscribers.get(event_type, ())
+            if callback not in callbacks:
+                self._subscribers[event_type] = callbacks + (callback,)
 
     def unsubscribe(self, event_type: EventType, callback: Callable[[Event], None]) -> None:
         """
@@ -109,8 +119,11 @@ class EventBus:
             event_type: The type of event to unsubscribe from
             callback: The callback function to remove
         """
-        if callback in self._subscribers[event_type]:
-            self._subscribers[event_type].remove(callback)
+        with self._subscribers_lock:
+            callbacks = self._subscribers.get(event_type, ())
+            if callback in callbacks:
+                index = callbacks.index(callback)
+                self._subscribers[event_type] = callbacks[:index] + callbacks[index + 1:]
 
     def publish(self, event: Event) -> None:
         """
@@ -119,16 +132,48 @@ class EventBus:
         Args:
             event: The event to publish
         """
-        for callback in self._subscribers[event.event_type]:
+        callbacks = self._subscribers.get(event.event_type)
+        if not callbacks:
+            return
+        for callback in callbacks:
             try:
                 callback(event)
             except Exception as e:
                 # Log the error but don't stop other callbacks
-                logger.error(f"Error in event callback for {event.event_type.name}: {e}")
+                logger.error("Error in event callback for %s: %s", event.event_type.name, e)
+
+    def publish_lazy(
+        self, event_type: EventType, data_factory: Callable[[], Dict[str, Any]]
+    ) -> None:
+        """
+        Publish an event whose data is only built if someone is subscribed.
+
+        Args:
+            event_type: Type of event to publish
+            data_factory: Called once to build the event data, only when
+                event_type has subscribers
+        """
+        if self.has_subscribers(event_type):
+            self.publish(Event(event_type, data_factory()))
 
     def clear_all(self) -> None:
         """Clear all subscribers (useful for testing)."""
-        self._subscribers.clear()
+        with self._subscribers_lock:
+            self._subscribers.clear()
+
+    def has_subscribers(self, event_type: EventType) -> bool:
+        """
+        Check whether anything is subscribed to an event type.
+
+        Lets hot publishers skip building an Event nobody would receive.
+
+        Args:
+            event_type: The event type to check
+
+        Returns:
+            True if event_type has at least one subscriber
+        """
+        return bool(self._subscribers.get(event_type))
 
     def get_subscriber_count(self, event_type: EventType) -> int:
         """
@@ -140,7 +185,7 @@ class EventBus:
         Returns:
             Number of subscribers
         """
-        return len(self._subscribers[event_type])
+        return len(self._subscribers.get(event_type, ()))
 
 
 # Global event bus instance (singleton pattern)
@@ -9,11 +9,13 @@ This is the core engine that coordinates:
 - Event publishing and lifecycle management
 """
 
+import ctypes
 import logging
 import queue
+import re
 import threading
 import time
-from typing import Optional
+from typing import Optional, Tuple
 
 import numpy as np
 import pyaudio
@@ -21,7 +23,7 @@ from faster_whisper import WhisperModel
 from pynput import keyboard, mouse
 
 from src.audio.feedback import AudioFeedback
-from src.audio.vad import VoiceActivityDetector
+from src.audio.vad import AUDIO_MAX_AMPLITUDE, VoiceActivityDetector
 from src.commands.base import CommandContext
 from src.commands.parser import CommandParser
 from src.commands.registry import CommandRegistry
@@ -36,6 +38,85 @@ from src.overlays.window_overlay import WindowListOverlay
 from src.overlays.base import OverlayType
 from src.transcription.text_processor import TextProcessor
 
+# Most utterances waiting for the transcription worker before new ones are dropped
+TRANSCRIPTION_QUEUE_SIZE = 4
+
+# Default chunk RMS (16-bit amplitude) a recording must reach somewhere to be
+# sent to Whisper; quieter recordings are treated as silence
+DEFAULT_MIN_RMS = 200
+
+# Converts 16-bit PCM samples to Whisper's float range
+INT16_SCALE = np.float32(1.0 / 32768.0)
+
+# Overlay commands show their own UI, so they get no feedback overlay
+FEEDBACK_SKIPPED_COMMANDS = frozenset(
+    {
+        "ShowGridCommand",
+        "ShowElementsCommand",
+        "ShowWindowsCommand",
+        "ShowHelpCommand",
+        "HideOverlayCommand",
+    }
+)
+
+# Capital letters, to space out command class names for display
+CAPITAL_LETTER_PATTERN = re.compile(r"([A-Z])")
+
+# Used when the screen size cannot be queried (e.g. no display)
+DEFAULT_SCREEN_SIZE = (1920, 1080)
+
+# GetSystemMetrics indices for the primary screen's width and height
+SM_CXSCREEN = 0
+SM_CYSCREEN = 1
+
+_windll = getattr(ctypes, "windll", None)
+
+# Primary screen size, queried once per process
+_screen_size: Optional[Tuple[int, int]] = None
+
+
+def _get_screen_size() -> Tuple[int, int]:
+    """
+    Get the primary screen size, querying the platform only on first use.
+
+    Windows reads it with GetSystemMetrics; elsewhere a hidden Tk root is
+    created once to ask the display.
+
+    Returns:
+        Tuple of (width, height) in pixels
+    """
+    global _screen_size
+    if _screen_size is not None:
+        return _screen_size
+
+    try:
+        if _windll is not None:
+            user32 = _windll.user32
+            _screen_size = (
+                user32.GetSystemMetrics(SM_CXSCREEN),
+                user32.GetSystemMetrics(SM_CYSCREEN),
+            )
+        else:
+            import tkinter as tk
+            root = tk.Tk()
+            root.withdraw()  # Hide the window
+            _screen_size = (root.winfo_screenwidth(), root.winfo_screenheight())
+            root.destroy()
+    except Exception as e:
+        logging.getLogger("DictationEngine").warning(
+            "Failed to get screen dimensions: %s, using defaults", e
+        )
+        _screen_size = DEFAULT_SCREEN_SIZE
+
+    return _screen_size
+
+
+# Initial prompt to bias model toward English vocabulary
+# Helps prevent transcription of similar-sounding words from other languages
+WHISPER_INITIAL_PROMPT = (
+    "This is an English voice command for computer control with numbers, clicks, and navigation."
+)
+
 
 class DictationEngine:
     """
@@ -80,6 +161,7 @@ class DictationEngine:
         self.sample_rate = config.get("audio", "sample_rate", default=16000)
         self.channels = config.get("audio", "channels", default=1)
         self.chunk_size = config.get("audio", "chunk_size", default=1024)
+        self.min_rms = config.get("audio", "min_rms", default=DEFAULT_MIN_RMS)
 
         # Voice Activity Detection
         self.vad = VoiceActivityDetector(
@@ -94,10 +176,20 @@ class DictationEngine:
 
         # Recording state
         self.is_recording = False
-        self.audio_queue: queue.Queue[bytes] = queue.Queue()
-        self.audio_frames: list[bytes] = []
+        # Captured audio, one contiguous buffer grown in place per chunk
+        self.audio_buffer = bytearray()
+
+        # Utterances waiting for the transcription worker (started on first use)
+        self._transcription_queue: "queue.Queue[bytes]" = queue.Queue(
+            maxsize=TRANSCRIPTION_QUEUE_SIZE
+        )
+        self._transcription_thread: Optional[threading.Thread] = None
+        self._transcription_lock = threading.Lock()
 
-        # Whisper model
+        # Whisper model and decoding settings
+        self.beam_size = config.get("model", "beam_size", default=5)
+        self.vad_filter = config.get("model", "vad_filter", default=False)
+        self.language = config.get("model", "language", default="en")
         self.model: Optional[WhisperModel] = None
         self.model_loading = False
         self._load_whisper_model()
@@ -107,56 +199,56 @@ class DictationEngine:
         self.mouse_controller = mouse.Controller()
 
         # Get screen dimensions
-        try:
-            import tkinter as tk
-            root = tk.Tk()
-            root.withdraw()  # Hide the window
-            screen_width = root.winfo_screenwidth()
-            screen_height = root.winfo_screenheight()
-            root.destroy()
-        except Exception as e:
-            self.logger.warning(f"Failed to get screen dimensions: {e}, using defaults")
-            screen_width = 1920
-            screen_height = 1080
+        screen_width, screen_height = _get_screen_size()
 
         # Initialize overlay system
         self.overlay_manager = OverlayManager(event_bus=event_bus)
 
-        # Create and register overlays
-        grid_overlay = GridOverlay(
-            screen_width=screen_width,
-            screen_height=screen_height,
-            overlay_manager=self.overlay_manager
+        # Register overlay factories; each overlay (and its UI thread) is
+        # only created the first time it is shown
+        register = self.overlay_manager.register_overlay_factory
+        register(
+            OverlayType.GRID,
+            lambda: GridOverlay(
+                screen_width=screen_width,
+                screen_height=screen_height,
+                overlay_manager=self.overlay_manager
+            ),
         )
-        element_overlay = ElementOverlay(
-            screen_width=screen_width,
-            screen_height=screen_height,
-            overlay_manager=self.overlay_manager
+        register(
+            OverlayType.ELEMENT,
+            lambda: ElementOverlay(
+                screen_width=screen_width,
+                screen_height=screen_height,
+                overlay_manager=self.overlay_manager
+            ),
         )
-        window_overlay = WindowListOverlay(
-            screen_width=screen_width,
-            screen_height=screen_height,
-            overlay_manager=self.overlay_manager
+        register(
+            OverlayType.WINDOW,
+            lambda: WindowListOverlay(
+                screen_width=screen_width,
+                screen_height=screen_height,
+                overlay_manager=self.overlay_manager
+            ),
         )
-        help_overlay = HelpOverlay(
-            screen_width=screen_width,
-            screen_height=screen_height,
-            overlay_manager=self.overlay_manager
+        register(
+            OverlayType.HELP,
+            lambda: HelpOverlay(
+                screen_width=screen_width,
+                screen_height=screen_height,
+                overlay_manager=self.overlay_manager
+            ),
         )
-        feedback_overlay = FeedbackOverlay(
-            screen_width=screen_width,
-            screen_height=screen_height,
-            duration=1.5,  # Show for 1.5 seconds
-            position="top-right"
+        register(
+            OverlayType.FEEDBACK,
+            lambda: FeedbackOverlay(
+                screen_width=screen_width,
+                screen_height=screen_height,
+                duration=1.5,  # Show for 1.5 seconds
+                position="top-right"
+            ),
         )
 
-        # Register overlays with manager
-        self.overlay_manager.register_overlay(OverlayType.GRID, grid_overlay)
-        self.overlay_manager.register_overlay(OverlayType.ELEMENT, element_overlay)
-        self.overlay_manager.register_overlay(OverlayType.WINDOW, window_overlay)
-        self.overlay_manager.register_overlay(OverlayType.HELP, help_overlay)
-        self.overlay_manager.register_overlay(OverlayType.FEEDBACK, feedback_overlay)
-
         # Command context
         self.command_context = CommandContext(
             config=config,
@@ -177,35 +269,31 @@ class DictationEngine:
         Handle command execution events to show feedback overlay.
 
         Args:
-            event: Command execution event with command_class in data
+            event: Command execution event with command_class and optionally
+                display_name in data
         """
         try:
             # Get command class name from event
             command_class = event.data.get("command_class", "Command")
 
             # Skip feedback for overlay commands - they show their own UI
-            overlay_commands = [
-                "ShowGridCommand",
-                "ShowElementsCommand",
-                "ShowWindowsCommand",
-                "ShowHelpCommand",
-                "HideOverlayCommand",
-            ]
-            if command_class in overlay_commands:
+            if command_class in FEEDBACK_SKIPPED_COMMANDS:
                 return
 
-            # Format command name for display (remove "Command" suffix)
-            display_name = command_class.replace("Command", "")
+            # Prefer the name the command chose for this execution
+            display_name = event.data.get("display_name")
+            if not display_name:
+                # Format command name for display (remove "Command" suffix)
+                display_name = command_class.replace("Command", "")
 
-            # Add spaces before capital letters for readability
-            import re
-            display_name = re.sub(r'([A-Z])', r' \1', display_name).strip()
+                # Add spaces before capital letters for readability
+                display_name = CAPITAL_LETTER_PATTERN.sub(r" \1", display_name).strip()
 
             # Show feedback overlay
             self.overlay_manager.show_overlay(OverlayType.FEEDBACK, text=display_name)
 
         except Exception as e:
-            self.logger.error(f"Error showing command feedback: {e}")
+            self.logger.error("Error showing command feedback: %s", e)
 
     def _load_whisper_model(self) -> None:
         """Load Whisper model in background."""
@@ -282,8 +370,7 @@ class DictationEngine:
                 self.audio_feedback.play_beep(frequency, duration, self.pyaudio)
 
             # Reset state
-            self.audio_frames = []
-            self.audio_queue = queue.Queue()
+            self.audio_buffer = bytearray()
             self.vad.reset()
 
             # Open audio stream
@@ -337,8 +424,8 @@ class DictationEngine:
                 duration = self.config.get("audio", "stop_beep_duration", default=100)
                 self.audio_feedback.play_beep(frequency, duration, self.pyaudio)
 
-            # Combine audio frames
-            audio_data = b"".join(self.audio_frames)
+            # Copy out the captured audio
+            audio_data = bytes(self.audio_buffer)
 
             # Publish event
             self.event_bus.publish(
@@ -359,15 +446,14 @@ class DictationEngine:
             return b""
 
     def _audio_callback(self, in_data, frame_count, time_info, status):
-        """Callback for PyAudio stream to capture audio chunks."""
+        """
+        Callback for PyAudio stream to capture audio chunks.
+
+        Runs on PortAudio's realtime thread for every chunk, so it only
+        stores the chunk; RECORDING_STOPPED reports the captured length.
+        """
         if self.is_recording:
-            self.audio_frames.append(in_data)
-            self.event_bus.publish(
-                Event(
-                    EventType.AUDIO_CHUNK_RECEIVED,
-                    {"size": len(in_data), "timestamp": time.time()},
-                )
-            )
+            self.audio_buffer += in_data
         return (in_data, pyaudio.paContinue)
 
     def transcribe_audio(self, audio_data: bytes) -> Optional[str]:
@@ -378,7 +464,8 @@ class DictationEngine:
             audio_data: Raw audio bytes (16-bit PCM)
 
         Returns:
-            Transcribed text, or None if transcription failed
+            Transcribed text ("" if the recording held no speech), or None if
+            transcription failed
         """
         if not audio_data:
             self.logger.warning("No audio data to transcribe")
@@ -392,6 +479,23 @@ class DictationEngine:
                 self.logger.error("Whisper model not loaded")
                 return None
 
+        # Whisper is the expensive step; skip it for recordings with no speech,
+        # but still complete the utterance so subscribers see it end
+        if not self.vad.contains_speech(audio_data, self.min_rms / AUDIO_MAX_AMPLITUDE):
+            self.logger.info("No speech detected in recording, skipping transcription")
+            self.event_bus.publish(
+                Event(
+                    EventType.TRANSCRIPTION_COMPLETED,
+                    {
+                        "text": "",
+                        "language": self.language,
+                        "language_probability": 0.0,
+                        "timestamp": time.time(),
+                    },
+                )
+            )
+            return ""
+
         try:
             # Publish transcription started event
             self.event_bus.publish(
@@ -403,28 +507,36 @@ class DictationEngine:
 
             # Convert bytes to numpy array
             audio_array = np.frombuffer(audio_data, dtype=np.int16)
-            audio_float = audio_array.astype(np.float32) / 32768.0
+            # Scale to [-1, 1) in one pass (no intermediate float copy);
+            # 1/32768 is a power of two, so results match dividing exactly
+            audio_float = np.multiply(audio_array, INT16_SCALE, dtype=np.float32)
 
             # Transcribe with Whisper
-            beam_size = self.config.get("model", "beam_size", default=5)
-            vad_filter = self.config.get("model", "vad_filter", default=False)
-            language = self.config.get("model", "language", default="en")
-
-            # Initial prompt to bias model toward English vocabulary
-            # Helps prevent transcription of similar-sounding words from other languages
-            initial_prompt = "This is an English voice command for computer control with numbers, clicks, and navigation."
-
             segments, info = self.model.transcribe(
                 audio_float,
-                beam_size=beam_size,
-                vad_filter=vad_filter,
-                language=language,
+                beam_size=self.beam_size,
+                vad_filter=self.vad_filter,
+                language=self.language,
                 task="transcribe",  # Ensure transcription mode (not translation)
-                initial_prompt=initial_prompt,  # Bias toward English
+                initial_prompt=WHISPER_INITIAL_PROMPT,  # Bias toward English
             )
 
+            # Segments are decoded lazily; publish each one as it arrives so
+            # subscribers see text before the whole utterance is finished
+            parts = []
+            for segment in segments:
+                parts.append(segment.text)
+                self.event_bus.publish_lazy(
+                    EventType.TRANSCRIPTION_PARTIAL,
+                    lambda: {
+                        "text": segment.text.strip(),
+                        "start": segment.start,
+                        "end": segment.end,
+                    },
+                )
+
             # Combine segments into full text
-            text = " ".join(segment.text for segment in segments).strip()
+            text = " ".join(parts).strip()
 
             # Publish transcription completed event
             self.event_bus.publish(
@@ -439,11 +551,11 @@ class DictationEngine:
                 )
             )
 
-            self.logger.info(f"Transcribed: '{text}'")
+            self.logger.info("Transcribed: '%s'", text)
             return text
 
         except Exception as e:
-            self.logger.error(f"Transcription failed: {e}")
+            self.logger.error("Transcription failed: %s", e)
             self.event_bus.publish(
                 Event(
                     EventType.TRANSCRIPTION_FAILED,
@@ -452,6 +564,51 @@ class DictationEngine:
             )
             return None
 
+    def submit_transcription(self, audio_data: bytes) -> bool:
+        """
+        Queue audio for transcription and return immediately.
+
+        A single worker thread transcribes queued utterances one at a time,
+        in order, and passes each result to process_text().
+
+        Args:
+            audio_data: Raw audio bytes (16-bit PCM)
+
+        Returns:
+            True if queued, False if the queue was full and the audio dropped
+        """
+        try:
+            self._transcription_queue.put_nowait(audio_data)
+        except queue.Full:
+            self.logger.warning("Transcription queue full, dropping utterance")
+            return False
+        if self._transcription_thread is None:
+            self._start_transcription_thread()
+        return True
+
+    def _start_transcription_thread(self) -> None:
+        """Start the transcription worker thread (once per engine)."""
+        with self._transcription_lock:
+            if self._transcription_thread is None:
+                thread = threading.Thread(
+                    target=self._transcription_loop, name="Transcription", daemon=True
+                )
+                thread.start()
+                self._transcription_thread = thread
+
+    def _transcription_loop(self) -> None:
+        """Transcribe and process queued utterances, forever."""
+        while True:
+            audio_data = self._transcription_queue.get()
+            try:
+                text = self.transcribe_audio(audio_data)
+                if text:
+                    self.process_text(text)
+            except Exception as e:
+                self.logger.error("Error processing transcription: %s", e)
+            finally:
+                self._transcription_queue.task_done()
+
     def process_text(self, text: str) -> None:
         """
         Process transcribed text through the command system.
@@ -498,13 +655,13 @@ class DictationEngine:
 
                 if command_executed:
                     # Command was executed, type any result text if provided
-                    self.logger.info(f"✓ Command executed for: '{processed_text}'")
+                    self.logger.info("✓ Command executed for: '%s'", processed_text)
                     print(f"✓ Command executed: {processed_text}")
                     if result_text:
                         self._type_text(result_text)
                 else:
                     # No command matched
-                    self.logger.info(f"✗ No command matched for: '{processed_text}'")
+                    self.logger.info("✗ No command matched for: '%s'", processed_text)
                     print(f"✗ No command found: {processed_text}")
 
                     # Check if we should type text or do nothing
@@ -514,10 +671,10 @@ class DictationEngine:
                         self._type_text(processed_text)
                     else:
                         # Command-only mode: do nothing
-                        self.logger.info(f"   (command-only mode: ignoring)")
+                        self.logger.info("   (command-only mode: ignoring)")
 
         except Exception as e:
-            self.logger.error(f"Error processing text: {e}")
+            self.logger.error("Error processing text: %s", e)
             self.event_bus.publish(
                 Event(
                     EventType.ERROR_OCCURRED,
@@ -535,23 +692,21 @@ class DictationEngine:
         if command_action == "undo_last":
             # Delete last typed text
             length = self.text_processor.get_last_text_length()
+            tap = self.keyboard_controller.tap
+            backspace = keyboard.Key.backspace
             for _ in range(length):
-                self.keyboard_controller.press(keyboard.Key.backspace)
-                self.keyboard_controller.release(keyboard.Key.backspace)
+                tap(backspace)
 
-            self.logger.info(f"Undo last: deleted {length} characters")
+            self.logger.info("Undo last: deleted %d characters", length)
 
         elif command_action == "clear_line":
             # Select current line and delete
-            self.keyboard_controller.press(keyboard.Key.home)
-            self.keyboard_controller.release(keyboard.Key.home)
+            self.keyboard_controller.tap(keyboard.Key.home)
 
             with self.keyboard_controller.pressed(keyboard.Key.shift):
-                self.keyboard_controller.press(keyboard.Key.end)
-                self.keyboard_controller.release(keyboard.Key.end)
+                self.keyboard_controller.tap(keyboard.Key.end)
 
-            self.keyboard_controller.press(keyboard.Key.backspace)
-            self.keyboard_controller.release(keyboard.Key.backspace)
+            self.keyboard_controller.tap(keyboard.Key.backspace)
 
             self.logger.info("Clear line executed")
 
@@ -572,10 +727,10 @@ class DictationEngine:
                 Event(EventType.TEXT_TYPED, {"text": text, "length": len(text)})
             )
 
-            self.logger.info(f"Typed: '{text}'")
+            self.logger.info("Typed: '%s'", text)
 
         except Exception as e:
-            self.logger.error(f"Failed to type text: {e}")
+            self.logger.error("Failed to type text: %s", e)
             self.event_bus.publish(
                 Event(
                     EventType.ERROR_OCCURRED,
@@ -611,12 +766,8 @@ class DictationEngine:
         Returns:
             Duration in seconds
         """
-        if not self.audio_frames:
-            return 0.0
-
-        total_bytes = sum(len(frame) for frame in self.audio_frames)
         bytes_per_second = self.sample_rate * self.channels * 2  # 16-bit = 2 bytes
-        return total_bytes / bytes_per_second
+        return len(self.audio_buffer) / bytes_per_second
 
     def cleanup(self) -> None:
         """Clean up resources (audio stream, model, etc.)."""
@@ -20,31 +20,28 @@ from pynput import keyboard
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.commands.handlers.keyboard_commands import (
-    BackspaceCommand,
+    BACKSPACE_COMMAND,
+    ENTER_COMMAND,
+    ESCAPE_COMMAND,
+    REDO_COMMAND,
+    SAVE_COMMAND,
+    SELECT_ALL_COMMAND,
+    SPACE_COMMAND,
+    TAB_COMMAND,
+    UNDO_COMMAND,
     ClipboardCommand,
     DeleteLineCommand,
     DeleteWordCommand,
-    EnterCommand,
-    EscapeCommand,
-    RedoCommand,
-    SaveCommand,
-    SelectAllCommand,
-    SpaceCommand,
-    TabCommand,
     TypeSymbolCommand,
     TypeTextCommand,
-    UndoCommand,
 )
 from src.commands.handlers.mouse_commands import (
-    ClickCommand,
+    ClickFamilyCommand,
     ClickNumberCommand,
-    DoubleClickCommand,
     DragBetweenNumbersCommand,
-    MiddleClickCommand,
     MouseMoveCommand,
     MoveToNumberCommand,
     RefineGridCommand,
-    RightClickCommand,
     ScrollCommand,
 )
 from src.commands.handlers.navigation_commands import (
@@ -186,63 +183,56 @@ class DictationApp:
 
     def _register_commands(self) -> None:
         """Register all available commands with the registry."""
-        # Custom commands (loaded from config.yaml)
-        # These are registered FIRST so they have priority over built-in commands
-        custom_cmds = load_custom_commands(self.config)
-        for cmd in custom_cmds:
-            self.command_registry.register(cmd)
-
-        # Keyboard commands
-        self.command_registry.register(EnterCommand())
-        self.command_registry.register(TabCommand())
-        self.command_registry.register(EscapeCommand())
-        self.command_registry.register(SpaceCommand())
-        self.command_registry.register(BackspaceCommand())
-        self.command_registry.register(DeleteWordCommand())
-        self.command_registry.register(DeleteLineCommand())
-        self.command_registry.register(ClipboardCommand())
-        self.command_registry.register(SelectAllCommand())
-        self.command_registry.register(UndoCommand())
-        self.command_registry.register(RedoCommand())
-        self.command_registry.register(SaveCommand())
-        self.command_registry.register(TypeSymbolCommand())
-        self.command_registry.register(TypeTextCommand())
-
-        # Mouse commands
-        self.command_registry.register(ClickCommand())
-        self.command_registry.register(RightClickCommand())
-        self.command_registry.register(DoubleClickCommand())
-        self.command_registry.register(MiddleClickCommand())
-        self.command_registry.register(ScrollCommand())
-        self.command_registry.register(MouseMoveCommand())
-        self.command_registry.register(ClickNumberCommand(self.parser))
-        self.command_registry.register(MoveToNumberCommand(self.parser))
-        self.command_registry.register(DragBetweenNumbersCommand(self.parser))
-        self.command_registry.register(RefineGridCommand(self.parser))
-
-        # Navigation commands
-        self.command_registry.register(ArrowKeyCommand())
-        self.command_registry.register(PageNavigationCommand())
-        self.command_registry.register(HomeEndCommand())
-
-        # Window commands
-        self.command_registry.register(MaximizeCommand())
-        self.command_registry.register(MinimizeCommand())
-        self.command_registry.register(CloseWindowCommand())
-        self.command_registry.register(CenterWindowCommand())
-        self.command_registry.register(MoveWindowCommand())
-        self.command_registry.register(SwitchWindowCommand())
-
-        # Overlay commands
-        self.command_registry.register(ShowGridCommand())
-        self.command_registry.register(ShowElementsCommand())
-        self.command_registry.register(ShowWindowsCommand())
-        self.command_registry.register(HideOverlayCommand())
-        self.command_registry.register(ShowHelpCommand())
-
-        # Screenshot commands
-        self.command_registry.register(ScreenshotCommand())
-        self.command_registry.register(ReferenceScreenshotCommand())
+        # One table, registered in a single batch (one sort, one index build).
+        # Custom commands (loaded from config.yaml) come FIRST so they have
+        # priority over built-in commands of equal priority.
+        commands = [
+            *load_custom_commands(self.config),
+            # Keyboard commands
+            ENTER_COMMAND,
+            TAB_COMMAND,
+            ESCAPE_COMMAND,
+            SPACE_COMMAND,
+            BACKSPACE_COMMAND,
+            DeleteWordCommand(),
+            DeleteLineCommand(),
+            ClipboardCommand(),
+            SELECT_ALL_COMMAND,
+            UNDO_COMMAND,
+            REDO_COMMAND,
+            SAVE_COMMAND,
+            TypeSymbolCommand(),
+            TypeTextCommand(),
+            # Mouse commands
+            ClickFamilyCommand(),
+            ScrollCommand(),
+            MouseMoveCommand(),
+            ClickNumberCommand(self.parser),
+            MoveToNumberCommand(self.parser),
+            DragBetweenNumbersCommand(self.parser),
+            RefineGridCommand(self.parser),
+            # Navigation commands
+            ArrowKeyCommand(),
+            PageNavigationCommand(),
+            HomeEndCommand(),
+            # Window commands
+            MaximizeCommand(),
+            MinimizeCommand(),
+            CloseWindowCommand(),
+            CenterWindowCommand(),
+            MoveWindowCommand(),
+            SwitchWindowCommand(),
+            # Overlay commands
+            ShowGridCommand(),
+            ShowElementsCommand(),
+            ShowWindowsCommand(),
+            HideOverlayCommand(),
+            ShowHelpCommand(),
+            # Screenshot commands
+            ScreenshotCommand(),
+            ReferenceScreenshotCommand(),
+        ]
+        self.command_registry.register_many(commands)
 
         logging.info(f"Registered {self.command_registry.get_command_count()} commands")
 
@@ -362,7 +352,7 @@ class DictationApp:
             self._stop_and_transcribe()
 
     def _stop_and_transcribe(self) -> None:
-        """Stop recording and transcribe in background thread."""
+        """Stop recording and queue the audio for transcription."""
         # Stop recording and get audio data
         audio_data = self.engine.stop_recording()
 
@@ -377,14 +367,8 @@ class DictationApp:
             logging.info(f"Audio too short ({audio_duration:.2f}s < {min_length}s), ignoring")
             return
 
-        # Transcribe in background thread
-        def transcribe():
-            text = self.engine.transcribe_audio(audio_data)
-            if text:
-                self.engine.process_text(text)
-
-        thread = threading.Thread(target=transcribe, daemon=True)
-        thread.start()
+        # Transcribe on the engine's worker thread
+        self.engine.submit_transcription(audio_data)
 
     def _continuous_mode_loop(self) -> None:
         """
@@ -1,7 +1,8 @@
 """Overlay manager for coordinating multiple overlays."""
 
 import logging
-from typing import Any, Dict, Optional, Tuple
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from src.core.events import Event, EventBus, EventType
 from src.overlays.base import Overlay, OverlayState, OverlayType
@@ -12,7 +13,7 @@ class OverlayManager:
     Manages multiple overlays and coordinates their display.
 
     The OverlayManager:
-    1. Registers overlay instances by type
+    1. Registers overlay instances (or factories that build them on first show) by type
     2. Shows/hides overlays, ensuring only one is visible at a time
     3. Tracks current overlay state
     4. Publishes overlay lifecycle events via event bus
@@ -26,6 +27,9 @@ class OverlayManager:
         manager.register_overlay(OverlayType.GRID, grid_overlay)
         manager.register_overlay(OverlayType.ELEMENT, element_overlay)
 
+        # Or defer construction until the overlay is first shown
+        manager.register_overlay_factory(OverlayType.HELP, lambda: HelpOverlay(...))
+
         # Show an overlay
         manager.show_overlay(OverlayType.GRID, grid_size=9)
 
@@ -50,6 +54,9 @@ class OverlayManager:
         self.event_bus = event_bus
         self.logger = logging.getLogger("OverlayManager")
         self._overlays: Dict[OverlayType, Overlay] = {}
+        # Overlays not built yet; each is constructed on first show
+        self._overlay_factories: Dict[OverlayType, Callable[[], Overlay]] = {}
+        self._factory_lock = threading.Lock()
         self._current_overlay: Optional[Overlay] = None
         self._state = OverlayState()
 
@@ -62,8 +69,25 @@ class OverlayManager:
             overlay: Overlay instance to register
         """
         self._overlays[overlay_type] = overlay
+        self._overlay_factories.pop(overlay_type, None)
         self.logger.debug("Registered overlay: %s", overlay_type.name)
 
+    def register_overlay_factory(
+        self, overlay_type: OverlayType, factory: Callable[[], Overlay]
+    ) -> None:
+        """
+        Register a factory that builds an overlay the first time it is shown.
+
+        Overlays start their own UI thread when constructed, so deferring
+        construction keeps overlays that are never used off the startup path.
+
+        Args:
+            overlay_type: Type of overlay
+            factory: Called once, with no arguments, to create the overlay
+        """
+        self._overlay_factories[overlay_type] = factory
+        self.logger.debug("Registered overlay factory: %s", overlay_type.name)
+
     def unregister_overlay(self, overlay_type: OverlayType) -> bool:
         """
         Unregister an overlay.
@@ -74,6 +98,10 @@ class OverlayManager:
         Returns:
             True if overlay was found and removed, False otherwise
         """
+        if self._overlay_factories.pop(overlay_type, None) is not None:
+            self.logger.debug("Unregistered overlay factory: %s", overlay_type.name)
+            return True
+
         if overlay_type in self._overlays:
             # Hide the overlay if it's currently visible
             if self._current_overlay == self._overlays[overlay_type]:
@@ -95,13 +123,12 @@ class OverlayManager:
         Returns:
             True if overlay was shown successfully, False otherwise
         """
-        # Check if overlay is registered
-        if overlay_type not in self._overlays:
+        # Check if overlay is registered, building it on first show
+        overlay = self._get_overlay(overlay_type)
+        if overlay is None:
             self.logger.warning("Overlay not registered: %s", overlay_type.name)
             return False
 
-        overlay = self._overlays[overlay_type]
-
         # Validate before showing
         if not overlay.validate_before_show():
             self.logger.warning("Overlay validation failed: %s", overlay_type.name)
@@ -140,6 +167,33 @@ class OverlayManager:
             self.logger.error("Error showing overlay %s: %s", overlay_type.name, e)
             return False
 
+    def _get_overlay(self, overlay_type: OverlayType) -> Optional[Overlay]:
+        """
+        Get a registered overlay, building it from its factory if needed.
+
+        Args:
+            overlay_type: Type of overlay to get
+
+        Returns:
+            Overlay instance, or None if not registered or it failed to build
+        """
+        overlay = self._overlays.get(overlay_type)
+        if overlay is not None or overlay_type not in self._overlay_factories:
+            return overlay
+
+        with self._factory_lock:
+            # Another thread may have built it while we waited
+            overlay = self._overlays.get(overlay_type)
+            factory = self._overlay_factories.get(overlay_type)
+            if overlay is None and factory is not None:
+                try:
+                    overlay = factory()
+                except Exception as e:
+                    self.logger.error("Error creating overlay %s: %s", overlay_type.name, e)
+                    return None
+                self.register_overlay(overlay_type, overlay)
+        return overlay
+
     def hide_overlay(self, overlay_type: OverlayType) -> bool:
         """
         Hide a specific overlay.
@@ -276,8 +330,9 @@ class OverlayManager:
             return position
 
         self.logger.warning(
-            f"Element {number} not found in current overlay "
-            f"({self._current_overlay.overlay_type.name})"
+            "Element %d not found in current overlay (%s)",
+            number,
+            self._current_overlay.overlay_type.name,
         )
         return None
 
@@ -355,6 +410,7 @@ class OverlayManager:
 
         # Clear all registrations
         self._overlays.clear()
+        self._overlay_factories.clear()
         self._state.clear()
 
         self.logger.debug("Cleared all overlays")
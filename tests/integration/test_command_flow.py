@@ -16,9 +16,7 @@ from src.commands.handlers.keyboard_commands import (
     UndoCommand,
 )
 from src.commands.handlers.mouse_commands import (
-    ClickCommand,
-    DoubleClickCommand,
-    RightClickCommand,
+    ClickFamilyCommand,
     ScrollCommand,
 )
 from src.commands.parser import CommandParser
@@ -115,9 +113,7 @@ def command_registry(event_bus):
     registry.register(ClipboardCommand())
 
     # Register mouse commands
-    registry.register(ClickCommand())
-    registry.register(RightClickCommand())
-    registry.register(DoubleClickCommand())
+    registry.register(ClickFamilyCommand())
     registry.register(ScrollCommand())
 
     return registry
@@ -113,6 +113,20 @@ class TestVoiceActivityDetector(unittest.TestCase):
         self.assertLess(new_silence, initial_silence)
         self.assertTrue(self.vad.speech_detected)
 
+    def test_contains_speech(self):
+        """Test whole-recording speech check finds a single loud chunk."""
+        silence = np.zeros(self.chunk_size * 4, dtype=np.int16)
+        self.assertFalse(self.vad.contains_speech(silence.tobytes()))
+        self.assertFalse(self.vad.contains_speech(b''))
+
+        # One loud chunk in an otherwise silent recording, with a short tail
+        recording = np.zeros(self.chunk_size * 4 + 100, dtype=np.int16)
+        recording[self.chunk_size:self.chunk_size * 2] = 32000
+        self.assertTrue(self.vad.contains_speech(recording.tobytes()))
+
+        # Checking a recording does not change detector state
+        self.assertFalse(self.vad.speech_detected)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,9 +1,15 @@
 """Unit tests for custom command implementations."""
 
+import ctypes
+import subprocess
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
-from src.commands.handlers.custom_commands import CustomCommand, load_custom_commands
+from src.commands.handlers.custom_commands import (
+    CustomCommand,
+    _set_windows_clipboard,
+    load_custom_commands,
+)
 from src.commands.base import PRIORITY_HIGH
 from tests.unit.test_utils import BaseCommandTest
 
@@ -33,6 +39,17 @@ class TestCustomCommandInit(unittest.TestCase):
 
         assert cmd.trigger == "test command"
 
+    def test_init_normalizes_trigger_like_input(self):
+        """Test trigger punctuation is stripped the same way as input text."""
+        cmd = CustomCommand(
+            trigger="Open Browser!",
+            action_type="type_text",
+            action_data={"text": "Hello"}
+        )
+
+        assert cmd.trigger == "open browser"
+        assert cmd.matches("open browser.") is True
+
 
 class TestCustomCommandMatches(unittest.TestCase):
     """Test CustomCommand matching."""
@@ -95,10 +112,48 @@ class TestCustomCommandTypeText(BaseCommandTest):
 class TestCustomCommandCopyToClipboard(BaseCommandTest):
     """Test copy_to_clipboard action."""
 
+    @patch('src.commands.handlers.custom_commands.pyperclip')
+    @patch('src.commands.handlers.custom_commands._set_windows_clipboard', return_value=True)
+    @patch('subprocess.run')
+    @patch('os.name', 'nt')
+    def test_execute_copy_to_clipboard_win32(self, mock_run, mock_win32, mock_pyperclip):
+        """Test copy_to_clipboard on Windows uses the Win32 API first."""
+        cmd = CustomCommand(
+            trigger="copy admin",
+            action_type="copy_to_clipboard",
+            action_data={"text": "Administrator"}
+        )
+
+        result = cmd.execute(self.context, "copy admin")
+
+        assert result is None
+        mock_win32.assert_called_once_with("Administrator")
+        mock_pyperclip.copy.assert_not_called()
+        mock_run.assert_not_called()
+
+    @patch('src.commands.handlers.custom_commands.pyperclip')
+    @patch('src.commands.handlers.custom_commands._set_windows_clipboard', return_value=False)
+    @patch('subprocess.run')
+    @patch('os.name', 'nt')
+    def test_execute_copy_to_clipboard_windows_pyperclip(self, mock_run, mock_win32, mock_pyperclip):
+        """Test copy_to_clipboard on Windows falls back to pyperclip before PowerShell."""
+        cmd = CustomCommand(
+            trigger="copy admin",
+            action_type="copy_to_clipboard",
+            action_data={"text": "Administrator"}
+        )
+
+        cmd.execute(self.context, "copy admin")
+
+        mock_pyperclip.copy.assert_called_once_with("Administrator")
+        mock_run.assert_not_called()
+
+    @patch('src.commands.handlers.custom_commands.pyperclip', None)
+    @patch('src.commands.handlers.custom_commands._set_windows_clipboard', return_value=False)
     @patch('subprocess.run')
     @patch('os.name', 'nt')
-    def test_execute_copy_to_clipboard_windows(self, mock_run):
-        """Test copy_to_clipboard on Windows."""
+    def test_execute_copy_to_clipboard_windows(self, mock_run, mock_win32):
+        """Test copy_to_clipboard on Windows falls back to PowerShell."""
         cmd = CustomCommand(
             trigger="copy admin",
             action_type="copy_to_clipboard",
@@ -111,7 +166,9 @@ class TestCustomCommandCopyToClipboard(BaseCommandTest):
         mock_run.assert_called_once()
         args = mock_run.call_args[0][0]
         assert args[0] == 'powershell'
-        assert 'Administrator' in args[2]
+        assert '-NoProfile' in args
+        assert 'Administrator' in args[-1]
+        assert mock_run.call_args.kwargs["stdout"] is subprocess.DEVNULL
 
     @patch('src.commands.handlers.custom_commands.pyperclip')
     @patch('os.name', 'posix')
@@ -129,6 +186,30 @@ class TestCustomCommandCopyToClipboard(BaseCommandTest):
         mock_pyperclip.copy.assert_called_once_with("Test Text")
 
 
+class TestSetWindowsClipboard(unittest.TestCase):
+    """Test the Win32 clipboard helper."""
+
+    @patch('src.commands.handlers.custom_commands._user32', None)
+    def test_unavailable_without_win32(self):
+        """Test the helper reports failure when the Win32 API is missing."""
+        assert _set_windows_clipboard("text") is False
+
+    @patch('src.commands.handlers.custom_commands._user32')
+    @patch('src.commands.handlers.custom_commands._kernel32')
+    def test_copies_text_with_module_handles(self, mock_kernel32, mock_user32):
+        """Test the text is copied through the module's own Win32 handles."""
+        buffer = ctypes.create_unicode_buffer(16)
+        mock_kernel32.GlobalAlloc.return_value = 1234
+        mock_kernel32.GlobalLock.return_value = ctypes.addressof(buffer)
+
+        assert _set_windows_clipboard("Admin") is True
+
+        assert buffer.value == "Admin"
+        mock_user32.SetClipboardData.assert_called_once_with(13, 1234)
+        mock_user32.CloseClipboard.assert_called_once()
+        mock_kernel32.GlobalFree.assert_not_called()
+
+
 class TestCustomCommandExecuteFile(BaseCommandTest):
     """Test execute_file action."""
 
@@ -162,6 +243,88 @@ class TestCustomCommandExecuteFile(BaseCommandTest):
         assert result is None
         mock_exists.assert_called_once()
 
+    @patch('subprocess.Popen')
+    @patch('os.path.exists', return_value=True)
+    def test_execute_file_path_resolved_once(self, mock_exists, mock_popen):
+        """Test the path existence check is cached across executions."""
+        cmd = CustomCommand(
+            trigger="run script",
+            action_type="execute_file",
+            action_data={"path": "/path/to/script.sh"}
+        )
+
+        cmd.execute(self.context, "run script")
+        cmd.execute(self.context, "run script")
+
+        mock_exists.assert_called_once()
+        assert mock_popen.call_count == 2
+
+    @patch('subprocess.Popen')
+    @patch('os.path.exists', return_value=True)
+    def test_execute_file_lazy_path(self, mock_exists, mock_popen):
+        """Test lazy_path re-checks the path on every execution."""
+        cmd = CustomCommand(
+            trigger="run script",
+            action_type="execute_file",
+            action_data={"path": "/path/to/script.sh", "lazy_path": True}
+        )
+
+        cmd.execute(self.context, "run script")
+        cmd.execute(self.context, "run script")
+
+        assert mock_exists.call_count == 2
+
+    @patch('os.name', 'posix')
+    @patch('subprocess.Popen')
+    @patch('os.path.exists', return_value=True)
+    def test_execute_file_posix_without_shell(self, mock_exists, mock_popen):
+        """Test POSIX launches the path directly as argv, not through a shell."""
+        cmd = CustomCommand(
+            trigger="run script",
+            action_type="execute_file",
+            action_data={"path": "/path/to/script.sh"}
+        )
+
+        cmd.execute(self.context, "run script")
+
+        assert mock_popen.call_args[0][0] == ["/path/to/script.sh"]
+        assert mock_popen.call_args.kwargs.get("shell", False) is False
+        assert mock_popen.call_args.kwargs["start_new_session"] is True
+
+    @patch('os.name', 'nt')
+    @patch('os.startfile', create=True)
+    @patch('subprocess.Popen')
+    @patch('os.path.exists', return_value=True)
+    def test_execute_file_windows_startfile(self, mock_exists, mock_popen, mock_startfile):
+        """Test Windows opens the path with os.startfile."""
+        cmd = CustomCommand(
+            trigger="open browser",
+            action_type="execute_file",
+            action_data={"path": "C:\\Program Files\\Browser\\browser.lnk"}
+        )
+
+        cmd.execute(self.context, "open browser")
+
+        mock_startfile.assert_called_once_with("C:\\Program Files\\Browser\\browser.lnk")
+        mock_popen.assert_not_called()
+
+    @patch('subprocess.Popen')
+    @patch('os.path.exists', return_value=True)
+    def test_execute_file_discards_output(self, mock_exists, mock_popen):
+        """Test the launched program's streams are not piped back to us."""
+        cmd = CustomCommand(
+            trigger="run script",
+            action_type="execute_file",
+            action_data={"path": "/path/to/script.sh"}
+        )
+
+        cmd.execute(self.context, "run script")
+
+        kwargs = mock_popen.call_args.kwargs
+        assert kwargs["stdout"] is subprocess.DEVNULL
+        assert kwargs["stderr"] is subprocess.DEVNULL
+        assert kwargs["stdin"] is subprocess.DEVNULL
+
 
 class TestCustomCommandKeyCombination(BaseCommandTest):
     """Test key_combination action."""
@@ -177,10 +340,37 @@ class TestCustomCommandKeyCombination(BaseCommandTest):
         result = cmd.execute(self.context, "show desktop")
 
         assert result is None
-        # Verify press was called for each key
-        assert self.mock_keyboard.press.call_count == 2
-        # Verify release was called for each key
-        assert self.mock_keyboard.release.call_count == 2
+        # Modifier is held while the final key is tapped
+        self.mock_keyboard.pressed.assert_called_once_with("win")
+        self.mock_keyboard.tap.assert_called_once_with("d")
+
+    def test_execute_key_combination_three_keys(self):
+        """Test every key but the last is held as a modifier."""
+        cmd = CustomCommand(
+            trigger="task manager",
+            action_type="key_combination",
+            action_data={"keys": ["ctrl", "shift", "esc"]}
+        )
+
+        cmd.execute(self.context, "task manager")
+
+        assert self.mock_keyboard.pressed.call_args_list == [call("ctrl"), call("shift")]
+        self.mock_keyboard.tap.assert_called_once_with("esc")
+
+    @patch('time.sleep')
+    def test_execute_key_combination_hold_ms(self, mock_sleep):
+        """Test hold_ms holds the final key for the configured time."""
+        cmd = CustomCommand(
+            trigger="show desktop",
+            action_type="key_combination",
+            action_data={"keys": ["win", "d"], "hold_ms": 50}
+        )
+
+        cmd.execute(self.context, "show desktop")
+
+        self.mock_keyboard.press.assert_called_once_with("d")
+        self.mock_keyboard.release.assert_called_once_with("d")
+        mock_sleep.assert_called_once_with(0.05)
 
 
 class TestCustomCommandProperties(unittest.TestCase):
@@ -9,8 +9,12 @@ import yaml
 from pynput import keyboard
 
 from src.commands.handlers.keyboard_commands import (
+    ENTER_COMMAND,
+    SAVE_COMMAND,
     BackspaceCommand,
     ClipboardCommand,
+    DeleteLineCommand,
+    DeleteWordCommand,
     EnterCommand,
     EscapeCommand,
     RedoCommand,
@@ -24,6 +28,7 @@ from src.commands.handlers.keyboard_commands import (
 from src.commands.base import CommandContext
 from src.core.config import Config
 from src.core.events import EventBus, EventType
+from tests.unit.test_utils import BaseCommandTest
 
 
 def create_mock_keyboard():
@@ -155,6 +160,12 @@ class TestKeyPressCommands(unittest.TestCase):
         self.assertIn("tab", TabCommand().examples)
         self.assertIn("escape", EscapeCommand().examples)
 
+    def test_module_level_singletons(self):
+        """Test that shared command instances are prebuilt at import."""
+        self.assertIsInstance(ENTER_COMMAND, EnterCommand)
+        self.assertIsInstance(SAVE_COMMAND, SaveCommand)
+        self.assertTrue(ENTER_COMMAND.matches("enter"))
+
 
 class TestClipboardCommand(unittest.TestCase):
     """Test cases for clipboard commands."""
@@ -378,6 +389,34 @@ class TestSaveCommand(unittest.TestCase):
         self.mock_keyboard.release.assert_called_once_with("s")
 
 
+class TestDeleteCommands(BaseCommandTest):
+    """Test cases for DeleteWord and DeleteLine commands."""
+
+    def test_delete_word_execute(self):
+        """Test DeleteWord holds Ctrl while tapping Backspace."""
+        cmd = DeleteWordCommand()
+        self.assertTrue(cmd.matches("delete word"))
+        result = cmd.execute(self.context, "delete word")
+
+        self.assertIsNone(result)
+        self.mock_keyboard.pressed.assert_called_once_with(keyboard.Key.ctrl)
+        self.mock_keyboard.tap.assert_called_once_with(keyboard.Key.backspace)
+        self.mock_keyboard.press.assert_not_called()
+
+    def test_delete_line_execute(self):
+        """Test DeleteLine taps Home, Shift+End, then Delete."""
+        cmd = DeleteLineCommand()
+        self.assertTrue(cmd.matches("delete line"))
+        result = cmd.execute(self.context, "delete line")
+
+        self.assertIsNone(result)
+        self.mock_keyboard.pressed.assert_called_once_with(keyboard.Key.shift)
+        self.assertEqual(
+            self.mock_keyboard.tap.call_args_list,
+            [call(keyboard.Key.home), call(keyboard.Key.end), call(keyboard.Key.delete)],
+        )
+
+
 class TestTypeSymbolCommand(unittest.TestCase):
     """Test cases for Type Symbol command."""
 
@@ -3,24 +3,22 @@
 import os
 import tempfile
 import unittest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, PropertyMock, call, patch
 
 import yaml
 from pynput import mouse
 
 from src.commands.handlers.mouse_commands import (
-    ClickCommand,
+    ClickFamilyCommand,
     ClickNumberCommand,
-    DoubleClickCommand,
-    MiddleClickCommand,
+    DragBetweenNumbersCommand,
     MouseMoveCommand,
-    RightClickCommand,
     ScrollCommand,
 )
-from src.commands.base import CommandContext
+from src.commands.base import CommandContext, PRIORITY_MEDIUM
 from src.commands.parser import CommandParser
 from src.core.config import Config
-from src.core.events import EventBus
+from src.core.events import EventBus, EventType
 
 
 class TestClickCommands(unittest.TestCase):
@@ -49,74 +47,55 @@ class TestClickCommands(unittest.TestCase):
         """Clean up test fixtures."""
         os.remove(self.temp_file.name)
 
-    def test_click_command_matches(self):
-        """Test left click command matching."""
-        cmd = ClickCommand()
-        self.assertTrue(cmd.matches("click"))
-        self.assertTrue(cmd.matches("CLICK"))
-        self.assertTrue(cmd.matches("  click  "))
+    def test_click_family_command_matches(self):
+        """Test fused click command matches every fixed click phrase."""
+        cmd = ClickFamilyCommand()
+        for phrase in [
+            "click", "CLICK", "  click  ", "Right click!", "DOUBLE CLICK",
+            "middle click", "wheel click",
+        ]:
+            self.assertTrue(cmd.matches(phrase), phrase)
         self.assertFalse(cmd.matches("click 5"))
-        self.assertFalse(cmd.matches("double click"))
-
-    def test_click_command_execute(self):
-        """Test left click execution."""
-        cmd = ClickCommand()
-        result = cmd.execute(self.context, "click")
-
-        self.assertIsNone(result)
-        self.mock_mouse.click.assert_called_once_with(mouse.Button.left, 1)
-
-    def test_right_click_command_matches(self):
-        """Test right click command matching."""
-        cmd = RightClickCommand()
-        self.assertTrue(cmd.matches("right click"))
-        self.assertTrue(cmd.matches("RIGHT CLICK"))
-        self.assertFalse(cmd.matches("click"))
-
-    def test_right_click_command_execute(self):
-        """Test right click execution."""
-        cmd = RightClickCommand()
-        result = cmd.execute(self.context, "right click")
-
-        self.assertIsNone(result)
-        self.mock_mouse.click.assert_called_once_with(mouse.Button.right, 1)
-
-    def test_double_click_command_matches(self):
-        """Test double click command matching."""
-        cmd = DoubleClickCommand()
-        self.assertTrue(cmd.matches("double click"))
-        self.assertTrue(cmd.matches("DOUBLE CLICK"))
-        self.assertFalse(cmd.matches("click"))
-
-    def test_double_click_command_execute(self):
-        """Test double click execution."""
-        cmd = DoubleClickCommand()
-        result = cmd.execute(self.context, "double click")
-
-        self.assertIsNone(result)
-        self.mock_mouse.click.assert_called_once_with(mouse.Button.left, 2)
-
-    def test_middle_click_command_matches(self):
-        """Test middle click command matching."""
-        cmd = MiddleClickCommand()
-        self.assertTrue(cmd.matches("middle click"))
-        self.assertTrue(cmd.matches("wheel click"))
-        self.assertFalse(cmd.matches("click"))
-
-    def test_middle_click_command_execute(self):
-        """Test middle click execution."""
-        cmd = MiddleClickCommand()
-        result = cmd.execute(self.context, "middle click")
-
-        self.assertIsNone(result)
-        self.mock_mouse.click.assert_called_once_with(mouse.Button.middle, 1)
-
-    def test_click_command_priorities(self):
-        """Test that specialized clicks have higher priority."""
-        self.assertEqual(ClickCommand().priority, 100)
-        self.assertEqual(RightClickCommand().priority, 200)
-        self.assertEqual(DoubleClickCommand().priority, 200)
-        self.assertEqual(MiddleClickCommand().priority, 200)
+        self.assertFalse(cmd.matches("triple click"))
+
+    def test_click_family_command_priority(self):
+        """Test fused click command outranks normal-priority commands."""
+        self.assertEqual(ClickFamilyCommand().priority, PRIORITY_MEDIUM)
+
+    def test_click_family_command_leaves_event_to_registry(self):
+        """Test execute() does not publish its own COMMAND_EXECUTED event."""
+        events = []
+        self.event_bus.subscribe(EventType.COMMAND_EXECUTED, events.append)
+
+        ClickFamilyCommand().execute(self.context, "right click")
+
+        self.assertEqual(events, [])
+
+    def test_click_family_command_display_name(self):
+        """Test fused click command names the click that was spoken."""
+        cmd = ClickFamilyCommand()
+        self.assertEqual(cmd.display_name("click"), "Click")
+        self.assertEqual(cmd.display_name("Right click!"), "Right Click")
+        self.assertEqual(cmd.display_name("double click"), "Double Click")
+        self.assertEqual(cmd.display_name("wheel click"), "Middle Click")
+
+    def test_click_family_command_execute(self):
+        """Test fused click command uses the button and count of the phrase."""
+        cmd = ClickFamilyCommand()
+        cmd.execute(self.context, "click")
+        cmd.execute(self.context, "right click")
+        cmd.execute(self.context, "double click")
+        cmd.execute(self.context, "wheel click")
+
+        self.assertEqual(
+            self.mock_mouse.click.call_args_list,
+            [
+                call(mouse.Button.left, 1),
+                call(mouse.Button.right, 1),
+                call(mouse.Button.left, 2),
+                call(mouse.Button.middle, 1),
+            ],
+        )
 
 
 class TestScrollCommand(unittest.TestCase):
@@ -387,5 +366,58 @@ class TestClickNumberCommand(unittest.TestCase):
         self.assertEqual(cmd.priority, 500)
 
 
+
+class TestDragBetweenNumbersCommand(unittest.TestCase):
+    """Test cases for drag between numbers command."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mock_mouse = Mock(spec=mouse.Controller)
+        self.overlay_manager = Mock()
+        self.overlay_manager.is_any_overlay_visible.return_value = True
+        self.overlay_manager.get_element_position.side_effect = lambda n: (n * 10, n * 20)
+
+        self.context = CommandContext(
+            config=Mock(),
+            keyboard_controller=Mock(),
+            mouse_controller=self.mock_mouse,
+            overlay_manager=self.overlay_manager,
+        )
+
+    @patch('src.commands.handlers.mouse_commands.time.sleep')
+    def test_drag_returns_before_release(self, mock_sleep):
+        """Test execute moves to the start cell and finishes the drag in the background."""
+        cmd = DragBetweenNumbersCommand(CommandParser())
+
+        with patch('src.commands.handlers.mouse_commands.threading.Thread') as mock_thread:
+            result = cmd.execute(self.context, "5 to 9")
+
+        self.assertIsNone(result)
+        self.assertEqual(self.mock_mouse.position, (50, 100))
+        self.mock_mouse.press.assert_not_called()
+        mock_sleep.assert_not_called()
+        mock_thread.return_value.start.assert_called_once()
+
+        # Run the background part synchronously
+        kwargs = mock_thread.call_args.kwargs
+        kwargs["target"](*kwargs["args"])
+
+        self.mock_mouse.press.assert_called_once_with(mouse.Button.left)
+        self.mock_mouse.release.assert_called_once_with(mouse.Button.left)
+        self.assertEqual(self.mock_mouse.position, (90, 180))
+
+    @patch('src.commands.handlers.mouse_commands.time.sleep')
+    def test_drag_releases_button_when_move_fails(self, mock_sleep):
+        """Test the button is released and the error logged if the move raises."""
+        cmd = DragBetweenNumbersCommand(CommandParser())
+        type(self.mock_mouse).position = PropertyMock(side_effect=RuntimeError("boom"))
+
+        with self.assertLogs("DragBetweenNumbersCommand", level="ERROR"):
+            cmd._finish_drag(self.context, (90, 180))
+
+        self.mock_mouse.press.assert_called_once_with(mouse.Button.left)
+        self.mock_mouse.release.assert_called_once_with(mouse.Button.left)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,7 +3,7 @@
 import os
 import tempfile
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
 import yaml
 from pynput import keyboard
@@ -216,6 +216,11 @@ class TestHomeEndCommand(unittest.TestCase):
         """Clean up test fixtures."""
         os.remove(self.temp_file.name)
 
+    def assert_ctrl_chord(self, key):
+        """Assert key was tapped while Ctrl was held."""
+        self.assertEqual(self.mock_keyboard.press.call_args_list, [call(keyboard.Key.ctrl), call(key)])
+        self.assertEqual(self.mock_keyboard.release.call_args_list, [call(key), call(keyboard.Key.ctrl)])
+
     def test_home_end_matches(self):
         """Test home/end command matching."""
         cmd = HomeEndCommand()
@@ -236,9 +241,7 @@ class TestHomeEndCommand(unittest.TestCase):
 
         self.assertIsNone(result)
         # Should press Ctrl+Home
-        self.mock_keyboard.pressed.assert_called_once_with(keyboard.Key.ctrl)
-        self.mock_keyboard.press.assert_called_once_with(keyboard.Key.home)
-        self.mock_keyboard.release.assert_called_once_with(keyboard.Key.home)
+        self.assert_ctrl_chord(keyboard.Key.home)
 
     def test_go_to_top_execute(self):
         """Test go to top execution."""
@@ -247,8 +250,7 @@ class TestHomeEndCommand(unittest.TestCase):
 
         self.assertIsNone(result)
         # Should press Ctrl+Home
-        self.mock_keyboard.pressed.assert_called_once_with(keyboard.Key.ctrl)
-        self.mock_keyboard.press.assert_called_once_with(keyboard.Key.home)
+        self.assert_ctrl_chord(keyboard.Key.home)
 
     def test_go_to_beginning_execute(self):
         """Test go to beginning execution."""
@@ -257,8 +259,7 @@ class TestHomeEndCommand(unittest.TestCase):
 
         self.assertIsNone(result)
         # Should press Ctrl+Home
-        self.mock_keyboard.pressed.assert_called_once_with(keyboard.Key.ctrl)
-        self.mock_keyboard.press.assert_called_once_with(keyboard.Key.home)
+        self.assert_ctrl_chord(keyboard.Key.home)
 
     def test_go_to_end_execute(self):
         """Test go to end execution."""
@@ -267,9 +268,7 @@ class TestHomeEndCommand(unittest.TestCase):
 
         self.assertIsNone(result)
         # Should press Ctrl+End
-        self.mock_keyboard.pressed.assert_called_once_with(keyboard.Key.ctrl)
-        self.mock_keyboard.press.assert_called_once_with(keyboard.Key.end)
-        self.mock_keyboard.release.assert_called_once_with(keyboard.Key.end)
+        self.assert_ctrl_chord(keyboard.Key.end)
 
     def test_go_to_bottom_execute(self):
         """Test go to bottom execution."""
@@ -278,8 +277,7 @@ class TestHomeEndCommand(unittest.TestCase):
 
         self.assertIsNone(result)
         # Should press Ctrl+End
-        self.mock_keyboard.pressed.assert_called_once_with(keyboard.Key.ctrl)
-        self.mock_keyboard.press.assert_called_once_with(keyboard.Key.end)
+        self.assert_ctrl_chord(keyboard.Key.end)
 
     def test_line_start_execute(self):
         """Test line start execution."""
@@ -288,7 +286,6 @@ class TestHomeEndCommand(unittest.TestCase):
 
         self.assertIsNone(result)
         # Should press Home (without Ctrl)
-        self.mock_keyboard.pressed.assert_not_called()
         self.mock_keyboard.press.assert_called_once_with(keyboard.Key.home)
         self.mock_keyboard.release.assert_called_once_with(keyboard.Key.home)
 
@@ -299,7 +296,6 @@ class TestHomeEndCommand(unittest.TestCase):
 
         self.assertIsNone(result)
         # Should press End (without Ctrl)
-        self.mock_keyboard.pressed.assert_not_called()
         self.mock_keyboard.press.assert_called_once_with(keyboard.Key.end)
         self.mock_keyboard.release.assert_called_once_with(keyboard.Key.end)
 
@@ -1,10 +1,15 @@
 """Unit tests for screenshot command implementations."""
 
+import os
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+from PIL import Image
+
 from src.commands.handlers.screenshot_commands import (
+    PARTIAL_SUFFIX,
     ScreenshotCommand,
     ReferenceScreenshotCommand
 )
@@ -22,6 +27,18 @@ class TestScreenshotCommandInit(unittest.TestCase):
 
         assert cmd.screenshots_dir is not None
         assert "Screenshots" in str(cmd.screenshots_dir)
+        mock_mkdir.assert_not_called()
+
+    @patch('pathlib.Path.mkdir')
+    @patch('pyautogui.screenshot')
+    def test_directory_created_on_first_execute(self, mock_screenshot, mock_mkdir):
+        """Test the screenshots directory is created once, on first use."""
+        cmd = ScreenshotCommand()
+        context = Mock()
+        cmd.execute(context, "screenshot")
+        cmd.execute(context, "screenshot")
+        cmd._save_queue.join()
+
         mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
 
 
@@ -62,10 +79,117 @@ class TestScreenshotCommandExecute(BaseCommandTest):
 
         cmd = ScreenshotCommand()
         result = cmd.execute(self.context, "screenshot")
+        cmd._save_queue.join()
 
         assert result is None
         mock_screenshot.assert_called_once()
         mock_image.save.assert_called_once()
+        assert mock_image.save.call_args.kwargs == {"format": "PNG", "compress_level": 1}
+
+    @patch('pathlib.Path.mkdir')
+    @patch('pyautogui.screenshot')
+    def test_execute_screenshot_save_error(self, mock_screenshot, mock_mkdir):
+        """Test a failed save is reported on the save thread and does not stop it."""
+        mock_image = Mock()
+        mock_image.save.side_effect = [OSError("disk full"), None]
+        mock_screenshot.return_value = mock_image
+
+        cmd = ScreenshotCommand()
+        assert cmd.execute(self.context, "screenshot") is None
+        assert cmd.execute(self.context, "screenshot") is None
+        cmd._save_queue.join()
+
+        assert mock_image.save.call_count == 2
+
+    @patch('pathlib.Path.mkdir')
+    @patch('pyautogui.screenshot')
+    def test_execute_screenshot_unique_filenames(self, mock_screenshot, mock_mkdir):
+        """Test screenshots taken within the same second get distinct files."""
+        mock_image = Mock()
+        mock_screenshot.return_value = mock_image
+        base_ns = 1_700_000_000 * 1_000_000_000
+
+        cmd = ScreenshotCommand()
+        with patch('time.time_ns', side_effect=[base_ns + 1_000, base_ns + 2_000]):
+            cmd.execute(self.context, "screenshot")
+            cmd.execute(self.context, "screenshot")
+        cmd._save_queue.join()
+
+        first, second = (c.args[0] for c in mock_image.save.call_args_list)
+        assert first != second
+        assert first < second
+        assert first.startswith(str(cmd.screenshots_dir))
+        assert Path(first).name.startswith("screenshot_")
+        assert first.endswith("_000001.png" + PARTIAL_SUFFIX)
+
+    def test_close_waits_for_complete_files(self):
+        """Test close() drains the save queue and only finished PNGs are visible."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+
+        cmd = ScreenshotCommand()
+        cmd.screenshots_dir = Path(temp_dir.name)
+        cmd._dir_str = temp_dir.name + os.sep
+        with patch.object(cmd, '_grab', return_value=Image.new("RGB", (4, 4))):
+            cmd.execute(self.context, "screenshot")
+            cmd.execute(self.context, "screenshot")
+        cmd.close()
+
+        names = os.listdir(temp_dir.name)
+        assert len(names) == 2
+        assert all(name.endswith(".png") for name in names)
+
+    def test_failed_save_leaves_no_partial_file(self):
+        """Test a save that fails midway removes its partial file."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        image = Mock()
+
+        def write_then_fail(path, **kwargs):
+            Path(path).write_bytes(b"partial")
+            raise OSError("disk full")
+
+        image.save.side_effect = write_then_fail
+
+        cmd = ScreenshotCommand()
+        cmd.screenshots_dir = Path(temp_dir.name)
+        cmd._dir_str = temp_dir.name + os.sep
+        with patch.object(cmd, '_grab', return_value=image):
+            cmd.execute(self.context, "screenshot")
+        cmd.close()
+
+        assert os.listdir(temp_dir.name) == []
+
+    @patch('pathlib.Path.mkdir')
+    @patch('pyautogui.screenshot')
+    @patch('src.commands.handlers.screenshot_commands.Image')
+    @patch('src.commands.handlers.screenshot_commands.mss')
+    def test_grab_reuses_mss_grabber(self, mock_mss, mock_image_module, mock_screenshot, mock_mkdir):
+        """Test the mss grabber is created once and reused across captures."""
+        grabber = mock_mss.mss.return_value
+        grabber.monitors = [{"name": "all"}, {"name": "primary"}]
+
+        cmd = ScreenshotCommand()
+        first = cmd._grab()
+        second = cmd._grab()
+
+        mock_mss.mss.assert_called_once()
+        assert grabber.grab.call_count == 2
+        grabber.grab.assert_called_with({"name": "primary"})
+        assert first is mock_image_module.frombytes.return_value
+        assert second is first
+        mock_screenshot.assert_not_called()
+
+    @patch('pathlib.Path.mkdir')
+    @patch('pyautogui.screenshot')
+    @patch('src.commands.handlers.screenshot_commands.mss')
+    def test_grab_falls_back_to_pyautogui(self, mock_mss, mock_screenshot, mock_mkdir):
+        """Test a failing mss grab falls back to pyautogui."""
+        mock_mss.mss.side_effect = Exception("no display")
+
+        cmd = ScreenshotCommand()
+
+        assert cmd._grab() is mock_screenshot.return_value
 
     @patch('pathlib.Path.mkdir')
     @patch('pyautogui.screenshot', side_effect=Exception("Screenshot failed"))
@@ -109,13 +233,21 @@ class TestReferenceScreenshotCommandInit(unittest.TestCase):
 
         assert cmd.screenshots_dir is not None
         assert "Screenshots" in str(cmd.screenshots_dir)
-        assert cmd.single_pattern is not None
-        assert cmd.multi_pattern is not None
 
 
 class TestReferenceScreenshotCommandMatches(unittest.TestCase):
     """Test ReferenceScreenshotCommand matching."""
 
+    def test_match_reused_between_matches_and_execute(self):
+        """Test the same utterance is only run through the patterns once."""
+        cmd = ReferenceScreenshotCommand()
+
+        with patch.object(cmd, 'strip_punctuation', wraps=cmd.strip_punctuation) as mock_strip:
+            assert cmd.matches("screenshot last 3") is True
+            assert cmd._match("screenshot last 3").group("multi") == "3"
+
+        mock_strip.assert_called_once_with("screenshot last 3")
+
     def test_matches_reference_screenshot(self):
         """Test matching reference screenshot variations."""
         cmd = ReferenceScreenshotCommand()
@@ -142,46 +274,32 @@ class TestReferenceScreenshotCommandMatches(unittest.TestCase):
         assert cmd.matches("screen") is False
 
 
-class TestReferenceScreenshotCommandExtractNumber(unittest.TestCase):
-    """Test ReferenceScreenshotCommand number extraction."""
+class TestReferenceScreenshotCommandMatchGroups(unittest.TestCase):
+    """Test ReferenceScreenshotCommand index and count extraction."""
 
-    def test_extract_number_explicit(self):
-        """Test extracting explicit number."""
+    def test_match_index(self):
+        """Test extracting an explicit screenshot index."""
         cmd = ReferenceScreenshotCommand()
 
-        assert cmd._extract_number("reference screenshot 2") == 2
-        assert cmd._extract_number("screenshot 5") == 5
+        assert cmd._match("reference screenshot 2").group("idx") == "2"
+        assert cmd._match("screenshot 5").group("idx") == "5"
+        assert cmd._match("screenshot 5").group("multi") is None
 
-    def test_extract_number_default(self):
-        """Test default number when not specified."""
+    def test_match_no_number(self):
+        """Test no index or count when not specified."""
         cmd = ReferenceScreenshotCommand()
 
-        assert cmd._extract_number("reference screenshot") == 1
-        assert cmd._extract_number("latest screenshot") == 1
-
+        match = cmd._match("latest screenshot")
+        assert match.group("idx") is None
+        assert match.group("multi") is None
 
-class TestReferenceScreenshotCommandIsMultiRequest(unittest.TestCase):
-    """Test ReferenceScreenshotCommand multi-request detection."""
-
-    def test_is_multi_request_true(self):
-        """Test detecting multi-screenshot request."""
+    def test_match_multi(self):
+        """Test extracting a "last N" count."""
         cmd = ReferenceScreenshotCommand()
 
-        is_multi, count = cmd._is_multi_request("screenshot last 3")
-        assert is_multi is True
-        assert count == 3
-
-        is_multi, count = cmd._is_multi_request("reference screenshot last 10")
-        assert is_multi is True
-        assert count == 10
-
-    def test_is_multi_request_false(self):
-        """Test detecting single screenshot request."""
-        cmd = ReferenceScreenshotCommand()
-
-        is_multi, count = cmd._is_multi_request("reference screenshot 2")
-        assert is_multi is False
-        assert count == 1
+        assert cmd._match("screenshot last 3").group("multi") == "3"
+        assert cmd._match("reference screenshot last 10").group("multi") == "10"
+        assert cmd._match("reference screenshot last 10").group("idx") is None
 
 
 class TestReferenceScreenshotCommandExecute(BaseCommandTest):
@@ -195,11 +313,21 @@ class TestReferenceScreenshotCommandExecute(BaseCommandTest):
 
         assert result is None
 
-    @patch('pathlib.Path.exists', return_value=True)
-    @patch('pathlib.Path.glob', return_value=[])
-    def test_execute_no_screenshots(self, mock_glob, mock_exists):
+    def _make_screenshots_dir(self, *files):
+        """Create a temporary screenshots directory holding (name, mtime) files."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        for name, mtime in files:
+            path = os.path.join(temp_dir.name, name)
+            open(path, "wb").close()
+            os.utime(path, (mtime, mtime))
+        return Path(temp_dir.name)
+
+    def test_execute_no_screenshots(self):
         """Test execution when no screenshots found."""
         cmd = ReferenceScreenshotCommand()
+        cmd.screenshots_dir = self._make_screenshots_dir(("notes.txt", 100))
+
         result = cmd.execute(self.context, "reference screenshot")
 
         assert result is None
@@ -207,108 +335,84 @@ class TestReferenceScreenshotCommandExecute(BaseCommandTest):
     def test_execute_single_screenshot(self):
         """Test executing single screenshot reference."""
         cmd = ReferenceScreenshotCommand()
+        cmd.screenshots_dir = self._make_screenshots_dir(
+            ("screenshot_1.png", 100),
+            ("screenshot_2.png", 200),
+            ("other_3.png", 300),
+        )
 
-        # Mock screenshot files
-        mock_file1 = Mock(spec=Path)
-        mock_file1.stat.return_value.st_mtime = 100
-        mock_file1.absolute.return_value = Path("/path/to/screenshot_1.png")
-        mock_file1.name = "screenshot_1.png"
-
-        mock_file2 = Mock(spec=Path)
-        mock_file2.stat.return_value.st_mtime = 200
-        mock_file2.absolute.return_value = Path("/path/to/screenshot_2.png")
-        mock_file2.name = "screenshot_2.png"
-
-        with patch.object(cmd.screenshots_dir, 'exists', return_value=True), \
-             patch.object(cmd.screenshots_dir, 'glob', return_value=[mock_file1, mock_file2]):
-
-            result = cmd.execute(self.context, "reference screenshot")
+        result = cmd.execute(self.context, "reference screenshot")
 
-            # Should return most recent (file2)
-            assert result == str(Path("/path/to/screenshot_2.png"))
+        # Should return most recent screenshot (file2)
+        assert result == str(cmd.screenshots_dir / "screenshot_2.png")
 
     def test_execute_single_screenshot_by_index(self):
         """Test executing single screenshot reference with index."""
         cmd = ReferenceScreenshotCommand()
+        cmd.screenshots_dir = self._make_screenshots_dir(
+            ("screenshot_1.png", 100),
+            ("screenshot_2.png", 200),
+        )
 
-        # Mock screenshot files
-        mock_file1 = Mock(spec=Path)
-        mock_file1.stat.return_value.st_mtime = 100
-        mock_file1.absolute.return_value = Path("/path/to/screenshot_1.png")
-        mock_file1.name = "screenshot_1.png"
+        result = cmd.execute(self.context, "reference screenshot 2")
 
-        mock_file2 = Mock(spec=Path)
-        mock_file2.stat.return_value.st_mtime = 200
-        mock_file2.absolute.return_value = Path("/path/to/screenshot_2.png")
-        mock_file2.name = "screenshot_2.png"
+        # Should return second most recent (file1)
+        assert result == str(cmd.screenshots_dir / "screenshot_1.png")
 
-        with patch.object(cmd.screenshots_dir, 'exists', return_value=True), \
-             patch.object(cmd.screenshots_dir, 'glob', return_value=[mock_file1, mock_file2]):
+    def test_execute_orders_by_timestamped_name(self):
+        """Test recency comes from the filename timestamp, not the file mtime."""
+        cmd = ReferenceScreenshotCommand()
+        cmd.screenshots_dir = self._make_screenshots_dir(
+            ("screenshot_20240102_090000_000000.png", 100),
+            ("screenshot_20240101_090000.png", 300),
+            ("screenshot_20240101_090000_000001.png", 200),
+        )
 
-            result = cmd.execute(self.context, "reference screenshot 2")
+        result = cmd.execute(self.context, "screenshot last 3")
 
-            # Should return second most recent (file1)
-            assert result == str(Path("/path/to/screenshot_1.png"))
+        assert result.split("\n") == [
+            str(cmd.screenshots_dir / "screenshot_20240102_090000_000000.png"),
+            str(cmd.screenshots_dir / "screenshot_20240101_090000_000001.png"),
+            str(cmd.screenshots_dir / "screenshot_20240101_090000.png"),
+        ]
 
     def test_execute_single_screenshot_invalid_index(self):
         """Test executing single screenshot reference with invalid index."""
         cmd = ReferenceScreenshotCommand()
+        cmd.screenshots_dir = self._make_screenshots_dir(("screenshot_1.png", 100))
 
-        # Mock screenshot files
-        mock_file1 = Mock(spec=Path)
-        mock_file1.stat.return_value.st_mtime = 100
-        mock_file1.absolute.return_value = Path("/path/to/screenshot_1.png")
-
-        with patch.object(cmd.screenshots_dir, 'exists', return_value=True), \
-             patch.object(cmd.screenshots_dir, 'glob', return_value=[mock_file1]):
+        result = cmd.execute(self.context, "reference screenshot 5")
 
-            result = cmd.execute(self.context, "reference screenshot 5")
-
-            # Index out of range
-            assert result is None
+        # Index out of range
+        assert result is None
 
     def test_execute_multiple_screenshots(self):
         """Test executing multiple screenshot reference."""
         cmd = ReferenceScreenshotCommand()
+        cmd.screenshots_dir = self._make_screenshots_dir(
+            ("screenshot_1.png", 100),
+            ("screenshot_2.png", 200),
+            ("screenshot_3.png", 300),
+        )
 
-        # Mock screenshot files
-        mock_file1 = Mock(spec=Path)
-        mock_file1.stat.return_value.st_mtime = 100
-        mock_file1.absolute.return_value = Path("/path/to/screenshot_1.png")
-
-        mock_file2 = Mock(spec=Path)
-        mock_file2.stat.return_value.st_mtime = 200
-        mock_file2.absolute.return_value = Path("/path/to/screenshot_2.png")
-
-        mock_file3 = Mock(spec=Path)
-        mock_file3.stat.return_value.st_mtime = 300
-        mock_file3.absolute.return_value = Path("/path/to/screenshot_3.png")
+        result = cmd.execute(self.context, "screenshot last 2")
 
-        with patch.object(cmd.screenshots_dir, 'exists', return_value=True), \
-             patch.object(cmd.screenshots_dir, 'glob', return_value=[mock_file1, mock_file2, mock_file3]):
-
-            result = cmd.execute(self.context, "screenshot last 2")
-
-            # Should return 2 most recent files (file3, file2)
-            expected = str(Path("/path/to/screenshot_3.png")) + "\n" + str(Path("/path/to/screenshot_2.png"))
-            assert result == expected
+        # Should return 2 most recent files (file3, file2)
+        expected = (
+            str(cmd.screenshots_dir / "screenshot_3.png") + "\n"
+            + str(cmd.screenshots_dir / "screenshot_2.png")
+        )
+        assert result == expected
 
     def test_execute_multiple_screenshots_limited(self):
         """Test executing multiple screenshots when fewer are available."""
         cmd = ReferenceScreenshotCommand()
+        cmd.screenshots_dir = self._make_screenshots_dir(("screenshot_1.png", 100))
 
-        # Mock screenshot files
-        mock_file1 = Mock(spec=Path)
-        mock_file1.stat.return_value.st_mtime = 100
-        mock_file1.absolute.return_value = Path("/path/to/screenshot_1.png")
-
-        with patch.object(cmd.screenshots_dir, 'exists', return_value=True), \
-             patch.object(cmd.screenshots_dir, 'glob', return_value=[mock_file1]):
-
-            result = cmd.execute(self.context, "screenshot last 5")
+        result = cmd.execute(self.context, "screenshot last 5")
 
-            # Only 1 file available
-            assert result == str(Path("/path/to/screenshot_1.png"))
+        # Only 1 file available
+        assert result == str(cmd.screenshots_dir / "screenshot_1.png")
 
 
 class TestReferenceScreenshotCommandProperties(unittest.TestCase):
@@ -9,16 +9,18 @@ import yaml
 from pynput import keyboard
 
 from src.commands.handlers.window_commands import (
+    KEYEVENTF_KEYUP,
     CenterWindowCommand,
     CloseWindowCommand,
     MaximizeCommand,
     MinimizeCommand,
     MoveWindowCommand,
     SwitchWindowCommand,
+    _send_chord,
 )
 from src.commands.base import CommandContext
 from src.core.config import Config
-from src.core.events import EventBus
+from src.core.events import EventBus, EventType
 
 
 def create_mock_keyboard():
@@ -29,6 +31,36 @@ def create_mock_keyboard():
     return mock
 
 
+class TestSendChord(unittest.TestCase):
+    """Test cases for the _send_chord helper."""
+
+    @patch('src.commands.handlers.window_commands._user32')
+    def test_real_controller_uses_one_send_input(self, mock_user32):
+        """Test the real controller sends the whole chord in one SendInput call."""
+        controller = keyboard.Controller()
+        with patch.object(controller, 'press') as mock_press:
+            _send_chord(controller, (keyboard.Key.alt, keyboard.Key.shift), keyboard.Key.tab)
+
+        mock_press.assert_not_called()
+        mock_user32.SendInput.assert_called_once()
+        count, inputs, _ = mock_user32.SendInput.call_args.args
+        self.assertEqual(count, 6)
+        flags = [item.u.ki.dwFlags & KEYEVENTF_KEYUP for item in inputs]
+        self.assertEqual(flags, [0, 0, 0, KEYEVENTF_KEYUP, KEYEVENTF_KEYUP, KEYEVENTF_KEYUP])
+
+    @patch('src.commands.handlers.window_commands._user32')
+    def test_injected_controller_plays_chord(self, mock_user32):
+        """Test other controllers still see every key through pressed()/press()."""
+        controller = create_mock_keyboard()
+
+        _send_chord(controller, (keyboard.Key.alt,), keyboard.Key.f4)
+
+        mock_user32.SendInput.assert_not_called()
+        controller.pressed.assert_called_once_with(keyboard.Key.alt)
+        controller.press.assert_called_once_with(keyboard.Key.f4)
+        controller.release.assert_called_once_with(keyboard.Key.f4)
+
+
 class TestMoveWindowCommand(unittest.TestCase):
     """Test cases for MoveWindowCommand."""
 
@@ -98,6 +130,31 @@ class TestMoveWindowCommand(unittest.TestCase):
         press_calls = [str(call) for call in self.mock_keyboard.press.call_args_list]
         self.assertTrue(any("Key.right" in call for call in press_calls))
 
+    @patch('time.sleep')
+    @patch('src.commands.handlers.window_commands._user32')
+    def test_move_window_dismisses_snap_assist_when_shown(self, mock_user32, mock_sleep):
+        """Test Escape is sent as soon as Snap Assist shows, without fixed sleeps."""
+        mock_user32.FindWindowW.return_value = 1
+        mock_user32.IsWindowVisible.side_effect = [False, True, False]
+
+        cmd = MoveWindowCommand()
+        cmd.execute(self.context, "move window left")
+
+        self.mock_keyboard.press.assert_called_with(keyboard.Key.esc)
+        self.assertEqual(mock_user32.IsWindowVisible.call_count, 3)
+        # Only the one poll interval before the overlay appeared
+        mock_sleep.assert_called_once()
+
+    @patch('time.sleep')
+    def test_move_window_leaves_event_to_registry(self, mock_sleep):
+        """Test execute() does not publish its own COMMAND_EXECUTED event."""
+        events = []
+        self.event_bus.subscribe(EventType.COMMAND_EXECUTED, events.append)
+
+        MoveWindowCommand().execute(self.context, "move window left")
+
+        self.assertEqual(events, [])
+
     def test_move_window_priority(self):
         """Test move window command priority."""
         cmd = MoveWindowCommand()
@@ -1,9 +1,10 @@
 """Unit tests for CommandParser."""
 
+import re
 import unittest
 from unittest.mock import patch, mock_open
 
-from src.commands.parser import CommandParser
+from src.commands.parser import CommandParser, _fuzzy_ratio
 
 
 class TestCommandParser(unittest.TestCase):
@@ -65,6 +66,15 @@ class TestCommandParser(unittest.TestCase):
         numbers = self.parser.extract_numbers("click here")
         self.assertEqual(numbers, [])
 
+    def test_extract_numbers_reuses_last_result(self):
+        """Test repeated extraction of the same text is served from the cache."""
+        first = self.parser.extract_numbers("5 to 9")
+        first.append(99)
+
+        with patch.object(self.parser, "_extract_numbers") as mock_extract:
+            self.assertEqual(self.parser.extract_numbers("5 to 9"), [5, 9])
+            mock_extract.assert_not_called()
+
     def test_contains_numbers_with_digits(self):
         """Test contains_numbers with digit text."""
         self.assertTrue(self.parser.contains_numbers("click 5"))
@@ -110,6 +120,13 @@ class TestCommandParser(unittest.TestCase):
         self.assertEqual(self.parser.parse_number("ten"), 10)
         self.assertEqual(self.parser.parse_number("for"), 4)  # Homophone
 
+    def test_number_words_any_case(self):
+        """Test number words are recognized regardless of case."""
+        self.assertEqual(self.parser.parse_number("Five"), 5)
+        self.assertTrue(self.parser.is_lone_number("TEN"))
+        self.assertTrue(self.parser.contains_numbers("Click Three"))
+        self.assertEqual(self.parser.extract_numbers("Move Two Left"), [2])
+
     def test_parse_number_invalid(self):
         """Test parse_number with invalid input."""
         self.assertIsNone(self.parser.parse_number("hello"))
@@ -134,6 +151,17 @@ class TestCommandParser(unittest.TestCase):
         result = self.parser.filter_ignored_words("click thank you")
         self.assertEqual(result, "click")
 
+    def test_filter_ignored_words_whole_tokens_only(self):
+        """Test filtering matches whole tokens, case-insensitively."""
+        result = self.parser.filter_ignored_words("Please, open you're   file. Thanks!")
+        self.assertEqual(result, "open you're file.")
+
+    def test_filter_ignored_words_unmatchable_words(self):
+        """Test multi-word and uppercase ignored words never match a token."""
+        parser = CommandParser(ignored_words=["thank you", "Please"])
+        result = parser.filter_ignored_words("thank you please")
+        self.assertEqual(result, "thank you please")
+
     def test_filter_ignored_words_no_ignored(self):
         """Test filtering when no ignored words present."""
         result = self.parser.filter_ignored_words("click five")
@@ -194,6 +222,65 @@ class TestCommandParser(unittest.TestCase):
         result = self.parser.is_fuzzy_match("click", "scroll", threshold=0.8)
         self.assertFalse(result)
 
+    def test_is_fuzzy_match_equal_skips_scoring(self):
+        """Test is_fuzzy_match accepts equal normalized text without scoring."""
+        with patch.object(self.parser, "fuzzy_match") as mock_fuzzy:
+            self.assertTrue(self.parser.is_fuzzy_match("Click 5!", "click 5"))
+        mock_fuzzy.assert_not_called()
+
+    def test_is_fuzzy_match_length_bound(self):
+        """Test is_fuzzy_match rejects pairs whose lengths rule out a match."""
+        with patch.object(self.parser, "fuzzy_match") as mock_fuzzy:
+            self.assertFalse(self.parser.is_fuzzy_match("up", "scroll up fast"))
+        mock_fuzzy.assert_not_called()
+
+    def test_is_fuzzy_match_length_bound_is_exact(self):
+        """Test the length bound never rejects a pair that would match."""
+        words = ["click", "clock", "clicks", "click 5", "lick", "cl", "c", ""]
+        for text1 in words:
+            for text2 in words:
+                for threshold in (0.5, 0.7, 0.8, 0.9):
+                    expected = self.parser.fuzzy_match(text1, text2) >= threshold
+                    self.assertEqual(
+                        self.parser.is_fuzzy_match(text1, text2, threshold),
+                        expected,
+                        (text1, text2, threshold),
+                    )
+
+    def test_fuzzy_match_uses_rapidfuzz(self):
+        """Test fuzzy_match scores with RapidFuzz when it is installed."""
+        _fuzzy_ratio.cache_clear()
+        with patch("src.commands.parser.rapidfuzz") as mock_rapidfuzz:
+            mock_rapidfuzz.fuzz.ratio.return_value = 50.0
+            score = self.parser.fuzzy_match("click", "clock")
+
+        mock_rapidfuzz.fuzz.ratio.assert_called_once_with("click", "clock")
+        self.assertEqual(score, 0.5)
+        _fuzzy_ratio.cache_clear()
+
+    def test_fuzzy_match_memoized(self):
+        """Test repeated fuzzy_match calls on the same pair are not rescored."""
+        _fuzzy_ratio.cache_clear()
+        first = self.parser.fuzzy_match("Scroll Down", "scroll town")
+        second = self.parser.fuzzy_match("scroll down!", "scroll town")
+
+        self.assertEqual(first, second)
+        self.assertEqual(_fuzzy_ratio.cache_info().hits, 1)
+
+    def test_best_fuzzy_match(self):
+        """Test best_fuzzy_match returns the highest scoring candidate."""
+        result = self.parser.best_fuzzy_match(
+            "Clik 5!", ["scroll down", "click 5", "click 6"]
+        )
+        self.assertIsNotNone(result)
+        self.assertEqual(result[0], "click 5")
+        self.assertGreaterEqual(result[1], 0.8)
+
+    def test_best_fuzzy_match_below_threshold(self):
+        """Test best_fuzzy_match returns None when nothing is close enough."""
+        result = self.parser.best_fuzzy_match("click", ["scroll", "zoom"])
+        self.assertIsNone(result)
+
     def test_extract_pattern_found(self):
         """Test extract_pattern when pattern found."""
         match = self.parser.extract_pattern("click 5", r"click (\d+)")
@@ -210,6 +297,13 @@ class TestCommandParser(unittest.TestCase):
         match = self.parser.extract_pattern("CLICK 5", r"click (\d+)")
         self.assertIsNotNone(match)
 
+    def test_extract_pattern_compiled(self):
+        """Test extract_pattern uses a compiled pattern with its own flags."""
+        pattern = re.compile(r"click (\d+)")
+        match = self.parser.extract_pattern("click 5", pattern)
+        self.assertEqual(match.group(1), "5")
+        self.assertIsNone(self.parser.extract_pattern("CLICK 5", pattern))
+
     def test_split_command_and_args_with_args(self):
         """Test split_command_and_args with arguments."""
         command, args = self.parser.split_command_and_args("click 5")
@@ -242,6 +336,35 @@ class TestCommandParser(unittest.TestCase):
             self.assertIn("two", parser.number_mappings)
             self.assertEqual(parser.number_mappings["one"], 1)
 
+    def test_number_mappings_loaded_on_first_use(self):
+        """Test number_mappings.yaml is only read when mappings are needed."""
+        with patch.object(
+            CommandParser, "_load_number_mappings", return_value={"one": 1}
+        ) as mock_load:
+            parser = CommandParser()
+            self.assertEqual(parser.filter_ignored_words("please click"), "click")
+            mock_load.assert_not_called()
+
+            self.assertEqual(parser.extract_numbers("click one"), [1])
+            self.assertEqual(parser.parse_number("one"), 1)
+            mock_load.assert_called_once()
+
+    def test_extract_numbers_after_mappings_replaced(self):
+        """Test number extraction follows a newly assigned mappings dict."""
+        parser = CommandParser(number_mappings={"twenty": 20, "one": 1})
+        self.assertEqual(parser.extract_numbers("twenty one uno"), [21])
+
+        parser.number_mappings = {"uno": 1, "veinte": 20}
+        self.assertEqual(parser.extract_numbers("veinte uno twenty"), [21])
+
+    def test_extract_numbers_same_text_after_mappings_replaced(self):
+        """Test replacing the mappings discards the remembered extraction."""
+        parser = CommandParser(number_mappings={"one": 1})
+        self.assertEqual(parser.extract_numbers("click one"), [1])
+
+        parser.number_mappings = {"one": 11}
+        self.assertEqual(parser.extract_numbers("click one"), [11])
+
     def test_load_number_mappings_exception(self):
         """Test _load_number_mappings handles exceptions."""
         with patch("builtins.open", side_effect=Exception("Test error")):
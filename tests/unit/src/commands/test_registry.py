@@ -47,6 +47,72 @@ class MockCommand(Command):
         return [self.match_text, f"{self.match_text} example"]
 
 
+class IndexedMockCommand(MockCommand):
+    """Mock command that declares the first words it can match."""
+
+    def __init__(self, match_text="test", priority_val=100):
+        super().__init__(match_text, priority_val)
+        self.match_calls = 0
+
+    def matches(self, text: str) -> bool:
+        self.match_calls += 1
+        return super().matches(text)
+
+    @property
+    def first_words(self):
+        return frozenset({Command.first_word(self.match_text)})
+
+
+class PrefixMockCommand(IndexedMockCommand):
+    """Mock command matching any text that starts with its match text."""
+
+    def matches(self, text: str) -> bool:
+        self.match_calls += 1
+        return text.lower().startswith(self.match_text)
+
+    @property
+    def first_words(self):
+        return None
+
+    @property
+    def first_word_prefixes(self):
+        return frozenset({self.match_text})
+
+
+class PhraseMockCommand(IndexedMockCommand):
+    """Mock command matching any text that contains its match text."""
+
+    def matches(self, text: str) -> bool:
+        self.match_calls += 1
+        return self.match_text in self.strip_punctuation(text)
+
+    @property
+    def first_words(self):
+        return None
+
+    @property
+    def trigger_phrases(self):
+        return frozenset({self.match_text})
+
+
+class ExactMockCommand(IndexedMockCommand):
+    """Mock command declaring its match text as its only exact phrase."""
+
+    @property
+    def exact_phrases(self):
+        return frozenset({self.match_text})
+
+
+class StrippingMockCommand(MockCommand):
+    """Mock command that normalizes input like the real handlers."""
+
+    def matches(self, text: str) -> bool:
+        return self.strip_punctuation(text) == self.match_text
+
+    def execute(self, context: CommandContext, text: str) -> str:
+        return self.strip_punctuation(text)
+
+
 class DisabledCommand(Command):
     """Command that is disabled."""
 
@@ -161,6 +227,32 @@ class TestCommandRegistry(unittest.TestCase):
         self.assertEqual(commands[1].priority, 250)
         self.assertEqual(commands[2].priority, 100)
 
+    def test_register_keeps_order_among_equal_priorities(self):
+        """Test equal priorities keep registration order, also after unregister."""
+        cmd1 = MockCommand("first", priority_val=100)
+        cmd2 = MockCommand("high", priority_val=500)
+        cmd3 = MockCommand("second", priority_val=100)
+        cmd4 = MockCommand("third", priority_val=100)
+
+        for cmd in (cmd1, cmd2, cmd3, cmd4):
+            self.registry.register(cmd)
+        self.registry.unregister(cmd3)
+        self.registry.register(MockCommand("higher", priority_val=600))
+        self.registry.register(cmd3)
+
+        self.assertEqual(self.registry.get_commands()[1:], [cmd2, cmd1, cmd4, cmd3])
+
+    def test_register_many(self):
+        """Test batch registration sorts like individual registration."""
+        cmd1 = MockCommand("low", priority_val=100)
+        cmd2 = MockCommand("high", priority_val=500)
+        cmd3 = MockCommand("also low", priority_val=100)
+
+        self.registry.register_many([cmd1, cmd2, cmd3])
+
+        self.assertEqual(self.registry.get_commands(), [cmd2, cmd1, cmd3])
+        self.assertEqual(self.registry.find_matching_command("high"), cmd2)
+
     def test_unregister_command(self):
         """Test unregistering a command."""
         cmd = MockCommand("hello")
@@ -250,6 +342,89 @@ class TestCommandRegistry(unittest.TestCase):
         matched = self.registry.find_matching_command("disabled", enabled_only=False)
         self.assertEqual(matched, disabled_cmd)
 
+    def test_find_matching_command_skips_unindexed_first_word(self):
+        """Test commands with first_words are only asked about their words."""
+        indexed = IndexedMockCommand("delete word")
+        self.registry.register(indexed)
+
+        self.assertIsNone(self.registry.find_matching_command("hello there"))
+        self.assertEqual(indexed.match_calls, 0)
+
+        self.assertEqual(self.registry.find_matching_command("Delete word"), indexed)
+        self.assertEqual(indexed.match_calls, 1)
+
+    def test_find_matching_command_index_keeps_priority_order(self):
+        """Test indexed and catch-all commands are still checked by priority."""
+        indexed_low = IndexedMockCommand("delete", priority_val=100)
+        catch_all_high = MockCommand("delete", priority_val=500)
+        self.registry.register(indexed_low)
+        self.registry.register(catch_all_high)
+
+        self.assertEqual(self.registry.find_matching_command("delete"), catch_all_high)
+
+        self.registry.unregister(catch_all_high)
+        self.assertEqual(self.registry.find_matching_command("delete"), indexed_low)
+
+    def test_find_matching_command_first_word_prefixes(self):
+        """Test prefix-indexed commands are only checked for matching first words."""
+        scroll = PrefixMockCommand("scroll")
+        self.registry.register(scroll)
+
+        self.assertEqual(self.registry.find_matching_command("scrolling up"), scroll)
+        self.assertEqual(self.registry.find_matching_command("scroll"), scroll)
+        self.assertEqual(scroll.match_calls, 2)
+
+        self.assertIsNone(self.registry.find_matching_command("please scroll up"))
+        self.assertEqual(scroll.match_calls, 2)
+
+    def test_find_matching_command_trigger_phrases(self):
+        """Test phrase-gated commands are only checked when a trigger phrase is present."""
+        close = PhraseMockCommand("close window")
+        self.registry.register(close)
+
+        self.assertEqual(self.registry.find_matching_command("please close window"), close)
+        self.assertEqual(self.registry.find_matching_command("Close window!"), close)
+        self.assertEqual(close.match_calls, 2)
+
+        self.assertIsNone(self.registry.find_matching_command("close the door"))
+        self.assertEqual(close.match_calls, 2)
+
+    def test_find_matching_command_exact_phrases(self):
+        """Test exact-phrase commands are only checked for their own phrases."""
+        grid = ExactMockCommand("grid", priority_val=100)
+        catch_all_high = MockCommand("grid", priority_val=300)
+        self.registry.register(grid)
+
+        self.assertEqual(self.registry.find_matching_command("GRID"), grid)
+        self.assertIsNone(self.registry.find_matching_command("grid lines"))
+        self.assertEqual(grid.match_calls, 1)
+
+        # Priority order still holds for exact phrases
+        self.registry.register(catch_all_high)
+        self.assertEqual(self.registry.find_matching_command("grid"), catch_all_high)
+
+    def test_process_normalizes_text_once(self):
+        """Test every matches() and execute() reuse one strip_punctuation result."""
+        for word in ("one", "two", "three"):
+            self.registry.register(StrippingMockCommand(word))
+        Command.strip_punctuation.cache_clear()
+
+        result, executed = self.registry.process("Three!", self.context)
+
+        self.assertTrue(executed)
+        self.assertEqual(result, "three")
+        self.assertEqual(Command.strip_punctuation.cache_info().misses, 1)
+
+    def test_process_does_not_mutate_context(self):
+        """Test dispatch leaves the shared context untouched."""
+        cmd = StrippingMockCommand("hello")
+        self.registry.register(cmd)
+        before = dict(vars(self.context))
+
+        self.registry.process("Hello!", self.context)
+
+        self.assertEqual(vars(self.context), before)
+
     def test_process_successful_command(self):
         """Test processing text with successful command execution."""
         cmd = MockCommand("hello")
@@ -334,6 +509,7 @@ class TestCommandRegistry(unittest.TestCase):
         self.assertEqual(events_received[0].event_type, EventType.COMMAND_EXECUTED)
         self.assertEqual(events_received[0].data["text"], "hello")
         self.assertEqual(events_received[0].data["result"], "Result: hello")
+        self.assertIsNone(events_received[0].data["display_name"])
 
     def test_process_publishes_command_failed_event_on_validation_failure(self):
         """Test that processing publishes COMMAND_FAILED event on validation failure."""
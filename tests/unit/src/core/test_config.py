@@ -3,10 +3,16 @@
 import os
 import tempfile
 import unittest
+from unittest.mock import patch
 
 import yaml
 
-from src.core.config import Config
+from src.core.config import (
+    YAML_CACHE_SUFFIX,
+    Config,
+    ConfigLoader,
+    load_yaml_cached,
+)
 
 
 class TestConfig(unittest.TestCase):
@@ -71,5 +77,111 @@ class TestConfig(unittest.TestCase):
         self.assertGreater(len(push_to_talk), 0)
 
 
+    def test_config_get_after_reassignment(self):
+        """Test get() reflects a newly assigned config dictionary."""
+        config = Config(self._missing_path(), setup_logging=False)
+        self.assertEqual(config.get("audio", "sample_rate"), 16000)
+
+        config.config = {"audio": {"sample_rate": 8000, "muted": None}}
+
+        self.assertEqual(config.get("audio"), {"sample_rate": 8000, "muted": None})
+        self.assertEqual(config.get("audio", "sample_rate"), 8000)
+        self.assertEqual(config.get("audio", "muted", default=False), False)
+        self.assertEqual(config.get("audio", "sample_rate", "x", default=1), 1)
+        self.assertEqual(config.get("model", "name", default="base"), "base")
+
+    def _missing_path(self):
+        """Return a path to a config file that does not exist."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        return os.path.join(tmpdir.name, "missing.yaml")
+
+
+class TestConfigLoaderCache(unittest.TestCase):
+    """Test cases for ConfigLoader's in-process cache."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "config.yaml")
+        with open(self.path, "w", encoding="utf-8") as f:
+            yaml.dump({"audio": {"sample_rate": 16000}}, f)
+
+    def test_repeated_load_skips_yaml(self):
+        """Test that an unchanged file is not parsed twice."""
+        ConfigLoader.load_from_file(self.path)
+
+        with patch("src.core.config.yaml.load") as mock_load:
+            config = ConfigLoader.load_from_file(self.path)
+
+        mock_load.assert_not_called()
+        self.assertEqual(config, {"audio": {"sample_rate": 16000}})
+
+    def test_cached_config_is_copied(self):
+        """Test that mutating a returned config leaves the cache intact."""
+        config = ConfigLoader.load_from_file(self.path)
+        config["audio"]["sample_rate"] = 44100
+
+        self.assertEqual(
+            ConfigLoader.load_from_file(self.path),
+            {"audio": {"sample_rate": 16000}},
+        )
+
+    def test_changed_file_is_reloaded(self):
+        """Test that editing the file invalidates its cache entry."""
+        ConfigLoader.load_from_file(self.path)
+        with open(self.path, "w", encoding="utf-8") as f:
+            yaml.dump({"audio": {"sample_rate": 8000, "channels": 2}}, f)
+
+        self.assertEqual(
+            ConfigLoader.load_from_file(self.path),
+            {"audio": {"sample_rate": 8000, "channels": 2}},
+        )
+
+
+class TestLoadYamlCached(unittest.TestCase):
+    """Test cases for load_yaml_cached."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "data.yaml")
+        with open(self.path, "w", encoding="utf-8") as f:
+            yaml.dump({"number_words": {"one": 1, "two": 2}}, f)
+
+    def test_first_load_writes_sidecar(self):
+        """Test that the first load parses the YAML and writes the cache."""
+        data = load_yaml_cached(self.path)
+
+        self.assertEqual(data, {"number_words": {"one": 1, "two": 2}})
+        self.assertTrue(os.path.exists(self.path + YAML_CACHE_SUFFIX))
+
+    def test_second_load_skips_yaml(self):
+        """Test that a fresh cache is used without parsing the YAML."""
+        load_yaml_cached(self.path)
+
+        with patch("src.core.config.yaml.load") as mock_load:
+            data = load_yaml_cached(self.path)
+
+        mock_load.assert_not_called()
+        self.assertEqual(data, {"number_words": {"one": 1, "two": 2}})
+
+    def test_changed_file_invalidates_cache(self):
+        """Test that editing the YAML file bypasses the stale cache."""
+        load_yaml_cached(self.path)
+        with open(self.path, "w", encoding="utf-8") as f:
+            yaml.dump({"number_words": {"three": 3}}, f)
+
+        self.assertEqual(load_yaml_cached(self.path), {"number_words": {"three": 3}})
+
+    def test_non_json_data_not_cached(self):
+        """Test that data JSON cannot round-trip is not cached."""
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("1: one\n")
+
+        self.assertEqual(load_yaml_cached(self.path), {1: "one"})
+        self.assertFalse(os.path.exists(self.path + YAML_CACHE_SUFFIX))
+
+
 if __name__ == '__main__':
     unittest.main()
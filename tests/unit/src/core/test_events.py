@@ -1,5 +1,6 @@
 """Unit tests for the Event system."""
 
+import threading
 import unittest
 
 from src.core.events import Event, EventBus, EventType, get_event_bus, reset_event_bus
@@ -54,6 +55,33 @@ class TestEventBus(unittest.TestCase):
         self.assertEqual(self.events_received[0].event_type, EventType.RECORDING_STARTED)
         self.assertEqual(self.events_received[0].data["test"], "data")
 
+    def test_publish_lazy(self):
+        """Test publish_lazy builds data only when there are subscribers."""
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return {"test": "data"}
+
+        self.bus.publish_lazy(EventType.RECORDING_STARTED, factory)
+        self.assertEqual(calls, [])
+
+        self.bus.subscribe(EventType.RECORDING_STARTED, self.events_received.append)
+        self.bus.publish_lazy(EventType.RECORDING_STARTED, factory)
+
+        self.assertEqual(calls, [1])
+        self.assertEqual(self.events_received[0].data, {"test": "data"})
+
+    def test_has_subscribers(self):
+        """Test has_subscribers reflects subscribe and unsubscribe."""
+        self.assertFalse(self.bus.has_subscribers(EventType.AUDIO_CHUNK_RECEIVED))
+
+        self.bus.subscribe(EventType.AUDIO_CHUNK_RECEIVED, self.events_received.append)
+        self.assertTrue(self.bus.has_subscribers(EventType.AUDIO_CHUNK_RECEIVED))
+
+        self.bus.unsubscribe(EventType.AUDIO_CHUNK_RECEIVED, self.events_received.append)
+        self.assertFalse(self.bus.has_subscribers(EventType.AUDIO_CHUNK_RECEIVED))
+
     def test_multiple_subscribers(self):
         """Test multiple subscribers to the same event."""
         received_1 = []
@@ -99,6 +127,32 @@ class TestEventBus(unittest.TestCase):
         self.bus.publish(Event(EventType.OVERLAY_SHOWN))
         self.assertEqual(len(self.events_received), 1)  # Should only be called once
 
+    def test_unsubscribe_during_publish(self):
+        """Test a callback unsubscribing itself doesn't skip later callbacks."""
+        def one_shot(event):
+            self.bus.unsubscribe(EventType.OVERLAY_HIDDEN, one_shot)
+
+        self.bus.subscribe(EventType.OVERLAY_HIDDEN, one_shot)
+        self.bus.subscribe(EventType.OVERLAY_HIDDEN, self.events_received.append)
+
+        self.bus.publish(Event(EventType.OVERLAY_HIDDEN))
+        self.assertEqual(len(self.events_received), 1)
+        self.assertEqual(self.bus.get_subscriber_count(EventType.OVERLAY_HIDDEN), 1)
+
+    def test_concurrent_subscribe(self):
+        """Test subscribes from several threads are not lost."""
+        def subscribe_many():
+            for _ in range(200):
+                self.bus.subscribe(EventType.OVERLAY_SHOWN, lambda event: None)
+
+        threads = [threading.Thread(target=subscribe_many) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.bus.get_subscriber_count(EventType.OVERLAY_SHOWN), 1600)
+
     def test_different_event_types(self):
         """Test that subscribers only receive their subscribed event types."""
         def callback(event):
@@ -132,6 +132,44 @@ class TestOverlayManagerRegistration:
         assert overlay.is_visible is False
         assert overlay.hide_called is True
 
+    def test_register_overlay_factory_builds_on_first_show(self):
+        """Test a factory-registered overlay is built once, on first show."""
+        manager = OverlayManager()
+        overlay = MockOverlay(OverlayType.HELP)
+        factory = Mock(return_value=overlay)
+
+        manager.register_overlay_factory(OverlayType.HELP, factory)
+        factory.assert_not_called()
+        assert manager.is_overlay_visible(OverlayType.HELP) is False
+
+        assert manager.show_overlay(OverlayType.HELP) is True
+        assert manager.show_overlay(OverlayType.HELP) is True
+
+        factory.assert_called_once_with()
+        assert manager._overlays[OverlayType.HELP] is overlay
+        assert overlay.is_visible is True
+
+    def test_overlay_factory_failure(self):
+        """Test a failing factory is reported and can be retried."""
+        manager = OverlayManager()
+        factory = Mock(side_effect=[RuntimeError("no display"), MockOverlay()])
+
+        manager.register_overlay_factory(OverlayType.GRID, factory)
+
+        assert manager.show_overlay(OverlayType.GRID) is False
+        assert manager.show_overlay(OverlayType.GRID) is True
+
+    def test_unregister_overlay_factory(self):
+        """Test unregistering an overlay that was never built."""
+        manager = OverlayManager()
+        factory = Mock()
+
+        manager.register_overlay_factory(OverlayType.GRID, factory)
+
+        assert manager.unregister_overlay(OverlayType.GRID) is True
+        assert manager.show_overlay(OverlayType.GRID) is False
+        factory.assert_not_called()
+
 
 class TestOverlayManagerShow:
     """Test showing overlays."""
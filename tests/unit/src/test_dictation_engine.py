@@ -3,7 +3,12 @@
 import unittest
 from unittest.mock import MagicMock, Mock, patch
 
-from src.dictation_engine import DictationEngine
+from src.commands.base import CommandContext
+from src.commands.handlers.mouse_commands import ClickFamilyCommand
+from src.commands.registry import CommandRegistry
+from src.core.events import Event, EventBus, EventType
+from src.dictation_engine import DictationEngine, _get_screen_size
+from src.overlays.base import OverlayType
 
 
 class TestDictationEngine(unittest.TestCase):
@@ -145,24 +150,161 @@ class TestDictationEngine(unittest.TestCase):
         self.assertTrue(self.engine.has_speech())
 
     def test_get_audio_duration_empty(self):
-        """Test get_audio_duration with no audio frames."""
-        self.engine.audio_frames = []
+        """Test get_audio_duration with no audio captured."""
+        self.engine.audio_buffer = bytearray()
         self.assertEqual(self.engine.get_audio_duration(), 0.0)
 
     def test_get_audio_duration_with_frames(self):
-        """Test get_audio_duration with audio frames."""
-        # Create mock audio frames
+        """Test get_audio_duration with captured audio."""
+        # Create mock audio
         # Assuming 16000 Hz, 1 channel, 16-bit (2 bytes per sample)
         # 1 second of audio = 16000 samples = 32000 bytes
         self.engine.sample_rate = 16000
         self.engine.channels = 1
-        self.engine.audio_frames = [b'\x00' * 16000, b'\x00' * 16000]  # 2 chunks of 8000 samples each
+        self.engine.audio_buffer = bytearray(b'\x00' * 32000)  # 16000 samples
 
         # Total bytes = 32000, bytes_per_second = 16000 * 1 * 2 = 32000
         # Duration should be 32000 / 32000 = 1.0 second
         duration = self.engine.get_audio_duration()
         self.assertEqual(duration, 1.0)
 
+    def test_audio_callback_only_stores_chunk(self):
+        """Test the realtime audio callback stores chunks without publishing."""
+        self.engine.is_recording = True
+        self.engine.audio_buffer = bytearray()
+
+        self.engine._audio_callback(b'\x00' * 64, 32, None, None)
+        self.engine._audio_callback(b'\x01' * 64, 32, None, None)
+
+        self.assertEqual(self.engine.audio_buffer, b'\x00' * 64 + b'\x01' * 64)
+        published = [c.args[0].event_type for c in self.mock_event_bus.publish.call_args_list]
+        self.assertNotIn(EventType.AUDIO_CHUNK_RECEIVED, published)
+
+
+    def test_submit_transcription_processes_in_order(self):
+        """Test queued utterances are transcribed and processed in order."""
+        self.engine.transcribe_audio = Mock(side_effect=["first", "second"])
+        self.engine.process_text = Mock()
+
+        self.assertTrue(self.engine.submit_transcription(b'\x00' * 64))
+        self.assertTrue(self.engine.submit_transcription(b'\x01' * 64))
+        self.engine._transcription_queue.join()
+
+        self.assertEqual(
+            [c.args[0] for c in self.engine.process_text.call_args_list], ["first", "second"]
+        )
+
+    def test_submit_transcription_drops_when_full(self):
+        """Test audio is dropped rather than blocking when the queue is full."""
+        with patch.object(self.engine, '_start_transcription_thread'):
+            for _ in range(self.engine._transcription_queue.maxsize):
+                self.assertTrue(self.engine.submit_transcription(b'\x00'))
+            self.assertFalse(self.engine.submit_transcription(b'\x00'))
+
+    def test_transcribe_audio_skips_silence(self):
+        """Test silent recordings never reach Whisper but still complete."""
+        self.engine.model = Mock()
+        self.engine.min_rms = 200
+
+        self.assertEqual(self.engine.transcribe_audio(b'\x00' * 32000), "")
+        self.engine.model.transcribe.assert_not_called()
+
+        event = self.mock_event_bus.publish.call_args.args[0]
+        self.assertEqual(event.event_type, EventType.TRANSCRIPTION_COMPLETED)
+        self.assertEqual(event.data["text"], "")
+
+    @patch('src.dictation_engine.WhisperModel')
+    @patch('src.dictation_engine.pyaudio.PyAudio')
+    def test_transcribe_audio_min_rms_from_config(self, mock_pyaudio, mock_whisper):
+        """Test the silence floor is read from config and quiet speech passes it."""
+        mock_config = Mock()
+        mock_config.get.side_effect = (
+            lambda *keys, default=None: 100 if keys == ("audio", "min_rms") else default
+        )
+
+        engine = DictationEngine(
+            config=mock_config,
+            event_bus=Mock(),
+            command_registry=Mock(),
+            text_processor=Mock(),
+            parser=Mock()
+        )
+        self.assertEqual(engine.min_rms, 100)
+
+        engine.model = Mock()
+        engine.model.transcribe.return_value = (iter([]), Mock())
+        quiet = b'\x96\x00' * 16000  # amplitude 150
+        engine.transcribe_audio(quiet)
+        engine.model.transcribe.assert_called_once()
+
+    def test_undo_last_taps_backspace_per_character(self):
+        """Test undo_last sends one backspace tap per typed character."""
+        self.engine.keyboard_controller = Mock()
+        self.engine.text_processor.get_last_text_length.return_value = 3
+
+        self.engine._handle_text_processor_command("undo_last")
+
+        self.assertEqual(self.engine.keyboard_controller.tap.call_count, 3)
+        self.engine.keyboard_controller.press.assert_not_called()
+
+    def test_transcribe_audio_publishes_partial_segments(self):
+        """Test each decoded segment is published before the full text."""
+        bus = EventBus()
+        partials = []
+        bus.subscribe(EventType.TRANSCRIPTION_PARTIAL, partials.append)
+        self.engine.event_bus = bus
+        self.engine.model = Mock()
+        segments = [Mock(text=" click", start=0.0, end=0.4), Mock(text="five", start=0.4, end=0.8)]
+        self.engine.model.transcribe.return_value = (iter(segments), Mock())
+
+        loud = b'\x00\x40' * 16000
+        self.assertEqual(self.engine.transcribe_audio(loud), "click five")
+        self.assertEqual([e.data["text"] for e in partials], ["click", "five"])
+
+    @patch('src.dictation_engine._windll')
+    @patch('src.dictation_engine._screen_size', None)
+    def test_screen_size_queried_once(self, mock_windll):
+        """Test the screen size is read from the platform only on first use."""
+        mock_windll.user32.GetSystemMetrics.side_effect = [2560, 1440]
+
+        self.assertEqual(_get_screen_size(), (2560, 1440))
+        self.assertEqual(_get_screen_size(), (2560, 1440))
+        self.assertEqual(mock_windll.user32.GetSystemMetrics.call_count, 2)
+
+    def test_command_feedback_after_registry_dispatch(self):
+        """Test the feedback label names the command the registry executed."""
+        bus = EventBus()
+        bus.subscribe(EventType.COMMAND_EXECUTED, self.engine._on_command_executed_feedback)
+        self.engine.overlay_manager = Mock()
+        registry = CommandRegistry(event_bus=bus)
+        registry.register(ClickFamilyCommand())
+        context = CommandContext(
+            config=self.mock_config,
+            keyboard_controller=Mock(),
+            mouse_controller=Mock(),
+            event_bus=bus,
+        )
+
+        self.assertEqual(registry.process("right click", context), (None, True))
+
+        self.engine.overlay_manager.show_overlay.assert_called_once_with(
+            OverlayType.FEEDBACK, text="Right Click"
+        )
+
+    def test_command_feedback_display_name(self):
+        """Test command feedback spaces out the class name and skips overlays."""
+        self.engine.overlay_manager = Mock()
+
+        self.engine._on_command_executed_feedback(
+            Event(EventType.COMMAND_EXECUTED, {"command_class": "ClickNumberCommand"})
+        )
+        self.engine._on_command_executed_feedback(
+            Event(EventType.COMMAND_EXECUTED, {"command_class": "ShowGridCommand"})
+        )
+
+        self.engine.overlay_manager.show_overlay.assert_called_once_with(
+            OverlayType.FEEDBACK, text="Click Number"
+        )
 
 if __name__ == '__main__':
     unittest.main()